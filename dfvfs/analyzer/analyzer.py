@@ -1,73 +1,248 @@
 # -*- coding: utf-8 -*-
 """The format analyzer."""
 
+import os
+
 import pysigscan
 
 from dfvfs import dependencies
 from dfvfs.analyzer import specification
 from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import worker_pool
 from dfvfs.resolver import resolver
 
 
 dependencies.CheckModuleVersion(u'pysigscan')
 
 
-class Analyzer(object):
-  """Class that implements the format analyzer."""
+def _GetWorkerScanConfiguration(format_categories, bounded_scan):
+  """Retrieves the scan configuration of a worker of the batch analysis.
+
+  Every worker uses its own signature scanners, since the scan state of
+  a signature scanner cannot be shared between threads or processes.
+
+  Args:
+    format_categories (list[str]): format categories.
+    bounded_scan (bool): True if only the header and footer ranges of
+        the data should be scanned for signatures.
+
+  Returns:
+    _ScanConfiguration: scan configuration.
+  """
+  # pylint: disable=protected-access
+  return Analyzer._GetScanConfiguration(
+      format_categories, bounded_scan, new_signature_scanners=True)
+
+
+def _AnalyzePathSpec(
+    path_spec, resolver_context=None, scan_configuration=None):
+  """Determines if a file contains supported format types.
+
+  Args:
+    path_spec (PathSpec): path specification.
+    resolver_context (Optional[Context]): resolver context, where None
+        represents the resolver context of the worker.
+    scan_configuration (Optional[_ScanConfiguration]): scan configuration,
+        where None represents the scan configuration of the worker.
+
+  Returns:
+    tuple[PathSpec, dict[str, list[str]]]: path specification and supported
+        format type indicators per format category or None if the file
+        could not be analyzed.
+  """
+  if scan_configuration is None:
+    resolver_context = worker_pool.GetWorkerResolverContext()
+    scan_configuration = worker_pool.GetWorkerData()
+
+  try:
+    # pylint: disable=protected-access
+    type_indicators = Analyzer._ScanPathSpec(
+        scan_configuration, path_spec, resolver_context=resolver_context)
+  except (IOError, OSError, RuntimeError, errors.Error):
+    type_indicators = None
+
+  return path_spec, type_indicators
+
+
+class _ScanConfiguration(object):
+  """Class that defines a scan configuration.
+
+  Attributes:
+    bounded_scan (bool): True if only the header and footer ranges of
+        the data should be scanned for signatures.
+    footer_size (int): size of the range at the end of the data to scan.
+    header_size (int): size of the range at the start of the data to scan.
+    signature_scanners (list[tuple[str, pysigscan.scanner,
+        FormatSpecificationStore, list[AnalyzerHelper]]]): format category,
+        signature scanner, format specification store and remaining analyzer
+        helpers that do not have a format specification, per format category.
+  """
+
+  def __init__(self, bounded_scan):
+    """Initializes the scan configuration.
 
-  _SCAN_BUFFER_SIZE = 33 * 1024
+    Args:
+      bounded_scan (bool): True if only the header and footer ranges of
+          the data should be scanned for signatures.
+    """
+    super(_ScanConfiguration, self).__init__()
+    self.bounded_scan = bounded_scan
+    self.footer_size = 0
+    self.header_size = 0
+    self.signature_scanners = []
 
-  _analyzer_helpers = {}
 
-  # The archive format category analyzer helpers that do not have
-  # a format specification.
-  _archive_remainder_list = None
+class _ScanDataFileObject(object):
+  """Class that implements a file-like object that buffers scan data.
+
+  The data of the header and footer ranges scanned by the signature scanners
+  is read once and buffered, hence the signature scanners of multiple format
+  categories and the analyzer helpers that do not have a format specification
+  can read the same file-like object without reading its data again.
+  """
+
+  def __init__(self, file_object, header_size, footer_size):
+    """Initializes the file-like object.
+
+    Args:
+      file_object (FileIO): file-like object.
+      header_size (int): size of the range at the start of the data to buffer.
+      footer_size (int): size of the range at the end of the data to buffer.
+    """
+    super(_ScanDataFileObject, self).__init__()
+    self._buffers = []
+    self._current_offset = 0
+    self._file_object = file_object
+    self._size = file_object.get_size()
+
+    header_size = min(header_size, self._size)
+    footer_offset = max(self._size - footer_size, header_size)
+
+    for buffer_offset, buffer_size in (
+        (0, header_size), (footer_offset, self._size - footer_offset)):
+      if buffer_size > 0:
+        file_object.seek(buffer_offset, os.SEEK_SET)
+        self._buffers.append((buffer_offset, file_object.read(buffer_size)))
+
+  def GetBufferedRanges(self):
+    """Retrieves the buffered ranges.
+
+    Returns:
+      list[tuple[bytes, bool, bool]]: data of the range and values to
+          indicate the range starts at the start of the data and ends at
+          the end of the data. If the header and footer ranges are adjacent
+          they are returned as one range.
+    """
+    if not self._buffers:
+      return []
+
+    _, header_data = self._buffers[0]
+    if len(self._buffers) == 1:
+      return [(header_data, True, len(header_data) == self._size)]
+
+    footer_offset, footer_data = self._buffers[1]
+    if footer_offset == len(header_data):
+      return [(b''.join([header_data, footer_data]), True, True)]
+
+    return [(header_data, True, False), (footer_data, False, True)]
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object.
+    """
+    return self._size
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Data outside the buffered ranges is read from the file-like object.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if size is None or self._current_offset + size > self._size:
+      size = max(self._size - self._current_offset, 0)
+
+    data = None
+    for buffer_offset, buffer_data in self._buffers:
+      relative_offset = self._current_offset - buffer_offset
+      if 0 <= relative_offset and relative_offset + size <= len(buffer_data):
+        data = buffer_data[relative_offset:relative_offset + size]
+        break
+
+    if data is None:
+      self._file_object.seek(self._current_offset, os.SEEK_SET)
+      data = self._file_object.read(size)
+
+    self._current_offset += len(data)
+    return data
 
-  # The archive format category signature scanner.
-  _archive_scanner = None
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
 
-  # The archive format category specification store.
-  _archive_store = None
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
 
-  # The compressed stream format category analyzer helpers that do not have
-  # a format specification.
-  _compressed_stream_remainder_list = None
+    Raises:
+      IOError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError(u'Unsupported whence.')
 
-  # The compressed stream format category signature scanner.
-  _compressed_stream_scanner = None
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
 
-  # The compressed stream format category specification store.
-  _compressed_stream_store = None
+    self._current_offset = offset
 
-  # The file system format category analyzer helpers that do not have
-  # a format specification.
-  _file_system_remainder_list = None
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
 
-  # The file system format category signature scanner.
-  _file_system_scanner = None
 
-  # The file system format category specification store.
-  _file_system_store = None
+class Analyzer(object):
+  """Class that implements the format analyzer."""
 
-  # The storage media image format category analyzer helpers that do not have
-  # a format specification.
-  _storage_media_image_remainder_list = None
+  _SCAN_BUFFER_SIZE = 33 * 1024
 
-  # The storage media image format category signature scanner.
-  _storage_media_image_scanner = None
+  # The number of path specifications handed to a worker at once.
+  _TASKS_CHUNK_SIZE = 16
 
-  # The storage media image format category specification store.
-  _storage_media_image_store = None
+  _analyzer_helpers = {}
 
-  # The volume system format category analyzer helpers that do not have
-  # a format specification.
-  _volume_system_remainder_list = None
+  # The format category analyzer helpers that do not have a format
+  # specification, per format category.
+  _remainder_lists = {}
 
-  # The volume system format category signature scanner.
-  _volume_system_scanner = None
+  # The format category signature scanners, per format category.
+  _signature_scanners = {}
 
-  # The volume system format category specification store.
-  _volume_system_store = None
+  # The format category specification stores, per format category.
+  _specification_stores = {}
 
   @classmethod
   def _FlushCache(cls, format_categories):
@@ -76,30 +251,86 @@ class Analyzer(object):
     Args:
       format_categories (list[str]): format categories.
     """
-    if definitions.FORMAT_CATEGORY_ARCHIVE in format_categories:
-      cls._archive_remainder_list = None
-      cls._archive_scanner = None
-      cls._archive_store = None
-
-    if definitions.FORMAT_CATEGORY_COMPRESSED_STREAM in format_categories:
-      cls._compressed_stream_remainder_list = None
-      cls._compressed_stream_scanner = None
-      cls._compressed_stream_store = None
-
-    if definitions.FORMAT_CATEGORY_FILE_SYSTEM in format_categories:
-      cls._file_system_remainder_list = None
-      cls._file_system_scanner = None
-      cls._file_system_store = None
-
-    if definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE in format_categories:
-      cls._storage_media_image_remainder_list = None
-      cls._storage_media_image_scanner = None
-      cls._storage_media_image_store = None
-
-    if definitions.FORMAT_CATEGORY_VOLUME_SYSTEM in format_categories:
-      cls._volume_system_remainder_list = None
-      cls._volume_system_scanner = None
-      cls._volume_system_store = None
+    for format_category in format_categories:
+      cls._remainder_lists.pop(format_category, None)
+      cls._signature_scanners.pop(format_category, None)
+      cls._specification_stores.pop(format_category, None)
+
+  @classmethod
+  def _GetCategorySignatureScanner(cls, format_category):
+    """Retrieves the signature scanner for specified format category.
+
+    Args:
+      format_category (str): format category.
+
+    Returns:
+      tuple[pysigscan.scanner,FormatSpecificationStore,list[AnalyserHelper]]:
+          a signature scanner, a format specification store and remaining
+          analyzer helpers that do not have a format specification.
+    """
+    if (format_category not in cls._remainder_lists or
+        format_category not in cls._specification_stores):
+      specification_store, remainder_list = cls._GetSpecificationStore(
+          format_category)
+      cls._remainder_lists[format_category] = remainder_list
+      cls._specification_stores[format_category] = specification_store
+
+    if format_category not in cls._signature_scanners:
+      cls._signature_scanners[format_category] = cls._GetSignatureScanner(
+          cls._specification_stores[format_category])
+
+    return (
+        cls._signature_scanners[format_category],
+        cls._specification_stores[format_category],
+        cls._remainder_lists[format_category])
+
+  @classmethod
+  def _GetScanConfiguration(
+      cls, format_categories, bounded_scan, new_signature_scanners=False):
+    """Retrieves the scan configuration for specified format categories.
+
+    Args:
+      format_categories (list[str]): format categories.
+      bounded_scan (bool): True if only the header and footer ranges of
+          the data should be scanned for signatures.
+      new_signature_scanners (Optional[bool]): True if new signature scanners
+          should be created instead of using the cached signature scanners.
+
+    Returns:
+      _ScanConfiguration: scan configuration.
+    """
+    scan_configuration = _ScanConfiguration(bounded_scan)
+
+    for format_category in format_categories:
+      signature_scanner, specification_store, remainder_list = (
+          cls._GetCategorySignatureScanner(format_category))
+
+      if new_signature_scanners:
+        signature_scanner = cls._GetSignatureScanner(specification_store)
+
+      scan_configuration.signature_scanners.append((
+          format_category, signature_scanner, specification_store,
+          remainder_list))
+
+      for format_specification in specification_store.specifications:
+        for signature in format_specification.signatures:
+          if signature.offset is None:
+            if bounded_scan:
+              scan_configuration.header_size = max(
+                  scan_configuration.header_size, cls._SCAN_BUFFER_SIZE)
+              scan_configuration.footer_size = max(
+                  scan_configuration.footer_size, cls._SCAN_BUFFER_SIZE)
+
+          elif signature.offset < 0:
+            scan_configuration.footer_size = max(
+                scan_configuration.footer_size, -signature.offset)
+
+          else:
+            scan_configuration.header_size = max(
+                scan_configuration.header_size,
+                signature.offset + len(signature.pattern))
+
+    return scan_configuration
 
   @classmethod
   def _GetSignatureScanner(cls, specification_store):
@@ -119,6 +350,7 @@ class Analyzer(object):
         pattern_offset = signature.offset
 
         if pattern_offset is None:
+          pattern_offset = 0
           signature_flags = pysigscan.signature_flags.NO_OFFSET
         elif pattern_offset < 0:
           pattern_offset *= -1
@@ -163,48 +395,136 @@ class Analyzer(object):
 
   @classmethod
   def _GetTypeIndicators(
-      cls, signature_scanner, specification_store, remainder_list, path_spec,
+      cls, format_category, path_spec, bounded_scan=False,
       resolver_context=None):
     """Determines if a file contains a supported format types.
 
+    Args:
+      format_category (str): format category.
+      path_spec (PathSpec): path specification.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe.
+
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    type_indicators = cls.GetTypeIndicators(
+        path_spec, [format_category], bounded_scan=bounded_scan,
+        resolver_context=resolver_context)
+    return type_indicators[format_category]
+
+  @classmethod
+  def _ScanFileObject(
+      cls, signature_scanner, specification_store, remainder_list,
+      scan_data_file_object, bounded_scan=False):
+    """Determines if a file-like object contains a supported format types.
+
     Args:
       signature_scanner (pysigscan.scanner): signature scanner.
       specification_store (FormatSpecificationStore): specification store.
       remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that
           do not have a format specification.
+      scan_data_file_object (_ScanDataFileObject): file-like object that
+          buffers the scan data.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
+
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    type_indicator_list = []
+
+    if not bounded_scan:
+      scan_state = pysigscan.scan_state()
+      signature_scanner.scan_file_object(scan_state, scan_data_file_object)
+      scan_results = [
+          (scan_result.identifier, True, True)
+          for scan_result in iter(scan_state.scan_results)]
+
+    else:
+      # The header and footer ranges are scanned separately, since
+      # a signature without an offset could otherwise match the data
+      # where the ranges are joined.
+      scan_results = []
+      for scan_data, at_start, at_end in (
+          scan_data_file_object.GetBufferedRanges()):
+        scan_state = pysigscan.scan_state()
+        scan_state.set_data_size(len(scan_data))
+        signature_scanner.scan_start(scan_state)
+        signature_scanner.scan_buffer(scan_state, scan_data)
+        signature_scanner.scan_stop(scan_state)
+
+        scan_results.extend([
+            (scan_result.identifier, at_start, at_end)
+            for scan_result in iter(scan_state.scan_results)])
+
+    for signature_identifier, at_start, at_end in scan_results:
+      format_specification = specification_store.GetSpecificationBySignature(
+          signature_identifier)
+
+      # A signature with an offset only matches the range that starts at
+      # the start or ends at the end of the data.
+      if not at_start or not at_end:
+        signature_offset = None
+        for signature in format_specification.signatures:
+          if signature.identifier == signature_identifier:
+            signature_offset = signature.offset
+            break
+
+        if signature_offset is not None and (
+            (signature_offset >= 0 and not at_start) or
+            (signature_offset < 0 and not at_end)):
+          continue
+
+      if format_specification.identifier not in type_indicator_list:
+        type_indicator_list.append(format_specification.identifier)
+
+    for analyzer_helper in remainder_list:
+      scan_data_file_object.seek(0, os.SEEK_SET)
+      result = analyzer_helper.AnalyzeFileObject(scan_data_file_object)
+
+      if result is not None:
+        type_indicator_list.append(result)
+
+    return type_indicator_list
+
+  @classmethod
+  def _ScanPathSpec(cls, scan_configuration, path_spec, resolver_context=None):
+    """Determines if a file contains supported format types.
+
+    Args:
+      scan_configuration (_ScanConfiguration): scan configuration.
       path_spec (PathSpec): path specification.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
 
     Returns:
-      list[str]: supported format type indicators.
+      dict[str, list[str]]: supported format type indicators per format
+          category.
     """
-    type_indicator_list = []
+    type_indicators = {}
 
     file_object = resolver.Resolver.OpenFileObject(
         path_spec, resolver_context=resolver_context)
-    scan_state = pysigscan.scan_state()
 
     try:
-      signature_scanner.scan_file_object(scan_state, file_object)
-
-      for scan_result in iter(scan_state.scan_results):
-        format_specification = specification_store.GetSpecificationBySignature(
-            scan_result.identifier)
+      scan_data_file_object = _ScanDataFileObject(
+          file_object, scan_configuration.header_size,
+          scan_configuration.footer_size)
 
-        if format_specification.identifier not in type_indicator_list:
-          type_indicator_list.append(format_specification.identifier)
-
-      for analyzer_helper in remainder_list:
-        result = analyzer_helper.AnalyzeFileObject(file_object)
-
-        if result is not None:
-          type_indicator_list.append(result)
+      for (format_category, signature_scanner, specification_store,
+           remainder_list) in scan_configuration.signature_scanners:
+        type_indicators[format_category] = cls._ScanFileObject(
+            signature_scanner, specification_store, remainder_list,
+            scan_data_file_object,
+            bounded_scan=scan_configuration.bounded_scan)
 
     finally:
       file_object.close()
 
-    return type_indicator_list
+    return type_indicators
 
   @classmethod
   def DeregisterHelper(cls, analyzer_helper):
@@ -229,143 +549,215 @@ class Analyzer(object):
     del cls._analyzer_helpers[analyzer_helper.type_indicator]
 
   @classmethod
-  def GetArchiveTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetArchiveTypeIndicators(
+      cls, path_spec, bounded_scan=False, resolver_context=None):
     """Determines if a file contains a supported archive types.
 
     Args:
       path_spec (PathSpec): path specification.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._archive_remainder_list is None or
-        cls._archive_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_ARCHIVE)
-      cls._archive_remainder_list = remainder_list
-      cls._archive_store = specification_store
-
-    if cls._archive_scanner is None:
-      cls._archive_scanner = cls._GetSignatureScanner(cls._archive_store)
-
     return cls._GetTypeIndicators(
-        cls._archive_scanner, cls._archive_store,
-        cls._archive_remainder_list, path_spec,
-        resolver_context=resolver_context)
+        definitions.FORMAT_CATEGORY_ARCHIVE, path_spec,
+        bounded_scan=bounded_scan, resolver_context=resolver_context)
 
   @classmethod
-  def GetCompressedStreamTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetCompressedStreamTypeIndicators(
+      cls, path_spec, bounded_scan=False, resolver_context=None):
     """Determines if a file contains a supported compressed stream types.
 
     Args:
       path_spec (PathSpec): path specification.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._compressed_stream_remainder_list is None or
-        cls._compressed_stream_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_COMPRESSED_STREAM)
-      cls._compressed_stream_remainder_list = remainder_list
-      cls._compressed_stream_store = specification_store
-
-    if cls._compressed_stream_scanner is None:
-      cls._compressed_stream_scanner = cls._GetSignatureScanner(
-          cls._compressed_stream_store)
-
     return cls._GetTypeIndicators(
-        cls._compressed_stream_scanner, cls._compressed_stream_store,
-        cls._compressed_stream_remainder_list, path_spec,
-        resolver_context=resolver_context)
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM, path_spec,
+        bounded_scan=bounded_scan, resolver_context=resolver_context)
 
   @classmethod
-  def GetFileSystemTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetFileSystemTypeIndicators(
+      cls, path_spec, bounded_scan=False, resolver_context=None):
     """Determines if a file contains a supported file system types.
 
     Args:
       path_spec (PathSpec): path specification.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._file_system_remainder_list is None or
-        cls._file_system_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_FILE_SYSTEM)
-      cls._file_system_remainder_list = remainder_list
-      cls._file_system_store = specification_store
-
-    if cls._file_system_scanner is None:
-      cls._file_system_scanner = cls._GetSignatureScanner(
-          cls._file_system_store)
-
     return cls._GetTypeIndicators(
-        cls._file_system_scanner, cls._file_system_store,
-        cls._file_system_remainder_list, path_spec,
-        resolver_context=resolver_context)
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM, path_spec,
+        bounded_scan=bounded_scan, resolver_context=resolver_context)
 
   @classmethod
-  def GetStorageMediaImageTypeIndicators(cls, path_spec, resolver_context=None):
+  def GetStorageMediaImageTypeIndicators(
+      cls, path_spec, bounded_scan=False, resolver_context=None):
     """Determines if a file contains a supported storage media image types.
 
     Args:
       path_spec (PathSpec): path specification.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._storage_media_image_remainder_list is None or
-        cls._storage_media_image_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
-      cls._storage_media_image_remainder_list = remainder_list
-      cls._storage_media_image_store = specification_store
+    return cls._GetTypeIndicators(
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE, path_spec,
+        bounded_scan=bounded_scan, resolver_context=resolver_context)
+
+  @classmethod
+  def GetTypeIndicators(
+      cls, path_spec, format_categories, bounded_scan=False,
+      resolver_context=None):
+    """Determines if a file contains supported format types.
 
-    if cls._storage_media_image_scanner is None:
-      cls._storage_media_image_scanner = cls._GetSignatureScanner(
-          cls._storage_media_image_store)
+    The data scanned for the signatures of the format categories is read
+    once and shared with the analyzer helpers that do not have a format
+    specification.
 
-    return cls._GetTypeIndicators(
-        cls._storage_media_image_scanner, cls._storage_media_image_store,
-        cls._storage_media_image_remainder_list, path_spec,
-        resolver_context=resolver_context)
+    In a bounded scan only the header and footer ranges needed by the
+    signatures with an offset are read. Signatures without an offset are
+    then only scanned for in these ranges, which are at least
+    _SCAN_BUFFER_SIZE bytes, instead of in all the data.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_categories (list[str]): format categories.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe.
+
+    Returns:
+      dict[str, list[str]]: supported format type indicators per format
+          category.
+    """
+    scan_configuration = cls._GetScanConfiguration(
+        format_categories, bounded_scan)
+
+    return cls._ScanPathSpec(
+        scan_configuration, path_spec, resolver_context=resolver_context)
 
   @classmethod
-  def GetVolumeSystemTypeIndicators(cls, path_spec, resolver_context=None):
+  def _GetTypeIndicatorsOfPathSpecs(
+      cls, path_specs, format_categories, bounded_scan, number_of_workers,
+      resolver_context, use_threads):
+    """Determines if files contain supported format types.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications.
+      format_categories (list[str]): format categories.
+      bounded_scan (bool): True if only the header and footer ranges of
+          the data should be scanned for signatures.
+      number_of_workers (int): number of workers.
+      resolver_context (Context): resolver context used to analyze the files
+          in the current thread.
+      use_threads (bool): True if the workers should be threads instead of
+          processes.
+
+    Yields:
+      tuple[PathSpec, dict[str, list[str]]]: path specification and supported
+          format type indicators per format category, in the order of the path
+          specifications.
+    """
+    if number_of_workers <= 1:
+      scan_configuration = cls._GetScanConfiguration(
+          format_categories, bounded_scan)
+
+      for path_spec in path_specs:
+        yield _AnalyzePathSpec(
+            path_spec, resolver_context=resolver_context,
+            scan_configuration=scan_configuration)
+      return
+
+    for result in worker_pool.Map(
+        _AnalyzePathSpec, path_specs, number_of_workers,
+        chunk_size=cls._TASKS_CHUNK_SIZE,
+        initializer=_GetWorkerScanConfiguration,
+        initializer_arguments=(format_categories, bounded_scan),
+        use_threads=use_threads):
+      yield result
+
+  @classmethod
+  def GetTypeIndicatorsOfPathSpecs(
+      cls, path_specs, format_categories, bounded_scan=False,
+      number_of_workers=0, resolver_context=None, use_threads=False):
+    """Determines if files contain supported format types.
+
+    The signature scanners and the header and footer ranges to scan are
+    determined once for all the files. The files are analyzed in the current
+    thread or by a pool of workers, where every worker uses its own resolver
+    context and signature scanners. Note that worker processes can only open
+    encrypted volumes if the credentials were set in the key chain of
+    the resolver before the analysis and the operating system forks
+    the worker processes.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications.
+      format_categories (list[str]): format categories.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
+      number_of_workers (Optional[int]): number of workers, where None
+          represents the number of CPUs and 0 or 1 analyzes the files in
+          the current thread.
+      resolver_context (Optional[Context]): resolver context used to analyze
+          the files in the current thread, where None represents the built-in
+          context which is not multi process safe.
+      use_threads (Optional[bool]): True if the workers should be threads
+          instead of processes.
+
+    Returns:
+      generator[tuple[PathSpec, dict[str, list[str]]]]: path specification
+          and supported format type indicators per format category, in
+          the order of the path specifications. The type indicators are None
+          if the file could not be analyzed.
+
+    Raises:
+      ValueError: if the number of workers is invalid.
+    """
+    number_of_workers = worker_pool.GetNumberOfWorkers(number_of_workers)
+
+    return cls._GetTypeIndicatorsOfPathSpecs(
+        path_specs, list(format_categories), bounded_scan, number_of_workers,
+        resolver_context, use_threads)
+
+  @classmethod
+  def GetVolumeSystemTypeIndicators(
+      cls, path_spec, bounded_scan=False, resolver_context=None):
     """Determines if a file contains a supported volume system types.
 
     Args:
       path_spec (PathSpec): path specification.
+      bounded_scan (Optional[bool]): True if only the header and footer ranges
+          of the data should be scanned for signatures.
       resolver_context (Optional[Context]): resolver context, where None
           represents the built-in context which is not multi process safe.
 
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._volume_system_remainder_list is None or
-        cls._volume_system_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
-      cls._volume_system_remainder_list = remainder_list
-      cls._volume_system_store = specification_store
-
-    if cls._volume_system_scanner is None:
-      cls._volume_system_scanner = cls._GetSignatureScanner(
-          cls._volume_system_store)
-
     return cls._GetTypeIndicators(
-        cls._volume_system_scanner, cls._volume_system_store,
-        cls._volume_system_remainder_list, path_spec,
-        resolver_context=resolver_context)
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, path_spec,
+        bounded_scan=bounded_scan, resolver_context=resolver_context)
 
   @classmethod
   def RegisterHelper(cls, analyzer_helper):
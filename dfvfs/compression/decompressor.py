@@ -7,6 +7,18 @@ import abc
 class Decompressor(object):
   """Class that implements the decompressor object interface."""
 
+  def Copy(self):
+    """Copies the decompressor including its current decompression state.
+
+    A copy allows decompression to be resumed from the current position
+    in the compressed stream at a later time, for example after a seek.
+
+    Returns:
+      Decompressor: copy of the decompressor or None if the decompressor
+          does not support copying its decompression state.
+    """
+    return
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
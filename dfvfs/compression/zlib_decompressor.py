@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The zlib and DEFLATE decompressor object implementations."""
 
+import copy
 import zlib
 
 from dfvfs.compression import decompressor
@@ -25,6 +26,17 @@ class ZlibDecompressor(decompressor.Decompressor):
     super(ZlibDecompressor, self).__init__()
     self._zlib_decompressor = zlib.decompressobj(window_size)
 
+  def Copy(self):
+    """Copies the decompressor including its current decompression state.
+
+    Returns:
+      ZlibDecompressor: copy of the decompressor.
+    """
+    decompressor = copy.copy(self)
+    # pylint: disable=protected-access
+    decompressor._zlib_decompressor = self._zlib_decompressor.copy()
+    return decompressor
+
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
 
@@ -15,6 +15,11 @@ class Base16Decoder(decoder.Decoder):
 
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE16
 
+  ENCODING_ALPHABET = b'0123456789ABCDEF'
+  BITS_PER_CHARACTER = 4
+  ENCODED_QUANTUM_SIZE = 2
+  DECODED_QUANTUM_SIZE = 1
+
   def Decode(self, encoded_data):
     """Decode the encoded data.
 
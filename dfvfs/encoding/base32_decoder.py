@@ -15,6 +15,11 @@ class Base32Decoder(decoder.Decoder):
 
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE32
 
+  ENCODING_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
+  BITS_PER_CHARACTER = 5
+  ENCODED_QUANTUM_SIZE = 8
+  DECODED_QUANTUM_SIZE = 5
+
   def Decode(self, encoded_data):
     """Decode the encoded data.
 
@@ -15,6 +15,12 @@ class Base64Decoder(decoder.Decoder):
 
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE64
 
+  ENCODING_ALPHABET = (
+      b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/')
+  BITS_PER_CHARACTER = 6
+  ENCODED_QUANTUM_SIZE = 4
+  DECODED_QUANTUM_SIZE = 3
+
   def Decode(self, encoded_data):
     """Decode the encoded data.
 
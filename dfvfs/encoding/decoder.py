@@ -7,6 +7,20 @@ import abc
 class Decoder(object):
   """Class that implements the decoder object interface."""
 
+  # The characters of the encoding alphabet, without the padding character.
+  ENCODING_ALPHABET = None
+
+  # The number of bits that are encoded per character.
+  BITS_PER_CHARACTER = None
+
+  # The number of characters of an encoded quantum and the corresponding
+  # number of bytes of a decoded quantum.
+  ENCODED_QUANTUM_SIZE = None
+  DECODED_QUANTUM_SIZE = None
+
+  # The padding character.
+  PADDING_CHARACTER = b'='
+
   @abc.abstractmethod
   def Decode(self, encoded_data):
     """Decodes the encoded data.
@@ -17,3 +31,15 @@ class Decoder(object):
     Returns:
       tuple(bytes,bytes): decoded data and remaining encoded data.
     """
+
+  def SupportsRandomAccess(self):
+    """Determines if the decoder supports random access.
+
+    A decoder supports random access if a quantum of encoded characters
+    always decodes into the same number of bytes independently of
+    the preceding encoded data.
+
+    Returns:
+      bool: True if the decoder supports random access.
+    """
+    return self.ENCODING_ALPHABET is not None
@@ -8,7 +8,7 @@ from dfvfs.encryption import manager
 from dfvfs.lib import definitions
 
 
-class AESDecrypter(decrypter.Decrypter):
+class AESDecrypter(decrypter.BlockCipherDecrypter):
   """Class that implements a AES decrypter using pycrypto."""
 
   ENCRYPTION_METHOD = definitions.ENCRYPTION_METHOD_AES
@@ -38,38 +38,32 @@ class AESDecrypter(decrypter.Decrypter):
     if mode not in self.ENCRYPTION_MODES:
       raise ValueError(u'Unsupported mode of operation: {0!s}'.format(mode))
 
-    mode = self.ENCRYPTION_MODES[mode]
-
-    if mode != AES.MODE_ECB and not initialization_vector:
+    if mode != definitions.ENCRYPTION_MODE_ECB and not initialization_vector:
       # Pycrypto does not create a meaningful error when initialization vector
       # is missing. Therefore, we report it ourselves.
       raise ValueError(u'Missing initialization vector.')
 
-    super(AESDecrypter, self).__init__()
-    if mode == AES.MODE_ECB:
-      self._aes_cipher = AES.new(key, mode=mode)
-    else:
-      self._aes_cipher = AES.new(key, mode=mode, IV=initialization_vector)
+    super(AESDecrypter, self).__init__(
+        block_size=AES.block_size, mode=mode,
+        initialization_vector=initialization_vector)
+    self._key = key
+    self._cipher = self._CreateCipher(initialization_vector)
 
-  def Decrypt(self, encrypted_data):
-    """Decrypts the encrypted data.
+  def _CreateCipher(self, initialization_vector):
+    """Creates a cipher.
 
     Args:
-      encrypted_data (bytes): encrypted data.
+      initialization_vector (bytes): initialization vector, which is ignored
+          in ECB mode.
 
     Returns:
-      tuple[bytes,bytes]: decrypted data and remaining encrypted data.
+      object: AES cipher.
     """
-    index_split = -(len(encrypted_data) % AES.block_size)
-    if index_split:
-      remaining_encrypted_data = encrypted_data[index_split:]
-      encrypted_data = encrypted_data[:index_split]
-    else:
-      remaining_encrypted_data = b''
-
-    decrypted_data = self._aes_cipher.decrypt(encrypted_data)
+    cipher_mode = self.ENCRYPTION_MODES[self._mode]
+    if cipher_mode == AES.MODE_ECB:
+      return AES.new(self._key, mode=cipher_mode)
 
-    return decrypted_data, remaining_encrypted_data
+    return AES.new(self._key, mode=cipher_mode, IV=initialization_vector)
 
 
 manager.EncryptionManager.RegisterDecrypter(AESDecrypter)
@@ -3,6 +3,8 @@
 
 import abc
 
+from dfvfs.lib import definitions
+
 
 class Decrypter(object):
   """Class that implements the decrypter object interface."""
@@ -32,3 +34,143 @@ class Decrypter(object):
     Returns:
       tuple[bytes,bytes]: decrypted data and remaining encrypted data.
     """
+
+  def GetDecryptedDataSize(self, unused_encrypted_data_size):
+    """Determines the size of the decrypted data.
+
+    This is the fall through implementation that returns None.
+
+    Args:
+      unused_encrypted_data_size (int): size of the encrypted data.
+
+    Returns:
+      int: size of the decrypted data or None if the size cannot be determined
+          without decrypting the data.
+    """
+    return
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports random access.
+
+    A decrypter that supports random access can decrypt the data that
+    follows an encrypted block without decrypting the preceding data.
+
+    Returns:
+      bool: True if the decrypter supports random access.
+    """
+    return False
+
+
+class BlockCipherDecrypter(Decrypter):
+  """Class that implements the block cipher decrypter object interface."""
+
+  # The modes of operation in which a block can be decrypted from only
+  # the preceding encrypted block.
+  _RANDOM_ACCESS_MODES = frozenset([
+      definitions.ENCRYPTION_MODE_CBC,
+      definitions.ENCRYPTION_MODE_CFB,
+      definitions.ENCRYPTION_MODE_ECB])
+
+  def __init__(
+      self, block_size=None, mode=None, initialization_vector=None, **kwargs):
+    """Initializes the decrypter object.
+
+    Args:
+      block_size (Optional[int]): block size of the cipher.
+      mode (Optional[str]): mode of operation.
+      initialization_vector (Optional[bytes]): initialization vector.
+      kwargs (dict): keyword arguments depending on the decrypter.
+
+    Raises:
+      ValueError: when there are unused keyword arguments.
+    """
+    super(BlockCipherDecrypter, self).__init__(**kwargs)
+    self._block_size = block_size
+    self._cipher = None
+    self._initialization_vector = initialization_vector
+    self._mode = mode
+
+  @property
+  def block_size(self):
+    """int: block size of the cipher."""
+    return self._block_size
+
+  @abc.abstractmethod
+  def _CreateCipher(self, initialization_vector):
+    """Creates a cipher.
+
+    Args:
+      initialization_vector (bytes): initialization vector, which is ignored
+          in ECB mode.
+
+    Returns:
+      object: cipher.
+    """
+
+  def Decrypt(self, encrypted_data):
+    """Decrypts the encrypted data.
+
+    Args:
+      encrypted_data (bytes): encrypted data.
+
+    Returns:
+      tuple[bytes,bytes]: decrypted data and remaining encrypted data.
+    """
+    index_split = -(len(encrypted_data) % self._block_size)
+    if index_split:
+      remaining_encrypted_data = encrypted_data[index_split:]
+      encrypted_data = encrypted_data[:index_split]
+    else:
+      remaining_encrypted_data = b''
+
+    decrypted_data = self._cipher.decrypt(encrypted_data)
+
+    return decrypted_data, remaining_encrypted_data
+
+  def GetDecryptedDataSize(self, encrypted_data_size):
+    """Determines the size of the decrypted data.
+
+    Only complete blocks are decrypted, hence the size of the decrypted data
+    is the size of the encrypted data rounded down to the block size.
+
+    Args:
+      encrypted_data_size (int): size of the encrypted data.
+
+    Returns:
+      int: size of the decrypted data.
+    """
+    return encrypted_data_size - (encrypted_data_size % self._block_size)
+
+  def SetPreviousEncryptedBlock(self, encrypted_block):
+    """Sets the encrypted block that precedes the data to decrypt next.
+
+    Args:
+      encrypted_block (bytes): encrypted block or None to decrypt from
+          the start of the data.
+
+    Raises:
+      ValueError: if the decrypter does not support random access or
+          the size of the encrypted block is invalid.
+    """
+    if encrypted_block is None:
+      self._cipher = self._CreateCipher(self._initialization_vector)
+      return
+
+    if not self.SupportsRandomAccess():
+      raise ValueError(u'Unsupported mode of operation for random access.')
+
+    if len(encrypted_block) != self._block_size:
+      raise ValueError(u'Invalid encrypted block size: {0:d}.'.format(
+          len(encrypted_block)))
+
+    # In CBC and CFB mode the preceding encrypted block takes the place of
+    # the initialization vector.
+    self._cipher = self._CreateCipher(encrypted_block)
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports random access.
+
+    Returns:
+      bool: True if the decrypter supports random access.
+    """
+    return self._mode in self._RANDOM_ACCESS_MODES
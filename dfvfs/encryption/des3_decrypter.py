@@ -8,7 +8,7 @@ from dfvfs.encryption import manager
 from dfvfs.lib import definitions
 
 
-class DES3Decrypter(decrypter.Decrypter):
+class DES3Decrypter(decrypter.BlockCipherDecrypter):
   """Class that implements a triple DES decrypter using pycrypto."""
 
   ENCRYPTION_METHOD = definitions.ENCRYPTION_METHOD_DES3
@@ -38,38 +38,32 @@ class DES3Decrypter(decrypter.Decrypter):
     if mode not in self.ENCRYPTION_MODES:
       raise ValueError(u'Unsupported mode of operation: {0!s}'.format(mode))
 
-    mode = self.ENCRYPTION_MODES[mode]
-
-    if mode != DES3.MODE_ECB and not initialization_vector:
+    if mode != definitions.ENCRYPTION_MODE_ECB and not initialization_vector:
       # Pycrypto does not create a meaningful error when initialization vector
       # is missing. Therefore, we report it ourselves.
       raise ValueError(u'Missing initialization vector.')
 
-    super(DES3Decrypter, self).__init__()
-    if mode == DES3.MODE_ECB:
-      self._des3_cipher = DES3.new(key, mode=mode)
-    else:
-      self._des3_cipher = DES3.new(key, mode=mode, IV=initialization_vector)
+    super(DES3Decrypter, self).__init__(
+        block_size=DES3.block_size, mode=mode,
+        initialization_vector=initialization_vector)
+    self._key = key
+    self._cipher = self._CreateCipher(initialization_vector)
 
-  def Decrypt(self, encrypted_data):
-    """Decrypts the encrypted data.
+  def _CreateCipher(self, initialization_vector):
+    """Creates a cipher.
 
     Args:
-      encrypted_data (bytes): encrypted data.
+      initialization_vector (bytes): initialization vector, which is ignored
+          in ECB mode.
 
     Returns:
-      tuple[bytes,bytes]: decrypted data and remaining encrypted data.
+      object: DES3 cipher.
     """
-    index_split = -(len(encrypted_data) % DES3.block_size)
-    if index_split:
-      remaining_encrypted_data = encrypted_data[index_split:]
-      encrypted_data = encrypted_data[:index_split]
-    else:
-      remaining_encrypted_data = b''
-
-    decrypted_data = self._des3_cipher.decrypt(encrypted_data)
+    cipher_mode = self.ENCRYPTION_MODES[self._mode]
+    if cipher_mode == DES3.MODE_ECB:
+      return DES3.new(self._key, mode=cipher_mode)
 
-    return decrypted_data, remaining_encrypted_data
+    return DES3.new(self._key, mode=cipher_mode, IV=initialization_vector)
 
 
 manager.EncryptionManager.RegisterDecrypter(DES3Decrypter)
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""The block cached file-like object implementation."""
+
+import os
+
+from dfvfs.file_io import file_io
+
+
+class BlockCachedFile(file_io.FileIO):
+  """Class that implements a block cached file-like object.
+
+  The block cached file-like object reads the data of another file-like
+  object in aligned blocks that are stored in the block cache of the
+  resolver context. The block cache is shared by all block cached file-like
+  objects of the resolver context, which bounds the memory used for caching.
+
+  If the resolver context has no block cache the data is read directly
+  from the other file-like object.
+  """
+
+  # The maximum number of blocks a single read can span before the data
+  # is read directly, so that large sequential reads do not evict the
+  # blocks that are read repeatedly, such as file system metadata.
+  _MAXIMUM_NUMBER_OF_CACHED_READ_BLOCKS = 16
+
+  def __init__(self, resolver_context, file_object=None, identifier=None):
+    """Initializes the file-like object.
+
+    The block cached file-like object does not control the other file-like
+    object and does not close it.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+      file_object: optional file-like object that contains the data.
+      identifier: optional string that identifies the data of the file-like
+                  object in the block cache, such as the comparable of
+                  the path specification of the file-like object. The
+                  default is None, which disables caching since blocks
+                  can only be shared by file-like objects that contain
+                  the same data.
+    """
+    super(BlockCachedFile, self).__init__(resolver_context)
+    self._current_offset = 0
+    self._file_object = file_object
+    self._identifier = identifier
+    self._size = None
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    The other file-like object is not closed since the block cached
+    file-like object does not control it.
+    """
+    self._file_object = None
+    self._size = None
+
+  def _GetBlock(self, block_cache, block_index):
+    """Retrieves a block from the block cache or the file-like object.
+
+    Args:
+      block_cache: the block cache (instance of BlockCache).
+      block_index: the index of the block within the file-like object.
+
+    Returns:
+      A byte string containing the data of the block.
+    """
+    block_data = block_cache.GetBlock(self._identifier, block_index)
+    if block_data is None:
+      self._file_object.seek(block_index * block_cache.block_size, os.SEEK_SET)
+      block_data = self._file_object.read(block_cache.block_size)
+
+      # Only complete blocks and the last block are cached, since a short
+      # read is not necessarily the end of the data.
+      block_end_offset = (block_index * block_cache.block_size) + len(
+          block_data)
+      if (len(block_data) == block_cache.block_size or
+          block_end_offset == self._size):
+        block_cache.CacheBlock(self._identifier, block_index, block_data)
+
+    return block_data
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object.
+
+    Args:
+      path_spec: optional path specification (instance of PathSpec).
+      mode: optional file access mode. The default is 'rb' read-only binary.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    if path_spec:
+      raise ValueError(u'Path specification not supported.')
+
+    if not self._file_object:
+      raise IOError(u'Unable to open missing file-like object.')
+
+    self._current_offset = 0
+    self._size = self._file_object.get_size()
+
+  def _ReadDirectly(self, size):
+    """Reads data directly from the file-like object at the current offset.
+
+    Args:
+      size: integer value containing the number of bytes to read.
+
+    Returns:
+      A byte string containing the data read.
+    """
+    self._file_object.seek(self._current_offset, os.SEEK_SET)
+    return self._file_object.read(size)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size: optional integer value containing the number of bytes to read.
+            Default is all remaining data (None).
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._current_offset >= self._size:
+      return b''
+
+    if size is None or self._current_offset + size > self._size:
+      size = self._size - self._current_offset
+
+    block_cache = self._resolver_context.GetBlockCache()
+    if (not block_cache or self._identifier is None or
+        size >= block_cache.block_size * (
+            self._MAXIMUM_NUMBER_OF_CACHED_READ_BLOCKS)):
+      data = self._ReadDirectly(size)
+
+    else:
+      block_index, block_offset = divmod(
+          self._current_offset, block_cache.block_size)
+
+      data_parts = []
+      while size > 0:
+        block_data = self._GetBlock(block_cache, block_index)
+        if block_offset >= len(block_data):
+          break
+
+        data_part = block_data[block_offset:block_offset + size]
+        data_parts.append(data_part)
+        size -= len(data_part)
+
+        if len(block_data) < block_cache.block_size:
+          break
+
+        block_index += 1
+        block_offset = 0
+
+      data = b''.join(data_parts)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks an offset within the file-like object.
+
+    Args:
+      offset: the offset to seek.
+      whence: optional value that indicates whether offset is an absolute
+              or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError(u'Unsupported whence.')
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Returns the current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Returns the size of the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._size
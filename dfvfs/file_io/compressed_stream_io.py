@@ -1,20 +1,81 @@
 # -*- coding: utf-8 -*-
 """The compressed stream file-like object implementation."""
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
+from dfvfs.lib import stream_buffer
 from dfvfs.resolver import resolver
 
 
+class CompressedStreamCheckpoint(object):
+  """Class that contains a compressed stream checkpoint.
+
+  A checkpoint contains the information needed to resume decompression
+  at a specific offset in the uncompressed stream without having to
+  decompress the data preceding it.
+
+  Attributes:
+    compressed_data (bytes): compressed data that was read from the parent
+        file-like object but not yet consumed by the decompressor.
+    compressed_data_offset (int): offset of the compressed data in the parent
+        file-like object where reading should resume.
+    decompressor (Decompressor): decompressor in the state at the checkpoint.
+    uncompressed_data_offset (int): offset in the uncompressed stream that
+        corresponds with the checkpoint.
+  """
+
+  def __init__(
+      self, compressed_data_offset, uncompressed_data_offset, decompressor,
+      compressed_data=b''):
+    """Initializes the checkpoint.
+
+    Args:
+      compressed_data_offset (int): offset of the compressed data in
+          the parent file-like object where reading should resume.
+      uncompressed_data_offset (int): offset in the uncompressed stream
+          that corresponds with the checkpoint.
+      decompressor (Decompressor): decompressor in the state at
+          the checkpoint.
+      compressed_data (Optional[bytes]): compressed data that was read
+          but not yet consumed by the decompressor.
+    """
+    super(CompressedStreamCheckpoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
-  """Class that implements a file-like object of a compressed stream."""
+  """Class that implements a file-like object of a compressed stream.
+
+  While the compressed stream is decompressed checkpoints are stored
+  at regular intervals, if the decompressor supports copying its state.
+  On a seek decompression is resumed from the nearest preceding checkpoint,
+  hence the cost of a seek is bound by the checkpoint interval, plus
+  the uncompressed data of one checkpoint read, instead of the offset in
+  the uncompressed stream. To keep checkpoints at the checkpoint interval
+  the compressed data is decompressed in parts of the checkpoint read size.
+
+  If the resolver context has a stream index cache the uncompressed stream
+  size is persisted, so that other processes that open the same compressed
+  stream do not need to decompress the entire stream to determine its size.
+  """
 
   # The size of the compressed data buffer.
   _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The minimum number of bytes of uncompressed data between checkpoints.
+  _CHECKPOINT_INTERVAL = 4 * 1024 * 1024
+
+  # The maximum number of bytes of compressed data decompressed at once
+  # if the decompressor supports checkpoints.
+  _CHECKPOINT_READ_SIZE = 256 * 1024
+
   def __init__(
       self, resolver_context, compression_method=None, file_object=None):
     """Initializes the file-like object.
@@ -36,15 +97,19 @@ class CompressedStream(file_io.FileIO):
           u'method.')
 
     super(CompressedStream, self).__init__(resolver_context)
+    self._checkpoints = []
+    self._checkpoint_offsets = []
+    self._checkpoints_supported = True
     self._compression_method = compression_method
     self._file_object = file_object
+    self._path_spec = None
     self._compressed_data = b''
+    self._compressed_data_offset = 0
     self._current_offset = 0
     self._decompressor = None
     self._realign_offset = True
-    self._uncompressed_data = b''
-    self._uncompressed_data_offset = 0
-    self._uncompressed_data_size = 0
+    self._uncompressed_data_buffer = stream_buffer.StreamBuffer()
+    self._uncompressed_data_end_offset = 0
     self._uncompressed_stream_size = None
 
     if file_object:
@@ -52,6 +117,31 @@ class CompressedStream(file_io.FileIO):
     else:
       self._file_object_set_in_init = False
 
+  def _AddCheckpoint(self):
+    """Adds a checkpoint at the end of the current uncompressed data.
+
+    A checkpoint is only added if the decompressor supports copying its
+    state and the distance to the last checkpoint exceeds the checkpoint
+    interval.
+    """
+    uncompressed_data_offset = self._uncompressed_data_end_offset
+
+    last_checkpoint_offset = self._checkpoint_offsets[-1]
+    if (uncompressed_data_offset - last_checkpoint_offset <
+        self._CHECKPOINT_INTERVAL):
+      return
+
+    decompressor = self._decompressor.Copy()
+    if not decompressor:
+      self._checkpoints_supported = False
+      return
+
+    checkpoint = CompressedStreamCheckpoint(
+        self._compressed_data_offset, uncompressed_data_offset, decompressor,
+        compressed_data=self._compressed_data)
+    self._checkpoints.append(checkpoint)
+    self._checkpoint_offsets.append(uncompressed_data_offset)
+
   def _Close(self):
     """Closes the file-like object.
 
@@ -63,33 +153,96 @@ class CompressedStream(file_io.FileIO):
       self._file_object.close()
       self._file_object = None
 
+    self._path_spec = None
+    self._checkpoints = []
+    self._checkpoint_offsets = []
+    self._checkpoints_supported = True
     self._compressed_data = b''
-    self._uncompressed_data = b''
+    self._uncompressed_data_buffer.Clear()
     self._decompressor = None
 
-  def _GetDecompressor(self):
-    """Retrieves the decompressor."""
-    return compression_manager.CompressionManager.GetDecompressor(
-        self._compression_method)
+  def _DecompressRemainingData(self):
+    """Decompresses the remainder of the compressed stream.
 
-  def _GetUncompressedStreamSize(self):
-    """Retrieves the uncompressed stream size."""
-    self._file_object.seek(0, os.SEEK_SET)
+    Returns:
+      int: uncompressed stream size.
+    """
+    compressed_data_size = self._file_object.get_size()
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    # Continue from the last checkpoint or the current decompression state,
+    # whichever is further in the stream.
+    checkpoint = self._GetCheckpoint()
+    if (self._decompressor is None or
+        self._uncompressed_data_end_offset <
+        checkpoint.uncompressed_data_offset):
+      self._RestoreCheckpoint(checkpoint)
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
-    uncompressed_stream_size = 0
+    # Only the uncompressed data of the last read is kept.
+    while self._compressed_data_offset < compressed_data_size:
+      self._uncompressed_data_buffer.Clear()
 
-    while compressed_data_offset < compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
+    self._realign_offset = True
+
+    return self._uncompressed_data_end_offset
+
+  def _GetCheckpoint(self, uncompressed_data_offset=None):
+    """Retrieves the nearest checkpoint preceding an uncompressed data offset.
+
+    Args:
+      uncompressed_data_offset (Optional[int]): uncompressed data offset,
+          where None represents the last checkpoint.
+
+    Returns:
+      CompressedStreamCheckpoint: checkpoint.
+    """
+    if not self._checkpoints:
+      checkpoint = CompressedStreamCheckpoint(0, 0, self._GetDecompressor())
+      self._checkpoints.append(checkpoint)
+      self._checkpoint_offsets.append(0)
+
+    if uncompressed_data_offset is None:
+      return self._checkpoints[-1]
+
+    checkpoint_index = bisect.bisect_right(
+        self._checkpoint_offsets, uncompressed_data_offset)
+    return self._checkpoints[checkpoint_index - 1]
+
+  def _GetDecompressor(self):
+    """Retrieves the decompressor."""
+    return compression_manager.CompressionManager.GetDecompressor(
+        self._compression_method)
+
+  def _GetUncompressedStreamSize(self):
+    """Retrieves the uncompressed stream size.
+
+    The uncompressed stream size is read from the stream index cache if
+    available, otherwise it is determined by decompressing the remainder of
+    the compressed stream, which also stores the checkpoints.
+    """
+    stream_index_cache = None
+    if self._path_spec:
+      stream_index_cache = self._resolver_context.GetStreamIndexCache()
+
+    if stream_index_cache:
+      fingerprint = stream_index_cache.GetFingerprint(self._file_object)
+      stream_index = stream_index_cache.GetStreamIndex(
+          self._path_spec.comparable, fingerprint)
+      if stream_index:
+        uncompressed_stream_size = stream_index.get(
+            u'uncompressed_stream_size', None)
+        if uncompressed_stream_size is not None:
+          return uncompressed_stream_size
+
+    uncompressed_stream_size = self._DecompressRemainingData()
+
+    if stream_index_cache:
+      stream_index = {u'uncompressed_stream_size': uncompressed_stream_size}
+      stream_index_cache.StoreStreamIndex(
+          self._path_spec.comparable, fingerprint, stream_index)
 
     return uncompressed_stream_size
 
@@ -122,56 +275,163 @@ class CompressedStream(file_io.FileIO):
 
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
+      self._path_spec = path_spec
 
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression continues from the current decompression state when
+    the uncompressed data offset lies ahead of it or within the uncompressed
+    data that is retained by the buffer, otherwise decompression is resumed
+    from the nearest preceding checkpoint.
+
     Args:
       uncompressed_data_offset: the uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    checkpoint = self._GetCheckpoint(uncompressed_data_offset)
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    buffered_data_offset = (
+        self._uncompressed_data_end_offset -
+        self._uncompressed_data_buffer.size)
+
+    if (uncompressed_data_offset < buffered_data_offset and
+        self._uncompressed_data_buffer.Rewind(
+            buffered_data_offset - uncompressed_data_offset)):
+      buffered_data_offset = uncompressed_data_offset
+
+    if (self._decompressor is None or
+        uncompressed_data_offset < buffered_data_offset or
+        self._uncompressed_data_end_offset <
+        checkpoint.uncompressed_data_offset):
+      self._RestoreCheckpoint(checkpoint)
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
 
-    while compressed_data_offset < compressed_data_size:
+    # The uncompressed data preceding the uncompressed data offset is
+    # not kept.
+    while uncompressed_data_offset >= self._uncompressed_data_end_offset:
+      self._uncompressed_data_buffer.Clear()
+
+      if self._compressed_data_offset >= compressed_data_size:
+        break
+
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
+    buffered_data_offset = (
+        self._uncompressed_data_end_offset -
+        self._uncompressed_data_buffer.size)
+    self._uncompressed_data_buffer.Skip(
+        uncompressed_data_offset - buffered_data_offset)
+
+  def _BufferUncompressedData(self, size):
+    """Buffers uncompressed data at the current offset.
 
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+    Args:
+      size (int): number of bytes to buffer, where None represents all
+          the remaining data.
+
+    Returns:
+      int: number of bytes to read, which is smaller than the requested size
+          if less data remains.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the current
+          offset or uncompressed stream size is invalid.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._uncompressed_stream_size is None:
+      self._uncompressed_stream_size = self._GetUncompressedStreamSize()
+
+    if self._uncompressed_stream_size < 0:
+      raise IOError(u'Invalid uncompressed stream size.')
+
+    if self._current_offset >= self._uncompressed_stream_size:
+      return 0
+
+    if self._realign_offset:
+      self._AlignUncompressedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    if size is None:
+      size = self._uncompressed_stream_size
+    if self._current_offset + size > self._uncompressed_stream_size:
+      size = self._uncompressed_stream_size - self._current_offset
+
+    while self._uncompressed_data_buffer.size < size:
+      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    return size
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
 
+    If the decompressor supports checkpoints the compressed data is read
+    and decompressed in parts of at most the checkpoint read size, so that
+    a checkpoint can be added after every part.
+
     Args:
       read_size: the number of bytes of compressed data to read.
 
     Returns:
       The number of bytes of compressed data read.
     """
-    compressed_data = self._file_object.read(read_size)
+    read_count = 0
+    while read_count < read_size:
+      part_size = read_size - read_count
+      if self._checkpoints_supported:
+        part_size = min(part_size, self._CHECKPOINT_READ_SIZE)
+
+      self._file_object.seek(self._compressed_data_offset, os.SEEK_SET)
+      compressed_data = self._file_object.read(part_size)
+
+      part_read_count = len(compressed_data)
+      if not part_read_count:
+        break
 
-    read_count = len(compressed_data)
+      if self._compressed_data:
+        compressed_data = b''.join([self._compressed_data, compressed_data])
+      self._compressed_data_offset += part_read_count
 
-    self._compressed_data = b''.join([self._compressed_data, compressed_data])
+      uncompressed_data, self._compressed_data = (
+          self._decompressor.Decompress(compressed_data))
 
-    self._uncompressed_data, self._compressed_data = (
-        self._decompressor.Decompress(self._compressed_data))
+      self._uncompressed_data_buffer.Append(uncompressed_data)
+      self._uncompressed_data_end_offset += len(uncompressed_data)
 
-    self._uncompressed_data_size = len(self._uncompressed_data)
+      self._AddCheckpoint()
+
+      read_count += part_read_count
 
     return read_count
 
+  def _RestoreCheckpoint(self, checkpoint):
+    """Restores the decompression state of a checkpoint.
+
+    Args:
+      checkpoint (CompressedStreamCheckpoint): checkpoint.
+    """
+    # The decompressor is copied so the checkpoint remains reusable.
+    if checkpoint.uncompressed_data_offset == 0:
+      self._decompressor = self._GetDecompressor()
+    else:
+      self._decompressor = checkpoint.decompressor.Copy()
+
+    self._compressed_data = checkpoint.compressed_data
+    self._compressed_data_offset = checkpoint.compressed_data_offset
+    self._uncompressed_data_buffer.Clear()
+    self._uncompressed_data_end_offset = checkpoint.uncompressed_data_offset
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -191,68 +451,35 @@ class CompressedStream(file_io.FileIO):
     Raises:
       IOError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError(u'Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError(
-          u'Invalid current offset: {0:d} value less than zero.'.format(
-              self._current_offset))
-
-    if self._uncompressed_stream_size is None:
-      self._uncompressed_stream_size = self._GetUncompressedStreamSize()
-
-    if self._uncompressed_stream_size < 0:
-      raise IOError(u'Invalid uncompressed stream size.')
-
-    if self._current_offset >= self._uncompressed_stream_size:
-      return b''
-
-    if self._realign_offset:
-      self._AlignUncompressedDataOffset(self._current_offset)
-      self._realign_offset = False
-
-    if size is None:
-      size = self._uncompressed_stream_size
-    if self._current_offset + size > self._uncompressed_stream_size:
-      size = self._uncompressed_stream_size - self._current_offset
-
-    uncompressed_data = b''
-
-    if size == 0:
-      return uncompressed_data
-
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+    read_size = self._BufferUncompressedData(size)
 
-      remaining_uncompressed_data_size = (
-          self._uncompressed_data_size - self._uncompressed_data_offset)
+    uncompressed_data = self._uncompressed_data_buffer.Read(read_size)
+    self._current_offset += len(uncompressed_data)
 
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
+    return uncompressed_data
 
-      if self._current_offset >= self._uncompressed_stream_size:
-        break
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a preallocated buffer.
 
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
-        break
+    Args:
+      buffer (bytearray): buffer to read the data into, which can also be
+          another writable bytes-like object, such as a memoryview.
 
-    if size > 0:
-      slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+    Returns:
+      int: number of bytes read, which is smaller than the size of the buffer
+          if less data remains.
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+    read_size = self._BufferUncompressedData(len(buffer_view))
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+    read_count = self._uncompressed_data_buffer.ReadInto(
+        buffer_view[:read_size])
+    self._current_offset += read_count
 
-    return uncompressed_data
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -276,6 +503,8 @@ class CompressedStream(file_io.FileIO):
     if whence == os.SEEK_CUR:
       offset += self._current_offset
     elif whence == os.SEEK_END:
+      if self._uncompressed_stream_size is None:
+        self._uncompressed_stream_size = self._GetUncompressedStreamSize()
       offset += self._uncompressed_stream_size
     elif whence != os.SEEK_SET:
       raise IOError(u'Unsupported whence.')
@@ -6,15 +6,68 @@ import os
 from dfvfs.encoding import manager as encoding_manager
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
+from dfvfs.lib import stream_buffer
 from dfvfs.resolver import resolver
 
 
+class _EncodedDataLayout(object):
+  """Class that contains the layout of encoded data.
+
+  The encoded data consists of lines with the same number of characters,
+  except for the last line, which can be shorter. The lines are separated
+  by the same line break.
+
+  Attributes:
+    line_break (bytes): line break or an empty byte string if the encoded
+        data does not contain line breaks.
+    line_size (int): number of characters per line or None if the encoded
+        data does not contain line breaks.
+    number_of_characters (int): number of encoded characters, including
+        padding characters.
+    padding_size (int): number of padding characters.
+  """
+
+  def __init__(self, line_size, line_break):
+    """Initializes the encoded data layout.
+
+    Args:
+      line_size (int): number of characters per line or None if the encoded
+          data does not contain line breaks.
+      line_break (bytes): line break or an empty byte string if the encoded
+          data does not contain line breaks.
+    """
+    super(_EncodedDataLayout, self).__init__()
+    self.line_break = line_break
+    self.line_size = line_size
+    self.number_of_characters = 0
+    self.padding_size = 0
+
+  def GetEncodedDataOffset(self, character_offset):
+    """Retrieves the offset of an encoded character in the encoded data.
+
+    Args:
+      character_offset (int): offset of the character, without line breaks.
+
+    Returns:
+      int: offset of the character in the encoded data.
+    """
+    if not self.line_size:
+      return character_offset
+
+    number_of_lines = character_offset // self.line_size
+    return character_offset + (number_of_lines * len(self.line_break))
+
+
 class EncodedStream(file_io.FileIO):
   """Class that implements a file-like object of a encoded stream."""
 
   # The size of the encoded data buffer.
   _ENCODED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The number of encoded characters read when aligning at a quantum.
+  # Further encoded data is read on demand.
+  _ALIGNMENT_READ_SIZE = 64 * 1024
+
   def __init__(
       self, resolver_context, encoding_method=None, file_object=None):
     """Initializes the file-like object.
@@ -36,12 +89,13 @@ class EncodedStream(file_io.FileIO):
 
     super(EncodedStream, self).__init__(resolver_context)
     self._current_offset = 0
-    self._decoded_data = b''
-    self._decoded_data_offset = 0
-    self._decoded_data_size = 0
+    self._decoded_data_buffer = stream_buffer.StreamBuffer()
     self._decoded_stream_size = None
     self._decoder = None
+    self._encoded_character_offset = 0
     self._encoded_data = b''
+    self._encoded_data_layout = None
+    self._encoded_data_layout_checked = False
     self._encoding_method = encoding_method
     self._file_object = file_object
     self._realign_offset = True
@@ -63,8 +117,10 @@ class EncodedStream(file_io.FileIO):
       self._file_object = None
 
     self._decoder = None
-    self._decoded_data = b''
+    self._decoded_data_buffer.Clear()
     self._encoded_data = b''
+    self._encoded_data_layout = None
+    self._encoded_data_layout_checked = False
 
   def _GetDecoder(self):
     """Retrieves the decoder (instance of encodings.Decoder)."""
@@ -72,10 +128,19 @@ class EncodedStream(file_io.FileIO):
 
   def _GetDecodedStreamSize(self):
     """Retrieves the decoded stream size."""
+    encoded_data_layout = self._GetEncodedDataLayout()
+    if encoded_data_layout:
+      number_of_characters = (
+          encoded_data_layout.number_of_characters -
+          encoded_data_layout.padding_size)
+      return (number_of_characters * self._decoder.BITS_PER_CHARACTER) // 8
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decoder = self._GetDecoder()
-    self._decoded_data = b''
+    self._decoded_data_buffer.Clear()
+    self._encoded_data = b''
+    self._realign_offset = True
 
     encoded_data_offset = 0
     encoded_data_size = self._file_object.get_size()
@@ -87,10 +152,69 @@ class EncodedStream(file_io.FileIO):
         break
 
       encoded_data_offset += read_count
-      decoded_stream_size += self._decoded_data_size
+      decoded_stream_size += self._decoded_data_buffer.size
+      self._decoded_data_buffer.Clear()
 
     return decoded_stream_size
 
+  def _GetEncodedDataLayout(self):
+    """Retrieves the layout of the encoded data.
+
+    The layout is determined once by scanning the encoded data for line
+    breaks, which does not require the encoded data to be decoded.
+
+    Returns:
+      _EncodedDataLayout: layout of the encoded data or None if the decoder
+          does not support random access or the encoded data does not have
+          a regular layout.
+    """
+    if not self._encoded_data_layout_checked:
+      self._encoded_data_layout_checked = True
+
+      decoder = self._GetDecoder()
+      if decoder.SupportsRandomAccess():
+        self._encoded_data_layout = self._ScanEncodedDataLayout(decoder)
+        if self._encoded_data_layout:
+          self._decoder = decoder
+
+    return self._encoded_data_layout
+
+  def _GetNumberOfEncodedCharacters(
+      self, encoded_data, encoding_alphabet, line_size, line_break):
+    """Retrieves the number of encoded characters in encoded data.
+
+    Args:
+      encoded_data (bytes): encoded data, which starts at the start of a line.
+      encoding_alphabet (bytes): characters of the encoding alphabet.
+      line_size (int): number of characters per line or None if the encoded
+          data does not contain line breaks.
+      line_break (bytes): line break.
+
+    Returns:
+      int: number of encoded characters or None if the encoded data contains
+          characters outside the encoding alphabet or line breaks that do
+          not match the layout.
+    """
+    number_of_line_breaks = 0
+    if line_size:
+      line_stride = line_size + len(line_break)
+      for index in range(len(line_break)):
+        line_break_byte = line_break[index:index + 1]
+        line_break_bytes = encoded_data[line_size + index::line_stride]
+        if line_break_bytes != line_break_byte * len(line_break_bytes):
+          return
+
+        if index == 0:
+          number_of_line_breaks = len(line_break_bytes)
+
+    # Deleting the characters of the encoding alphabet leaves only the line
+    # breaks, if the encoded data matches the layout.
+    other_characters = encoded_data.translate(None, encoding_alphabet)
+    if other_characters != line_break * number_of_line_breaks:
+      return
+
+    return len(encoded_data) - len(other_characters)
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object.
 
@@ -124,13 +248,22 @@ class EncodedStream(file_io.FileIO):
   def _AlignDecodedDataOffset(self, decoded_data_offset):
     """Aligns the encoded file with the decoded data offset.
 
+    If the layout of the encoded data is known the encoded data is read from
+    the start of the quantum that contains the decoded data offset, otherwise
+    the encoded data is decoded from the start.
+
     Args:
       decoded_data_offset: the decoded data offset.
     """
+    if self._GetEncodedDataLayout():
+      self._AlignDecodedDataOffsetAtQuantum(decoded_data_offset)
+      return
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decoder = self._GetDecoder()
-    self._decoded_data = b''
+    self._decoded_data_buffer.Clear()
+    self._encoded_data = b''
 
     encoded_data_offset = 0
     encoded_data_size = self._file_object.get_size()
@@ -142,11 +275,122 @@ class EncodedStream(file_io.FileIO):
 
       encoded_data_offset += read_count
 
-      if decoded_data_offset < self._decoded_data_size:
-        self._decoded_data_offset = decoded_data_offset
+      decoded_data_offset -= self._decoded_data_buffer.Skip(
+          decoded_data_offset)
+      if decoded_data_offset == 0:
+        break
+
+  def _AlignDecodedDataOffsetAtQuantum(self, decoded_data_offset):
+    """Aligns the encoded file with the decoded data offset at a quantum.
+
+    A quantum of encoded characters decodes into a fixed number of bytes,
+    hence the encoded characters of the quantum that contains the decoded
+    data offset follow from the layout of the encoded data.
+
+    Args:
+      decoded_data_offset: the decoded data offset.
+    """
+    quantum_index, quantum_offset = divmod(
+        decoded_data_offset, self._decoder.DECODED_QUANTUM_SIZE)
+
+    self._decoded_data_buffer.Clear()
+    self._encoded_character_offset = (
+        quantum_index * self._decoder.ENCODED_QUANTUM_SIZE)
+
+    self._ReadEncodedCharacters(self._ALIGNMENT_READ_SIZE)
+    self._decoded_data_buffer.Skip(quantum_offset)
+
+  def _BufferDecodedData(self, size):
+    """Buffers decoded data at the current offset.
+
+    Args:
+      size (int): number of bytes to buffer, where None represents all
+          the remaining data.
+
+    Returns:
+      int: number of bytes to read, which is smaller than the requested size
+          if less data remains.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the current
+          offset or decoded stream size is invalid.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._decoded_stream_size is None:
+      self._decoded_stream_size = self._GetDecodedStreamSize()
+
+    if self._decoded_stream_size < 0:
+      raise IOError(u'Invalid decoded stream size.')
+
+    if self._current_offset >= self._decoded_stream_size:
+      return 0
+
+    if self._realign_offset:
+      self._AlignDecodedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    if size is None:
+      size = self._decoded_stream_size
+    if self._current_offset + size > self._decoded_stream_size:
+      size = self._decoded_stream_size - self._current_offset
+
+    while self._decoded_data_buffer.size < size:
+      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      decoded_data_offset -= self._decoded_data_size
+    return size
+
+  def _ReadEncodedCharacters(self, number_of_characters):
+    """Reads encoded characters using the layout of the encoded data.
+
+    The characters are read from the current encoded character offset,
+    which is aligned with a quantum.
+
+    Args:
+      number_of_characters (int): maximum number of encoded characters to
+          read, which is rounded down to a multiple of the quantum size.
+
+    Returns:
+      int: number of encoded characters read.
+    """
+    encoded_quantum_size = self._decoder.ENCODED_QUANTUM_SIZE
+    number_of_characters -= number_of_characters % encoded_quantum_size
+    number_of_characters = max(number_of_characters, encoded_quantum_size)
+
+    start_character_offset = self._encoded_character_offset
+    end_character_offset = min(
+        start_character_offset + number_of_characters,
+        self._encoded_data_layout.number_of_characters)
+
+    encoded_data = b''
+    if start_character_offset < end_character_offset:
+      encoded_data_offset = self._encoded_data_layout.GetEncodedDataOffset(
+          start_character_offset)
+      encoded_data_end_offset = (
+          self._encoded_data_layout.GetEncodedDataOffset(end_character_offset))
+
+      self._file_object.seek(encoded_data_offset, os.SEEK_SET)
+      encoded_data = self._file_object.read(
+          encoded_data_end_offset - encoded_data_offset)
+
+    if self._encoded_data_layout.line_break:
+      encoded_data = encoded_data.translate(
+          None, self._encoded_data_layout.line_break)
+
+    decoded_data, _ = self._decoder.Decode(encoded_data)
+    self._decoded_data_buffer.Append(decoded_data)
+
+    read_count = len(encoded_data)
+    self._encoded_character_offset += read_count
+    return read_count
 
   def _ReadEncodedData(self, read_size):
     """Reads encoded data from the file-like object.
@@ -157,19 +401,101 @@ class EncodedStream(file_io.FileIO):
     Returns:
       The number of bytes of encoded data read.
     """
+    if self._encoded_data_layout:
+      return self._ReadEncodedCharacters(read_size)
+
     encoded_data = self._file_object.read(read_size)
 
     read_count = len(encoded_data)
 
-    self._encoded_data = b''.join([self._encoded_data, encoded_data])
+    if self._encoded_data:
+      encoded_data = b''.join([self._encoded_data, encoded_data])
 
-    self._decoded_data, self._encoded_data = (
-        self._decoder.Decode(self._encoded_data))
+    decoded_data, self._encoded_data = self._decoder.Decode(encoded_data)
 
-    self._decoded_data_size = len(self._decoded_data)
+    self._decoded_data_buffer.Append(decoded_data)
 
     return read_count
 
+  def _ScanEncodedDataLayout(self, decoder):
+    """Scans the encoded data for its layout.
+
+    Args:
+      decoder (Decoder): decoder that supports random access.
+
+    Returns:
+      _EncodedDataLayout: layout of the encoded data or None if the encoded
+          data does not have a regular layout.
+    """
+    self._file_object.seek(0, os.SEEK_SET)
+    encoded_data = self._file_object.read(self._ENCODED_DATA_BUFFER_SIZE)
+
+    # The first line break determines the layout of the lines.
+    line_break_index = encoded_data.find(b'\n')
+    if line_break_index < 0:
+      line_size = None
+      line_break = b''
+    elif encoded_data[line_break_index - 1:line_break_index] == b'\r':
+      line_size = line_break_index - 1
+      line_break = b'\r\n'
+    else:
+      line_size = line_break_index
+      line_break = b'\n'
+
+    if line_size is not None and line_size <= 0:
+      return
+
+    encoded_data_layout = _EncodedDataLayout(line_size, line_break)
+
+    while encoded_data:
+      next_encoded_data = self._file_object.read(
+          self._ENCODED_DATA_BUFFER_SIZE)
+
+      if next_encoded_data:
+        # Only scan complete lines, the remainder is scanned with the next
+        # encoded data.
+        if line_size:
+          line_stride = line_size + len(line_break)
+          scan_size = len(encoded_data) - (len(encoded_data) % line_stride)
+          next_encoded_data = b''.join([
+              encoded_data[scan_size:], next_encoded_data])
+          encoded_data = encoded_data[:scan_size]
+
+      else:
+        # Trailing line breaks and padding only occur at the end of
+        # the encoded data.
+        encoded_data = encoded_data.rstrip(b'\r\n')
+        unpadded_encoded_data = encoded_data.rstrip(decoder.PADDING_CHARACTER)
+
+        encoded_data_layout.padding_size = (
+            len(encoded_data) - len(unpadded_encoded_data))
+        encoded_data = unpadded_encoded_data
+
+      number_of_characters = self._GetNumberOfEncodedCharacters(
+          encoded_data, decoder.ENCODING_ALPHABET, line_size, line_break)
+      if number_of_characters is None:
+        return
+
+      encoded_data_layout.number_of_characters += number_of_characters
+      encoded_data = next_encoded_data
+
+    encoded_data_layout.number_of_characters += encoded_data_layout.padding_size
+
+    # The encoded data must consist of complete quanta and the padding must
+    # not contain bits of the decoded data.
+    encoded_quantum_size = decoder.ENCODED_QUANTUM_SIZE
+    if encoded_data_layout.number_of_characters % encoded_quantum_size:
+      return
+
+    if encoded_data_layout.padding_size:
+      number_of_bits = decoder.BITS_PER_CHARACTER * (
+          encoded_quantum_size - encoded_data_layout.padding_size)
+      if (encoded_data_layout.padding_size >= encoded_quantum_size or
+          number_of_bits % 8 >= decoder.BITS_PER_CHARACTER):
+        return
+
+    return encoded_data_layout
+
   def SetDecodedStreamSize(self, decoded_stream_size):
     """Sets the decoded stream size.
 
@@ -212,68 +538,34 @@ class EncodedStream(file_io.FileIO):
     Raises:
       IOError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError(u'Not opened.')
+    read_size = self._BufferDecodedData(size)
 
-    if self._current_offset < 0:
-      raise IOError(
-          u'Invalid current offset: {0:d} value less than zero.'.format(
-              self._current_offset))
-
-    if self._decoded_stream_size is None:
-      self._decoded_stream_size = self._GetDecodedStreamSize()
-
-    if self._decoded_stream_size < 0:
-      raise IOError(u'Invalid decoded stream size.')
-
-    if self._current_offset >= self._decoded_stream_size:
-      return b''
-
-    if self._realign_offset:
-      self._AlignDecodedDataOffset(self._current_offset)
-      self._realign_offset = False
+    decoded_data = self._decoded_data_buffer.Read(read_size)
+    self._current_offset += len(decoded_data)
 
-    if size is None:
-      size = self._decoded_stream_size
-    if self._current_offset + size > self._decoded_stream_size:
-      size = self._decoded_stream_size - self._current_offset
-
-    decoded_data = b''
-
-    if size == 0:
-      return decoded_data
-
-    while size > self._decoded_data_size:
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[self._decoded_data_offset:]])
-
-      remaining_decoded_data_size = (
-          self._decoded_data_size - self._decoded_data_offset)
-
-      self._current_offset += remaining_decoded_data_size
-      size -= remaining_decoded_data_size
+    return decoded_data
 
-      if self._current_offset >= self._decoded_stream_size:
-        break
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a preallocated buffer.
 
-      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
-      self._decoded_data_offset = 0
-      if read_count == 0:
-        break
+    Args:
+      buffer (bytearray): buffer to read the data into, which can also be
+          another writable bytes-like object, such as a memoryview.
 
-    if size > 0:
-      slice_start_offset = self._decoded_data_offset
-      slice_end_offset = slice_start_offset + size
+    Returns:
+      int: number of bytes read, which is smaller than the size of the buffer
+          if less data remains.
 
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[slice_start_offset:slice_end_offset]])
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+    read_size = self._BufferDecodedData(len(buffer_view))
 
-      self._decoded_data_offset += size
-      self._current_offset += size
+    read_count = self._decoded_data_buffer.ReadInto(buffer_view[:read_size])
+    self._current_offset += read_count
 
-    return decoded_data
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -297,6 +589,8 @@ class EncodedStream(file_io.FileIO):
     if whence == os.SEEK_CUR:
       offset += self._current_offset
     elif whence == os.SEEK_END:
+      if self._decoded_stream_size is None:
+        self._decoded_stream_size = self._GetDecodedStreamSize()
       offset += self._decoded_stream_size
     elif whence != os.SEEK_SET:
       raise IOError(u'Unsupported whence.')
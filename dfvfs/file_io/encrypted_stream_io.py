@@ -6,6 +6,7 @@ import os
 from dfvfs.encryption import manager as encryption_manager
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
+from dfvfs.lib import stream_buffer
 from dfvfs.resolver import resolver
 
 
@@ -15,6 +16,10 @@ class EncryptedStream(file_io.FileIO):
   # The size of the encrypted data buffer.
   _ENCRYPTED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The size of the encrypted data read when aligning at a block. Further
+  # encrypted data is read on demand.
+  _ALIGNMENT_READ_SIZE = 64 * 1024
+
   def __init__(
       self, resolver_context, encryption_method=None, file_object=None):
     """Initializes the file-like object.
@@ -36,9 +41,7 @@ class EncryptedStream(file_io.FileIO):
 
     super(EncryptedStream, self).__init__(resolver_context)
     self._current_offset = 0
-    self._decrypted_data = b''
-    self._decrypted_data_offset = 0
-    self._decrypted_data_size = 0
+    self._decrypted_data_buffer = stream_buffer.StreamBuffer()
     self._decrypted_stream_size = None
     self._decrypter = None
     self._encrypted_data = b''
@@ -64,7 +67,7 @@ class EncryptedStream(file_io.FileIO):
       self._file_object = None
 
     self._decrypter = None
-    self._decrypted_data = b''
+    self._decrypted_data_buffer.Clear()
     self._encrypted_data = b''
 
   def _GetDecrypter(self):
@@ -85,10 +88,21 @@ class EncryptedStream(file_io.FileIO):
 
   def _GetDecryptedStreamSize(self):
     """Retrieves the decrypted stream size."""
+    decrypter = self._GetDecrypter()
+
+    # The size of the decrypted stream of block ciphers and stream ciphers
+    # follows from the size of the encrypted stream.
+    decrypted_stream_size = decrypter.GetDecryptedDataSize(
+        self._file_object.get_size())
+    if decrypted_stream_size is not None:
+      return decrypted_stream_size
+
     self._file_object.seek(0, os.SEEK_SET)
 
-    self._decrypter = self._GetDecrypter()
-    self._decrypted_data = b''
+    self._decrypter = decrypter
+    self._decrypted_data_buffer.Clear()
+    self._realign_offset = True
+    self._encrypted_data = b''
 
     encrypted_data_offset = 0
     encrypted_data_size = self._file_object.get_size()
@@ -100,7 +114,8 @@ class EncryptedStream(file_io.FileIO):
         break
 
       encrypted_data_offset += read_count
-      decrypted_stream_size += self._decrypted_data_size
+      decrypted_stream_size += self._decrypted_data_buffer.size
+      self._decrypted_data_buffer.Clear()
 
     return decrypted_stream_size
 
@@ -139,13 +154,25 @@ class EncryptedStream(file_io.FileIO):
   def _AlignDecryptedDataOffset(self, decrypted_data_offset):
     """Aligns the encrypted file with the decrypted data offset.
 
+    If the decrypter supports random access the encrypted data is read from
+    the start of the block that contains the decrypted data offset, otherwise
+    the encrypted data is decrypted from the start.
+
     Args:
       decrypted_data_offset: the decrypted data offset.
     """
+    if self._decrypter is None:
+      self._decrypter = self._GetDecrypter()
+
+    if self._decrypter.SupportsRandomAccess():
+      self._AlignDecryptedDataOffsetAtBlock(decrypted_data_offset)
+      return
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decrypter = self._GetDecrypter()
-    self._decrypted_data = b''
+    self._decrypted_data_buffer.Clear()
+    self._encrypted_data = b''
 
     encrypted_data_offset = 0
     encrypted_data_size = self._file_object.get_size()
@@ -157,11 +184,86 @@ class EncryptedStream(file_io.FileIO):
 
       encrypted_data_offset += read_count
 
-      if decrypted_data_offset < self._decrypted_data_size:
-        self._decrypted_data_offset = decrypted_data_offset
+      decrypted_data_offset -= self._decrypted_data_buffer.Skip(
+          decrypted_data_offset)
+      if decrypted_data_offset == 0:
         break
 
-      decrypted_data_offset -= self._decrypted_data_size
+  def _AlignDecryptedDataOffsetAtBlock(self, decrypted_data_offset):
+    """Aligns the encrypted file with the decrypted data offset at a block.
+
+    The decrypted and encrypted data of a block cipher that supports random
+    access have the same offsets. The decrypter only needs the encrypted
+    block that precedes the block that contains the decrypted data offset.
+
+    Args:
+      decrypted_data_offset: the decrypted data offset.
+    """
+    block_size = self._decrypter.block_size
+    block_offset = decrypted_data_offset - (decrypted_data_offset % block_size)
+
+    if block_offset == 0:
+      self._file_object.seek(0, os.SEEK_SET)
+      previous_encrypted_block = None
+
+    else:
+      self._file_object.seek(block_offset - block_size, os.SEEK_SET)
+      previous_encrypted_block = self._file_object.read(block_size)
+
+    self._decrypter.SetPreviousEncryptedBlock(previous_encrypted_block)
+    self._decrypted_data_buffer.Clear()
+    self._encrypted_data = b''
+
+    self._ReadEncryptedData(self._ALIGNMENT_READ_SIZE)
+    self._decrypted_data_buffer.Skip(decrypted_data_offset - block_offset)
+
+  def _BufferDecryptedData(self, size):
+    """Buffers decrypted data at the current offset.
+
+    Args:
+      size (int): number of bytes to buffer, where None represents all
+          the remaining data.
+
+    Returns:
+      int: number of bytes to read, which is smaller than the requested size
+          if less data remains.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the current
+          offset or decrypted stream size is invalid.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._decrypted_stream_size is None:
+      self._decrypted_stream_size = self._GetDecryptedStreamSize()
+
+    if self._decrypted_stream_size < 0:
+      raise IOError(u'Invalid decrypted stream size.')
+
+    if self._current_offset >= self._decrypted_stream_size:
+      return 0
+
+    if self._realign_offset:
+      self._AlignDecryptedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    if size is None:
+      size = self._decrypted_stream_size
+    if self._current_offset + size > self._decrypted_stream_size:
+      size = self._decrypted_stream_size - self._current_offset
+
+    while self._decrypted_data_buffer.size < size:
+      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
+      if read_count == 0:
+        break
+
+    return size
 
   def _ReadEncryptedData(self, read_size):
     """Reads encrypted data from the file-like object.
@@ -176,12 +278,13 @@ class EncryptedStream(file_io.FileIO):
 
     read_count = len(encrypted_data)
 
-    self._encrypted_data = b''.join([self._encrypted_data, encrypted_data])
+    if self._encrypted_data:
+      encrypted_data = b''.join([self._encrypted_data, encrypted_data])
 
-    self._decrypted_data, self._encrypted_data = (
-        self._decrypter.Decrypt(self._encrypted_data))
+    decrypted_data, self._encrypted_data = self._decrypter.Decrypt(
+        encrypted_data)
 
-    self._decrypted_data_size = len(self._decrypted_data)
+    self._decrypted_data_buffer.Append(decrypted_data)
 
     return read_count
 
@@ -227,68 +330,34 @@ class EncryptedStream(file_io.FileIO):
     Raises:
       IOError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError(u'Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError(
-          u'Invalid current offset: {0:d} value less than zero.'.format(
-              self._current_offset))
-
-    if self._decrypted_stream_size is None:
-      self._decrypted_stream_size = self._GetDecryptedStreamSize()
-
-    if self._decrypted_stream_size < 0:
-      raise IOError(u'Invalid decrypted stream size.')
-
-    if self._current_offset >= self._decrypted_stream_size:
-      return b''
+    read_size = self._BufferDecryptedData(size)
 
-    if self._realign_offset:
-      self._AlignDecryptedDataOffset(self._current_offset)
-      self._realign_offset = False
-
-    if size is None:
-      size = self._decrypted_stream_size
-    if self._current_offset + size > self._decrypted_stream_size:
-      size = self._decrypted_stream_size - self._current_offset
-
-    decrypted_data = b''
-
-    if size == 0:
-      return decrypted_data
-
-    while size > self._decrypted_data_size:
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[self._decrypted_data_offset:]])
-
-      remaining_decrypted_data_size = (
-          self._decrypted_data_size - self._decrypted_data_offset)
+    decrypted_data = self._decrypted_data_buffer.Read(read_size)
+    self._current_offset += len(decrypted_data)
 
-      self._current_offset += remaining_decrypted_data_size
-      size -= remaining_decrypted_data_size
+    return decrypted_data
 
-      if self._current_offset >= self._decrypted_stream_size:
-        break
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a preallocated buffer.
 
-      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-      self._decrypted_data_offset = 0
-      if read_count == 0:
-        break
+    Args:
+      buffer (bytearray): buffer to read the data into, which can also be
+          another writable bytes-like object, such as a memoryview.
 
-    if size > 0:
-      slice_start_offset = self._decrypted_data_offset
-      slice_end_offset = slice_start_offset + size
+    Returns:
+      int: number of bytes read, which is smaller than the size of the buffer
+          if less data remains.
 
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[slice_start_offset:slice_end_offset]])
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+    read_size = self._BufferDecryptedData(len(buffer_view))
 
-      self._decrypted_data_offset += size
-      self._current_offset += size
+    read_count = self._decrypted_data_buffer.ReadInto(buffer_view[:read_size])
+    self._current_offset += read_count
 
-    return decrypted_data
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -312,6 +381,8 @@ class EncryptedStream(file_io.FileIO):
     if whence == os.SEEK_CUR:
       offset += self._current_offset
     elif whence == os.SEEK_END:
+      if self._decrypted_stream_size is None:
+        self._decrypted_stream_size = self._GetDecryptedStreamSize()
       offset += self._decrypted_stream_size
     elif whence != os.SEEK_SET:
       raise IOError(u'Unsupported whence.')
@@ -4,6 +4,8 @@
 import abc
 import os
 
+from dfvfs.lib import definitions
+
 
 # Since this class implements the file-like object interface
 # the names of the interface functions are in lower case as an exception
@@ -47,6 +49,97 @@ class FileIO(object):
       ValueError: if the path specification is invalid.
     """
 
+  def _AppendAllocatedRange(self, allocated_ranges, offset, size):
+    """Appends an allocated range, merging it with the last one if adjacent.
+
+    Args:
+      allocated_ranges (list[tuple[int, int]]): offset and size of
+          the allocated ranges, sorted by offset.
+      offset (int): offset of the range.
+      size (int): size of the range.
+    """
+    if size <= 0:
+      return
+
+    if allocated_ranges:
+      last_offset, last_size = allocated_ranges[-1]
+      if offset <= last_offset + last_size:
+        allocated_ranges[-1] = (
+            last_offset, max(last_size, offset + size - last_offset))
+        return
+
+    allocated_ranges.append((offset, size))
+
+  def _GetAllocatedRangesFromExtents(self, extents):
+    """Retrieves the allocated ranges from the extents of a data stream.
+
+    Args:
+      extents (list[Extent]): extents of the data stream.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset.
+    """
+    size = self.get_size()
+
+    # The sparse parts of compressed data are part of the compression
+    # hence only sparse data that is not compressed is not allocated.
+    if any(extent.extent_type == definitions.EXTENT_TYPE_COMPRESSED
+           for extent in extents):
+      extents = []
+
+    allocated_ranges = []
+    offset = 0
+    for extent in extents:
+      if offset >= size:
+        break
+
+      extent_size = min(extent.size, size - offset)
+      if extent.extent_type != definitions.EXTENT_TYPE_SPARSE:
+        self._AppendAllocatedRange(allocated_ranges, offset, extent_size)
+
+      offset += extent_size
+
+    # Data that is not described by the extents, such as resident data,
+    # is considered allocated.
+    self._AppendAllocatedRange(allocated_ranges, offset, size - offset)
+    return allocated_ranges
+
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    Data outside the allocated ranges is not stored, such as the holes of
+    a sparse file or the unallocated clusters of a storage media image, and
+    is read as zero bytes, hence consumers do not need to read it.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset. By default all the data is considered allocated.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    allocated_ranges = []
+    self._AppendAllocatedRange(allocated_ranges, 0, self.get_size())
+    return allocated_ranges
+
+  def CloseDereferenced(self):
+    """Closes a dereferenced file-like object that was retained by the cache.
+
+    A dereferenced file-like object remains cached, with its resources open,
+    until it is evicted from the cache, after which the resolver context
+    closes it.
+
+    Raises:
+      IOError: if the file-like object is open or was not retained by
+               the cache.
+    """
+    if self._is_open or not self._is_cached:
+      raise IOError(u'Not a dereferenced file-like object.')
+
+    self._is_cached = False
+    self._Close()
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -63,13 +156,25 @@ class FileIO(object):
       PathSpecError: if the path specification is incorrect.
       ValueError: if the path specification or mode is invalid.
     """
-    if self._is_open and not self._is_cached:
+    cached_file_object = None
+    if self._is_cached and path_spec:
+      cached_file_object = self._resolver_context.GetFileObject(path_spec)
+
+    if self._is_open and cached_file_object is not self:
       raise IOError(u'Already open.')
 
     if mode != 'rb':
       raise ValueError(u'Unsupport mode: {0:s}.'.format(mode))
 
-    if not self._is_open:
+    # A dereferenced file-like object that remained cached is evicted
+    # from the cache and closed when it is opened with a different path
+    # specification.
+    if (self._is_cached and not self._is_open and
+        cached_file_object is not self):
+      self._resolver_context.EvictFileObject(self)
+      self.CloseDereferenced()
+
+    if not self._is_open and not self._is_cached:
       self._Open(path_spec=path_spec, mode=mode)
       self._is_open = True
 
@@ -77,12 +182,21 @@ class FileIO(object):
         self._resolver_context.CacheFileObject(path_spec, self)
         self._is_cached = True
 
+    elif not self._is_open:
+      # A dereferenced file-like object that remained cached is reused
+      # as if it was newly opened.
+      self._is_open = True
+      self.seek(0, os.SEEK_SET)
+
     if self._is_cached:
       self._resolver_context.GrabFileObject(path_spec)
 
   def close(self):
     """Closes the file-like object.
 
+    A cached file-like object that is no longer referenced remains open
+    internally, so that it can be reused, but can no longer be read from.
+
     Raises:
       IOError: if the file-like object was not opened or the close failed.
     """
@@ -101,6 +215,9 @@ class FileIO(object):
       self._Close()
       self._is_open = False
 
+    elif not self._resolver_context.IsFileObjectReferenced(self):
+      self._is_open = False
+
   @abc.abstractmethod
   def read(self, size=None):
     """Reads a byte string from the file-like object at the current offset.
@@ -119,6 +236,31 @@ class FileIO(object):
       IOError: if the read failed.
     """
 
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a preallocated buffer.
+
+    The data is read at the current offset. File-like objects that buffer
+    data, such as streams, copy the data directly into the buffer.
+
+    Args:
+      buffer (bytearray): buffer to read the data into, which can also be
+          another writable bytes-like object, such as a memoryview.
+
+    Returns:
+      int: number of bytes read, which is smaller than the size of the buffer
+          if less data remains.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+
+    data = self.read(len(buffer_view))
+    read_count = len(data)
+
+    buffer_view[:read_count] = data
+    return read_count
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
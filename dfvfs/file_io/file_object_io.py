@@ -3,6 +3,7 @@
 
 import abc
 import os
+import struct
 
 from dfvfs.file_io import file_io
 
@@ -74,6 +75,34 @@ class FileObjectIO(file_io.FileIO):
       PathSpecError: if the path specification is incorrect.
     """
 
+  def _ReadTable(self, file_object, offset, number_of_entries, entry_format):
+    """Reads a table of references.
+
+    Args:
+      file_object (FileIO): file-like object.
+      offset (int): offset of the table.
+      number_of_entries (int): number of entries in the table.
+      entry_format (str): struct format of an entry, such as ">Q", which must be
+          a byte string on Python 2.
+
+    Returns:
+      tuple[int]: entries of the table.
+
+    Raises:
+      IOError: if the table cannot be read.
+    """
+    table_format = '{0:s}{1:d}{2:s}'.format(
+        entry_format[0], number_of_entries, entry_format[1:])
+    table_size = struct.calcsize(table_format)
+
+    file_object.seek(offset, os.SEEK_SET)
+    table_data = file_object.read(table_size)
+    if len(table_data) != table_size:
+      raise IOError(u'Unable to read table at offset: 0x{0:08x}.'.format(
+          offset))
+
+    return struct.unpack(table_format, table_data)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -21,12 +21,16 @@ class NTFSFile(file_io.FileIO):
       resolver_context: the resolver context (instance of resolver.Context).
     """
     super(NTFSFile, self).__init__(resolver_context)
+    self._data_stream = None
+    self._file_entry = None
     self._file_system = None
     self._fsntfs_data_stream = None
     self._fsntfs_file_entry = None
 
   def _Close(self):
     """Closes the file-like object."""
+    self._data_stream = None
+    self._file_entry = None
     self._fsntfs_data_stream = None
     self._fsntfs_file_entry = None
 
@@ -73,9 +77,30 @@ class NTFSFile(file_io.FileIO):
     elif not fsntfs_file_entry.has_default_data_stream():
       raise IOError(u'Missing default data stream.')
 
+    self._data_stream = data_stream
+    self._file_entry = file_entry
     self._fsntfs_data_stream = fsntfs_data_stream
     self._fsntfs_file_entry = fsntfs_file_entry
 
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    The holes of a sparse data stream are not allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    extents = self._file_entry.GetExtents(
+        data_stream_name=self._data_stream or u'')
+    return self._GetAllocatedRangesFromExtents(extents)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
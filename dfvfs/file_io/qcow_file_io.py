@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """The QCOW image file-like object."""
 
+import os
+
+import construct
 import pyqcow
 
 from dfvfs import dependencies
@@ -15,6 +18,157 @@ dependencies.CheckModuleVersion(u'pyqcow')
 class QCOWFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object using pyqcow."""
 
+  _FILE_HEADER_STRUCT = construct.Struct(
+      u'file_header',
+      construct.UBInt32(u'signature'),
+      construct.UBInt32(u'format_version'))
+
+  _FILE_HEADER_V1_STRUCT = construct.Struct(
+      u'file_header_v1',
+      construct.UBInt64(u'backing_filename_offset'),
+      construct.UBInt32(u'backing_filename_size'),
+      construct.UBInt32(u'modification_time'),
+      construct.UBInt64(u'media_size'),
+      construct.UBInt8(u'number_of_cluster_block_bits'),
+      construct.UBInt8(u'number_of_level2_table_bits'),
+      construct.UBInt16(u'unknown1'),
+      construct.UBInt32(u'encryption_method'),
+      construct.UBInt64(u'level1_table_offset'))
+
+  _FILE_HEADER_V2_STRUCT = construct.Struct(
+      u'file_header_v2',
+      construct.UBInt64(u'backing_filename_offset'),
+      construct.UBInt32(u'backing_filename_size'),
+      construct.UBInt32(u'number_of_cluster_block_bits'),
+      construct.UBInt64(u'media_size'),
+      construct.UBInt32(u'encryption_method'),
+      construct.UBInt32(u'number_of_level1_table_references'),
+      construct.UBInt64(u'level1_table_offset'))
+
+  _FILE_SIGNATURE = 0x514649fb
+
+  _V1_COMPRESSED_FLAG = 0x8000000000000000
+  _V1_OFFSET_BITMASK = 0x7fffffffffffffff
+
+  _V2_COMPRESSED_FLAG = 0x4000000000000000
+  _V2_OFFSET_BITMASK = 0x00fffffffffffe00
+  _V3_ZERO_FLAG = 0x0000000000000001
+
+  def __init__(self, resolver_context, file_object=None):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+      file_object: optional file-like object.
+    """
+    super(QCOWFile, self).__init__(resolver_context, file_object=file_object)
+    self._allocated_ranges = None
+    self._image_file_object = None
+
+  def _Close(self):
+    """Closes the file-like object."""
+    super(QCOWFile, self)._Close()
+    self._allocated_ranges = None
+    self._image_file_object = None
+
+  def _GetImageAllocatedRanges(self, file_object):
+    """Retrieves the allocated ranges from the tables of the QCOW image.
+
+    Args:
+      file_object (FileIO): file-like object of the QCOW image.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset or None if they cannot be determined.
+
+    Raises:
+      IOError: if the tables cannot be read.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    try:
+      file_header = self._FILE_HEADER_STRUCT.parse_stream(file_object)
+      if file_header.format_version == 1:
+        file_header_v1 = self._FILE_HEADER_V1_STRUCT.parse_stream(file_object)
+      elif file_header.format_version in (2, 3):
+        file_header_v2 = self._FILE_HEADER_V2_STRUCT.parse_stream(file_object)
+      else:
+        return
+
+    except construct.FieldError as exception:
+      raise IOError(u'Unable to parse file header with error: {0!s}'.format(
+          exception))
+
+    if file_header.signature != self._FILE_SIGNATURE:
+      raise IOError(u'Unsupported file signature.')
+
+    if file_header.format_version == 1:
+      backing_filename_offset = file_header_v1.backing_filename_offset
+      cluster_block_bits = file_header_v1.number_of_cluster_block_bits
+      level2_table_bits = file_header_v1.number_of_level2_table_bits
+      level1_table_offset = file_header_v1.level1_table_offset
+      media_size = file_header_v1.media_size
+
+      compressed_flag = self._V1_COMPRESSED_FLAG
+      level1_offset_bitmask = self._V1_OFFSET_BITMASK
+      level2_offset_bitmask = self._V1_OFFSET_BITMASK
+      zero_flag = 0
+
+      level1_table_size, remainder = divmod(
+          media_size, 1 << (cluster_block_bits + level2_table_bits))
+      if remainder:
+        level1_table_size += 1
+
+    else:
+      backing_filename_offset = file_header_v2.backing_filename_offset
+      cluster_block_bits = file_header_v2.number_of_cluster_block_bits
+      level2_table_bits = cluster_block_bits - 3
+      level1_table_offset = file_header_v2.level1_table_offset
+      level1_table_size = file_header_v2.number_of_level1_table_references
+      media_size = file_header_v2.media_size
+
+      compressed_flag = self._V2_COMPRESSED_FLAG
+      level1_offset_bitmask = self._V2_OFFSET_BITMASK
+      level2_offset_bitmask = self._V2_OFFSET_BITMASK
+      if file_header.format_version == 3:
+        zero_flag = self._V3_ZERO_FLAG
+      else:
+        zero_flag = 0
+
+    # The data of unallocated clusters is read from the backing file.
+    if backing_filename_offset:
+      return
+
+    cluster_block_size = 1 << cluster_block_bits
+    level2_table_size = 1 << level2_table_bits
+
+    level1_table = self._ReadTable(
+        file_object, level1_table_offset, level1_table_size, '>Q')
+
+    allocated_ranges = []
+    for level1_index, level1_reference in enumerate(level1_table):
+      level2_table_offset = level1_reference & level1_offset_bitmask
+      if not level2_table_offset:
+        continue
+
+      level2_table = self._ReadTable(
+          file_object, level2_table_offset, level2_table_size, '>Q')
+
+      offset = (level1_index * level2_table_size) << cluster_block_bits
+      for level2_reference in level2_table:
+        if offset >= media_size:
+          break
+
+        if level2_reference & compressed_flag or (
+            level2_reference & level2_offset_bitmask and
+            not level2_reference & zero_flag):
+          self._AppendAllocatedRange(
+              allocated_ranges, offset,
+              min(cluster_block_size, media_size - offset))
+
+        offset += cluster_block_size
+
+    return allocated_ranges
+
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
 
@@ -35,8 +189,45 @@ class QCOWFile(file_object_io.FileObjectIO):
         path_spec.parent, resolver_context=self._resolver_context)
     qcow_file = pyqcow.file()
     qcow_file.open_file_object(file_object)
+
+    self._image_file_object = file_object
     return qcow_file
 
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    The clusters that are not allocated in the QCOW image are not allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the tables
+          of the QCOW image cannot be read.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._allocated_ranges is None:
+      allocated_ranges = None
+      if self._image_file_object:
+        # Note that pyqcow reads the same file-like object hence the current
+        # offset is restored.
+        current_offset = self._image_file_object.get_offset()
+        try:
+          allocated_ranges = self._GetImageAllocatedRanges(
+              self._image_file_object)
+        finally:
+          self._image_file_object.seek(current_offset, os.SEEK_SET)
+
+      if allocated_ranges is None:
+        allocated_ranges = super(QCOWFile, self).GetAllocatedRanges()
+
+      self._allocated_ranges = allocated_ranges
+
+    return list(self._allocated_ranges)
+
   def get_size(self):
     """Returns the size of the file-like object.
 
@@ -20,6 +20,8 @@ class TSKFile(file_io.FileIO):
     """
     super(TSKFile, self).__init__(resolver_context)
     self._current_offset = 0
+    self._data_stream = None
+    self._file_entry = None
     self._file_system = None
     self._size = 0
     self._tsk_attribute = None
@@ -27,6 +29,8 @@ class TSKFile(file_io.FileIO):
 
   def _Close(self):
     """Closes the file-like object."""
+    self._data_stream = None
+    self._file_entry = None
     self._tsk_attribute = None
     self._tsk_file = None
 
@@ -129,6 +133,8 @@ class TSKFile(file_io.FileIO):
       raise IOError(u'Not a regular file.')
 
     self._current_offset = 0
+    self._data_stream = data_stream
+    self._file_entry = file_entry
     self._file_system = file_system
     self._tsk_attribute = tsk_attribute
     self._tsk_file = tsk_file
@@ -138,6 +144,25 @@ class TSKFile(file_io.FileIO):
     else:
       self._size = self._tsk_file.info.meta.size
 
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    The holes of a sparse data stream are not allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    extents = self._file_entry.GetExtents(
+        data_stream_name=self._data_stream or u'')
+    return self._GetAllocatedRangesFromExtents(extents)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
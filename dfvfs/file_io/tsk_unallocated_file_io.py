@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+"""The SleuthKit (TSK) unallocated space file-like object implementation."""
+
+import bisect
+import os
+
+import construct
+import pytsk3
+
+from dfvfs.file_io import file_io
+from dfvfs.lib import errors
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import resolver
+
+
+class TSKUnallocatedFile(file_io.FileIO):
+  """Class that implements a file-like object of unallocated space.
+
+  The unallocated blocks of a file system are determined from its block
+  allocation bitmap and presented as one contiguous stream. The run map
+  translates offsets within the stream to offsets within the volume, which
+  is the file-like object that contains the file system.
+
+  Supported file systems are ext2, ext3, ext4, HFS+ and NTFS.
+  """
+
+  _EXT_SUPERBLOCK_OFFSET = 1024
+
+  _EXT_SUPERBLOCK_STRUCT = construct.Struct(
+      u'ext_superblock',
+      construct.ULInt32(u'number_of_inodes'),
+      construct.ULInt32(u'number_of_blocks'),
+      construct.Padding(12),
+      construct.ULInt32(u'first_data_block_number'),
+      construct.ULInt32(u'block_size_exponent'),
+      construct.Padding(4),
+      construct.ULInt32(u'number_of_blocks_per_block_group'),
+      construct.Padding(20),
+      construct.ULInt16(u'signature'),
+      construct.Padding(34),
+      construct.ULInt32(u'compatible_features'),
+      construct.ULInt32(u'incompatible_features'),
+      construct.ULInt32(u'read_only_compatible_features'),
+      construct.Padding(150),
+      construct.ULInt16(u'group_descriptor_size'),
+      construct.Padding(80),
+      construct.ULInt32(u'number_of_blocks_upper'))
+
+  _EXT_GROUP_DESCRIPTOR_STRUCT = construct.Struct(
+      u'ext_group_descriptor',
+      construct.ULInt32(u'block_bitmap_block_number'),
+      construct.Padding(14),
+      construct.ULInt16(u'block_group_flags'))
+
+  _EXT_GROUP_DESCRIPTOR_64BIT_STRUCT = construct.Struct(
+      u'ext_group_descriptor_64bit',
+      construct.ULInt32(u'block_bitmap_block_number'),
+      construct.Padding(14),
+      construct.ULInt16(u'block_group_flags'),
+      construct.Padding(12),
+      construct.ULInt32(u'block_bitmap_block_number_upper'))
+
+  _EXT_SIGNATURE = 0xef53
+
+  _EXT_BLOCK_GROUP_FLAG_BLOCK_BITMAP_UNINITIALIZED = 0x0002
+  _EXT_INCOMPATIBLE_FEATURE_META_BG = 0x00000010
+  _EXT_INCOMPATIBLE_FEATURE_64BIT = 0x00000080
+  _EXT_READ_ONLY_COMPATIBLE_FEATURE_BIGALLOC = 0x00000200
+
+  _EXT_GROUP_DESCRIPTOR_SIZE = 32
+
+  _EXT_TSK_FS_TYPES = frozenset([
+      pytsk3.TSK_FS_TYPE_EXT2,
+      pytsk3.TSK_FS_TYPE_EXT3,
+      pytsk3.TSK_FS_TYPE_EXT4,
+      pytsk3.TSK_FS_TYPE_EXT_DETECT])
+
+  # The inode of the allocation bitmap file, which is the $Bitmap metadata
+  # file for NTFS and the allocation file for HFS+.
+  _BITMAP_FILE_INODE = 6
+
+  # The size of the data read from the allocation bitmap file at once.
+  _BITMAP_READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(self, resolver_context):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+    """
+    super(TSKUnallocatedFile, self).__init__(resolver_context)
+    self._current_offset = 0
+    self._file_object = None
+    self._run_offsets = []
+    self._runs = []
+    self._size = 0
+
+  def _AppendBitmapBlockRanges(
+      self, block_ranges, bitmap_data, first_block_number, number_of_blocks,
+      most_significant_bit_first=False):
+    """Appends the ranges of unallocated blocks of an allocation bitmap.
+
+    Args:
+      block_ranges (list[tuple[int, int]]): first block number and number
+          of blocks of the unallocated block ranges.
+      bitmap_data (bytes): allocation bitmap data, where a bit that is set
+          represents an allocated block.
+      first_block_number (int): number of the block that corresponds to
+          the first bit of the allocation bitmap data.
+      number_of_blocks (int): number of blocks represented by the allocation
+          bitmap data, where additional bits are ignored.
+      most_significant_bit_first (Optional[bool]): True if the first block
+          of a byte is represented by the most significant bit.
+    """
+    for byte_index, byte_value in enumerate(bytearray(bitmap_data)):
+      block_index = byte_index * 8
+      if block_index >= number_of_blocks:
+        break
+
+      if byte_value == 0xff:
+        continue
+
+      if byte_value == 0:
+        self._AppendBlockRange(
+            block_ranges, first_block_number + block_index,
+            min(8, number_of_blocks - block_index))
+        continue
+
+      for bit_index in range(min(8, number_of_blocks - block_index)):
+        if most_significant_bit_first:
+          bit_mask = 0x80 >> bit_index
+        else:
+          bit_mask = 1 << bit_index
+
+        if not byte_value & bit_mask:
+          self._AppendBlockRange(
+              block_ranges, first_block_number + block_index + bit_index, 1)
+
+  def _AppendBlockRange(self, block_ranges, block_number, number_of_blocks):
+    """Appends a range of blocks, merging it with the last one if adjacent.
+
+    Args:
+      block_ranges (list[tuple[int, int]]): first block number and number
+          of blocks of the block ranges.
+      block_number (int): first block number of the range.
+      number_of_blocks (int): number of blocks of the range.
+    """
+    if block_ranges:
+      last_block_number, last_number_of_blocks = block_ranges[-1]
+      if last_block_number + last_number_of_blocks == block_number:
+        block_ranges[-1] = (
+            last_block_number, last_number_of_blocks + number_of_blocks)
+        return
+
+    block_ranges.append((block_number, number_of_blocks))
+
+  def _Close(self):
+    """Closes the file-like object."""
+    self._file_object.close()
+    self._file_object = None
+    self._run_offsets = []
+    self._runs = []
+    self._size = 0
+
+  def _GetBitmapFileBlockRanges(
+      self, tsk_fs_info, most_significant_bit_first=False):
+    """Retrieves the unallocated block ranges from an allocation bitmap file.
+
+    Args:
+      tsk_fs_info (pytsk3.FS_Info): TSK file system info.
+      most_significant_bit_first (Optional[bool]): True if the first block
+          of a byte is represented by the most significant bit.
+
+    Returns:
+      list[tuple[int, int]]: first block number and number of blocks of
+          the unallocated block ranges.
+
+    Raises:
+      IOError: if the allocation bitmap file cannot be read.
+    """
+    tsk_file = tsk_fs_info.open_meta(inode=self._BITMAP_FILE_INODE)
+    bitmap_size = tsk_file.info.meta.size
+
+    number_of_blocks = tsk_fs_info.info.block_count
+
+    block_ranges = []
+    bitmap_offset = 0
+    while bitmap_offset < bitmap_size:
+      read_size = min(
+          self._BITMAP_READ_BUFFER_SIZE, bitmap_size - bitmap_offset)
+      bitmap_data = tsk_file.read_random(bitmap_offset, read_size)
+      if len(bitmap_data) != read_size:
+        raise IOError(u'Unable to read allocation bitmap file.')
+
+      block_index = bitmap_offset * 8
+      self._AppendBitmapBlockRanges(
+          block_ranges, bitmap_data, block_index,
+          number_of_blocks - block_index,
+          most_significant_bit_first=most_significant_bit_first)
+
+      bitmap_offset += read_size
+
+    return block_ranges
+
+  def _GetExtBlockRanges(self, file_object):
+    """Retrieves the unallocated block ranges from the ext block bitmaps.
+
+    Args:
+      file_object (FileIO): file-like object that contains the file system.
+
+    Returns:
+      list[tuple[int, int]]: first block number and number of blocks of
+          the unallocated block ranges.
+
+    Raises:
+      IOError: if the superblock, group descriptors or block bitmaps cannot
+          be read or are not supported.
+    """
+    file_object.seek(self._EXT_SUPERBLOCK_OFFSET, os.SEEK_SET)
+    try:
+      superblock = self._EXT_SUPERBLOCK_STRUCT.parse_stream(file_object)
+    except construct.FieldError as exception:
+      raise IOError(u'Unable to parse superblock with error: {0!s}'.format(
+          exception))
+
+    if superblock.signature != self._EXT_SIGNATURE:
+      raise IOError(u'Unsupported superblock signature.')
+
+    if (superblock.read_only_compatible_features &
+        self._EXT_READ_ONLY_COMPATIBLE_FEATURE_BIGALLOC):
+      raise IOError(u'Unsupported file system with allocation clusters.')
+
+    # The group descriptors of a file system with meta block groups are
+    # stored in the first block groups of every meta block group.
+    if (superblock.incompatible_features &
+        self._EXT_INCOMPATIBLE_FEATURE_META_BG):
+      raise IOError(u'Unsupported file system with meta block groups.')
+
+    block_size = 1024 << superblock.block_size_exponent
+    number_of_blocks = superblock.number_of_blocks
+    blocks_per_block_group = superblock.number_of_blocks_per_block_group
+
+    if (superblock.incompatible_features &
+        self._EXT_INCOMPATIBLE_FEATURE_64BIT):
+      group_descriptor_struct = self._EXT_GROUP_DESCRIPTOR_64BIT_STRUCT
+      group_descriptor_size = superblock.group_descriptor_size
+      number_of_blocks |= superblock.number_of_blocks_upper << 32
+    else:
+      group_descriptor_struct = self._EXT_GROUP_DESCRIPTOR_STRUCT
+      group_descriptor_size = self._EXT_GROUP_DESCRIPTOR_SIZE
+
+    if not blocks_per_block_group or (
+        group_descriptor_size < group_descriptor_struct.sizeof()):
+      raise IOError(u'Unsupported block group or group descriptor size.')
+
+    first_data_block_number = superblock.first_data_block_number
+    number_of_block_groups, remainder = divmod(
+        number_of_blocks - first_data_block_number, blocks_per_block_group)
+    if remainder:
+      number_of_block_groups += 1
+
+    group_descriptor_table_offset = (first_data_block_number + 1) * block_size
+
+    block_ranges = []
+    for block_group_index in range(number_of_block_groups):
+      file_object.seek(
+          group_descriptor_table_offset + (
+              block_group_index * group_descriptor_size), os.SEEK_SET)
+      try:
+        group_descriptor = group_descriptor_struct.parse_stream(file_object)
+      except construct.FieldError as exception:
+        raise IOError((
+            u'Unable to parse group descriptor: {0:d} with error: '
+            u'{1!s}').format(block_group_index, exception))
+
+      # Note that the blocks of a block group of which the block bitmap is
+      # not initialized are considered allocated, since the block group can
+      # contain metadata.
+      if (group_descriptor.block_group_flags &
+          self._EXT_BLOCK_GROUP_FLAG_BLOCK_BITMAP_UNINITIALIZED):
+        continue
+
+      block_bitmap_block_number = group_descriptor.block_bitmap_block_number
+      if group_descriptor_struct is self._EXT_GROUP_DESCRIPTOR_64BIT_STRUCT:
+        block_bitmap_block_number |= (
+            group_descriptor.block_bitmap_block_number_upper << 32)
+
+      file_object.seek(block_bitmap_block_number * block_size, os.SEEK_SET)
+      bitmap_data = file_object.read(block_size)
+      if len(bitmap_data) != block_size:
+        raise IOError(
+            u'Unable to read block bitmap of block group: {0:d}.'.format(
+                block_group_index))
+
+      block_number = first_data_block_number + (
+          block_group_index * blocks_per_block_group)
+      self._AppendBitmapBlockRanges(
+          block_ranges, bitmap_data, block_number,
+          min(blocks_per_block_group, number_of_blocks - block_number))
+
+    return block_ranges
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object defined by path specification.
+
+    Args:
+      path_spec: optional path specification (instance of PathSpec).
+      mode: optional file access mode. The default is 'rb' read-only binary.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    if not path_spec:
+      raise ValueError(u'Missing path specification.')
+
+    if not path_spec.HasParent():
+      raise errors.PathSpecError(
+          u'Unsupported path specification without parent.')
+
+    file_system_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=path_spec.parent)
+    file_system = resolver.Resolver.OpenFileSystem(
+        file_system_path_spec, resolver_context=self._resolver_context)
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec.parent, resolver_context=self._resolver_context)
+
+    try:
+      tsk_fs_info = file_system.GetFsInfo()
+      block_size = tsk_fs_info.info.block_size
+
+      if file_system.IsNTFS():
+        block_ranges = self._GetBitmapFileBlockRanges(tsk_fs_info)
+
+      elif file_system.IsHFS():
+        block_ranges = self._GetBitmapFileBlockRanges(
+            tsk_fs_info, most_significant_bit_first=True)
+
+      elif file_system.GetFsType() in self._EXT_TSK_FS_TYPES:
+        # Note that the current offset is restored since the file-like
+        # object is shared with the file system.
+        current_offset = file_object.get_offset()
+        try:
+          block_ranges = self._GetExtBlockRanges(file_object)
+        finally:
+          file_object.seek(current_offset, os.SEEK_SET)
+
+      else:
+        raise IOError(u'Unsupported file system type.')
+
+    except:
+      file_object.close()
+      raise
+
+    finally:
+      file_system.Close()
+
+    self._file_object = file_object
+    self._current_offset = 0
+    self._run_offsets = []
+    self._runs = []
+    self._size = 0
+
+    for block_number, number_of_blocks in block_ranges:
+      self._run_offsets.append(self._size)
+      self._runs.append((
+          self._size, block_number * block_size, number_of_blocks * block_size))
+      self._size += number_of_blocks * block_size
+
+  def GetRuns(self):
+    """Retrieves the run map.
+
+    Returns:
+      list[tuple[int, int, int]]: offset of the run within the unallocated
+          space, offset of the run within the volume and size of the run.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return list(self._runs)
+
+  def GetVolumeOffset(self, offset):
+    """Translates an offset within the unallocated space to the volume.
+
+    Args:
+      offset (int): offset within the unallocated space.
+
+    Returns:
+      int: offset within the volume.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      ValueError: if the offset is outside the unallocated space.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if offset < 0 or offset >= self._size:
+      raise ValueError(u'Offset: {0:d} out of bounds.'.format(offset))
+
+    run_index = bisect.bisect_right(self._run_offsets, offset) - 1
+    run_offset, run_volume_offset, _ = self._runs[run_index]
+    return run_volume_offset + (offset - run_offset)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size: optional integer value containing the number of bytes to read.
+            Default is all remaining data (None).
+
+    Returns:
+      A byte string containing the data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._current_offset >= self._size:
+      return b''
+
+    if size is None or self._current_offset + size > self._size:
+      size = self._size - self._current_offset
+
+    run_index = bisect.bisect_right(
+        self._run_offsets, self._current_offset) - 1
+
+    data_parts = []
+    while size > 0:
+      run_offset, run_volume_offset, run_size = self._runs[run_index]
+      relative_offset = self._current_offset - run_offset
+      read_size = min(size, run_size - relative_offset)
+
+      self._file_object.seek(
+          run_volume_offset + relative_offset, os.SEEK_SET)
+      data = self._file_object.read(read_size)
+      if len(data) != read_size:
+        raise IOError(
+            u'Unable to read data at volume offset: 0x{0:08x}.'.format(
+                run_volume_offset + relative_offset))
+
+      data_parts.append(data)
+      self._current_offset += read_size
+      size -= read_size
+      run_index += 1
+
+    return b''.join(data_parts)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks an offset within the file-like object.
+
+    Args:
+      offset: the offset to seek.
+      whence: optional value that indicates whether offset is an absolute
+              or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError(u'Unsupported whence.')
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Returns the current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Returns the size of the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self._size
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """The VHD image file-like object."""
 
+import os
+
+import construct
 import pyvhdi
 
 from dfvfs import dependencies
@@ -16,6 +19,41 @@ dependencies.CheckModuleVersion(u'pyvhdi')
 class VHDIFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object using pyvhdi."""
 
+  _FILE_FOOTER_STRUCT = construct.Struct(
+      u'file_footer',
+      construct.Bytes(u'signature', 8),
+      construct.UBInt32(u'features'),
+      construct.UBInt32(u'format_version'),
+      construct.UBInt64(u'next_offset'),
+      construct.UBInt32(u'modification_time'),
+      construct.UBInt32(u'creator_application'),
+      construct.UBInt32(u'creator_version'),
+      construct.UBInt32(u'creator_operating_system'),
+      construct.UBInt64(u'disk_size'),
+      construct.UBInt64(u'data_size'),
+      construct.UBInt32(u'disk_geometry'),
+      construct.UBInt32(u'disk_type'))
+
+  _DYNAMIC_DISK_HEADER_STRUCT = construct.Struct(
+      u'dynamic_disk_header',
+      construct.Bytes(u'signature', 8),
+      construct.UBInt64(u'next_offset'),
+      construct.UBInt64(u'block_allocation_table_offset'),
+      construct.UBInt32(u'format_version'),
+      construct.UBInt32(u'number_of_blocks'),
+      construct.UBInt32(u'block_size'))
+
+  _FILE_FOOTER_SIGNATURE = b'conectix'
+  _FILE_FOOTER_SIZE = 512
+
+  _DYNAMIC_DISK_HEADER_SIGNATURE = b'cxsparse'
+
+  _DISK_TYPE_FIXED = 2
+  _DISK_TYPE_DYNAMIC = 3
+  _DISK_TYPE_DIFFERENTIAL = 4
+
+  _UNALLOCATED_BLOCK = 0xffffffff
+
   def __init__(self, resolver_context, file_object=None):
     """Initializes the file-like object.
 
@@ -24,6 +62,7 @@ class VHDIFile(file_object_io.FileObjectIO):
       file_object: optional file-like object.
     """
     super(VHDIFile, self).__init__(resolver_context, file_object=file_object)
+    self._allocated_ranges = None
     self._parent_vhdi_files = []
     self._sub_file_objects = []
 
@@ -37,9 +76,80 @@ class VHDIFile(file_object_io.FileObjectIO):
     for file_object in self._sub_file_objects:
       file_object.close()
 
+    self._allocated_ranges = None
     self._parent_vhdi_files = []
     self._sub_file_objects = []
 
+  def _GetImageAllocatedRanges(self, file_object):
+    """Retrieves the allocated ranges from the tables of a VHD image.
+
+    Args:
+      file_object (FileIO): file-like object of the VHD image.
+
+    Returns:
+      tuple[int, list[tuple[int, int]]]: disk type and offset and size of
+          the allocated ranges, sorted by offset or None if they cannot be
+          determined, such as for VHDX images.
+
+    Raises:
+      IOError: if the tables cannot be read.
+    """
+    file_size = file_object.get_size()
+    if file_size < self._FILE_FOOTER_SIZE:
+      return
+
+    file_object.seek(file_size - self._FILE_FOOTER_SIZE, os.SEEK_SET)
+    try:
+      file_footer = self._FILE_FOOTER_STRUCT.parse_stream(file_object)
+    except construct.FieldError as exception:
+      raise IOError(u'Unable to parse file footer with error: {0!s}'.format(
+          exception))
+
+    if file_footer.signature != self._FILE_FOOTER_SIGNATURE:
+      return
+
+    allocated_ranges = []
+    if file_footer.disk_type == self._DISK_TYPE_FIXED:
+      self._AppendAllocatedRange(allocated_ranges, 0, file_footer.data_size)
+      return file_footer.disk_type, allocated_ranges
+
+    if file_footer.disk_type not in (
+        self._DISK_TYPE_DYNAMIC, self._DISK_TYPE_DIFFERENTIAL):
+      return
+
+    file_object.seek(file_footer.next_offset, os.SEEK_SET)
+    try:
+      dynamic_disk_header = self._DYNAMIC_DISK_HEADER_STRUCT.parse_stream(
+          file_object)
+    except construct.FieldError as exception:
+      raise IOError((
+          u'Unable to parse dynamic disk header with error: '
+          u'{0!s}').format(exception))
+
+    if dynamic_disk_header.signature != self._DYNAMIC_DISK_HEADER_SIGNATURE:
+      raise IOError(u'Unsupported dynamic disk header signature.')
+
+    block_allocation_table = self._ReadTable(
+        file_object, dynamic_disk_header.block_allocation_table_offset,
+        dynamic_disk_header.number_of_blocks, '>I')
+
+    block_size = dynamic_disk_header.block_size
+    offset = 0
+    for sector_number in block_allocation_table:
+      if offset >= file_footer.data_size:
+        break
+
+      # Note that the sector bitmap of an allocated block is not checked
+      # hence the whole block is considered allocated.
+      if sector_number != self._UNALLOCATED_BLOCK:
+        self._AppendAllocatedRange(
+            allocated_ranges, offset,
+            min(block_size, file_footer.data_size - offset))
+
+      offset += block_size
+
+    return file_footer.disk_type, allocated_ranges
+
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
 
@@ -134,6 +244,60 @@ class VHDIFile(file_object_io.FileObjectIO):
     self._parent_vhdi_files.append(vhdi_parent_file)
     self._sub_file_objects.append(file_object)
 
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    The blocks that are not allocated in the VHD image, and its parent
+    images, are not allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the tables
+          of the VHD image cannot be read.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._allocated_ranges is None:
+      image_allocated_ranges = []
+      disk_type = None
+
+      # The sub file-like objects are the VHD image followed by its parent
+      # images. The data of the blocks that are not allocated in
+      # a differential image is read from the parent image.
+      for file_object in self._sub_file_objects:
+        # Note that pyvhdi reads the same file-like object hence the current
+        # offset is restored.
+        current_offset = file_object.get_offset()
+        try:
+          result = self._GetImageAllocatedRanges(file_object)
+        finally:
+          file_object.seek(current_offset, os.SEEK_SET)
+
+        if not result:
+          disk_type = None
+          break
+
+        disk_type, allocated_ranges = result
+        image_allocated_ranges.extend(allocated_ranges)
+        if disk_type != self._DISK_TYPE_DIFFERENTIAL:
+          break
+
+      if disk_type in (self._DISK_TYPE_FIXED, self._DISK_TYPE_DYNAMIC):
+        allocated_ranges = []
+        for offset, size in sorted(image_allocated_ranges):
+          self._AppendAllocatedRange(allocated_ranges, offset, size)
+
+      else:
+        allocated_ranges = super(VHDIFile, self).GetAllocatedRanges()
+
+      self._allocated_ranges = allocated_ranges
+
+    return list(self._allocated_ranges)
+
   def get_size(self):
     """Returns the size of the file-like object.
 
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """The VMDK image file-like object."""
 
+import os
+
+import construct
 import pyvmdk
 
 from dfvfs import dependencies
@@ -16,6 +19,128 @@ dependencies.CheckModuleVersion(u'pyvmdk')
 class VMDKFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object using pyvmdk."""
 
+  _SPARSE_FILE_HEADER_STRUCT = construct.Struct(
+      u'sparse_file_header',
+      construct.Bytes(u'signature', 4),
+      construct.ULInt32(u'format_version'),
+      construct.ULInt32(u'flags'),
+      construct.ULInt64(u'maximum_data_number_of_sectors'),
+      construct.ULInt64(u'sectors_per_grain'),
+      construct.ULInt64(u'descriptor_sector_number'),
+      construct.ULInt64(u'descriptor_number_of_sectors'),
+      construct.ULInt32(u'number_of_grain_table_entries'),
+      construct.ULInt64(u'secondary_grain_directory_sector_number'),
+      construct.ULInt64(u'primary_grain_directory_sector_number'))
+
+  _SPARSE_FILE_SIGNATURE = b'KDMV'
+
+  _BYTES_PER_SECTOR = 512
+
+  _CONTENT_IDENTIFIER_NO_PARENT = 0xffffffff
+
+  # The grain directory is stored at the end of stream optimized extents.
+  _GRAIN_DIRECTORY_AT_END = 0xffffffffffffffff
+
+  _FLAG_HAS_ZERO_GRAINS = 0x00000004
+
+  _ZERO_GRAIN = 1
+
+  def __init__(self, resolver_context, file_object=None):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+      file_object: optional file-like object.
+    """
+    super(VMDKFile, self).__init__(resolver_context, file_object=file_object)
+    self._allocated_ranges = None
+    self._extent_file_objects = []
+
+  def _Close(self):
+    """Closes the file-like object."""
+    super(VMDKFile, self)._Close()
+    self._allocated_ranges = None
+    self._extent_file_objects = []
+
+  def _GetSparseExtentAllocatedRanges(
+      self, file_object, extent_offset, extent_size):
+    """Retrieves the allocated ranges from the tables of a sparse extent.
+
+    Args:
+      file_object (FileIO): file-like object of the sparse extent data file.
+      extent_offset (int): offset of the extent within the image.
+      extent_size (int): size of the extent.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges relative
+          to the start of the image, sorted by offset or None if they cannot
+          be determined.
+
+    Raises:
+      IOError: if the tables cannot be read.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    try:
+      file_header = self._SPARSE_FILE_HEADER_STRUCT.parse_stream(file_object)
+    except construct.FieldError as exception:
+      raise IOError(u'Unable to parse file header with error: {0!s}'.format(
+          exception))
+
+    if file_header.signature != self._SPARSE_FILE_SIGNATURE:
+      return
+
+    grain_directory_sector_number = (
+        file_header.primary_grain_directory_sector_number)
+    if grain_directory_sector_number == self._GRAIN_DIRECTORY_AT_END:
+      return
+
+    if file_header.flags & self._FLAG_HAS_ZERO_GRAINS:
+      minimum_grain_sector_number = self._ZERO_GRAIN + 1
+    else:
+      minimum_grain_sector_number = 1
+
+    grain_size = file_header.sectors_per_grain * self._BYTES_PER_SECTOR
+    grain_table_size = file_header.number_of_grain_table_entries
+    if not grain_size or not grain_table_size:
+      raise IOError(u'Invalid grain size or grain table size.')
+
+    number_of_grains, remainder = divmod(extent_size, grain_size)
+    if remainder:
+      number_of_grains += 1
+
+    number_of_grain_tables, remainder = divmod(
+        number_of_grains, grain_table_size)
+    if remainder:
+      number_of_grain_tables += 1
+
+    grain_directory = self._ReadTable(
+        file_object, grain_directory_sector_number * self._BYTES_PER_SECTOR,
+        number_of_grain_tables, '<I')
+
+    allocated_ranges = []
+    for grain_table_index, grain_table_sector_number in enumerate(
+        grain_directory):
+      if not grain_table_sector_number:
+        continue
+
+      grain_table = self._ReadTable(
+          file_object, grain_table_sector_number * self._BYTES_PER_SECTOR,
+          grain_table_size, '<I')
+
+      offset = grain_table_index * grain_table_size * grain_size
+      for grain_sector_number in grain_table:
+        if offset >= extent_size:
+          break
+
+        if grain_sector_number >= minimum_grain_sector_number:
+          self._AppendAllocatedRange(
+              allocated_ranges, extent_offset + offset,
+              min(grain_size, extent_size - offset))
+
+        offset += grain_size
+
+    return allocated_ranges
+
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
 
@@ -104,8 +229,71 @@ class VMDKFile(file_object_io.FileObjectIO):
     # TODO: add parent image support.
     vmdk_handle.open_extent_data_files_file_objects(file_objects)
 
+    self._extent_file_objects = file_objects
     return vmdk_handle
 
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    The grains that are not allocated in the sparse extents and the zero
+    extents of the VMDK image are not allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated ranges, sorted
+          by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the tables
+          of the VMDK image cannot be read.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._allocated_ranges is None:
+      allocated_ranges = None
+
+      # The data of the grains that are not allocated in an image with
+      # a parent is read from the parent image.
+      if (self._extent_file_objects and
+          self._file_object.parent_content_identifier == (
+              self._CONTENT_IDENTIFIER_NO_PARENT)):
+        allocated_ranges = []
+
+        extent_offset = 0
+        for extent_descriptor, file_object in zip(
+            self._file_object.extent_descriptors, self._extent_file_objects):
+          extent_size = extent_descriptor.size
+
+          extent_allocated_ranges = None
+          if extent_descriptor.type == pyvmdk.extent_types.ZERO:
+            extent_allocated_ranges = []
+
+          elif extent_descriptor.type == pyvmdk.extent_types.SPARSE:
+            # Note that pyvmdk reads the same file-like object hence
+            # the current offset is restored.
+            current_offset = file_object.get_offset()
+            try:
+              extent_allocated_ranges = self._GetSparseExtentAllocatedRanges(
+                  file_object, extent_offset, extent_size)
+            finally:
+              file_object.seek(current_offset, os.SEEK_SET)
+
+          if extent_allocated_ranges is None:
+            self._AppendAllocatedRange(
+                allocated_ranges, extent_offset, extent_size)
+          else:
+            for offset, size in extent_allocated_ranges:
+              self._AppendAllocatedRange(allocated_ranges, offset, size)
+
+          extent_offset += extent_size
+
+      if allocated_ranges is None:
+        allocated_ranges = super(VMDKFile, self).GetAllocatedRanges()
+
+      self._allocated_ranges = allocated_ranges
+
+    return list(self._allocated_ranges)
+
   def get_size(self):
     """Returns the size of the file-like object.
 
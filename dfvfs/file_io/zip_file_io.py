@@ -8,6 +8,7 @@ import os
 import zipfile
 
 from dfvfs.file_io import file_io
+from dfvfs.lib import stream_buffer
 from dfvfs.resolver import resolver
 
 
@@ -28,9 +29,7 @@ class ZipFile(file_io.FileIO):
     self._current_offset = 0
     self._file_system = None
     self._realign_offset = True
-    self._uncompressed_data = b''
-    self._uncompressed_data_offset = 0
-    self._uncompressed_data_size = 0
+    self._uncompressed_data_buffer = stream_buffer.StreamBuffer()
     self._uncompressed_stream_size = None
     self._zip_ext_file = None
     self._zip_file = None
@@ -42,6 +41,7 @@ class ZipFile(file_io.FileIO):
       self._zip_ext_file.close()
       self._zip_ext_file = None
 
+    self._uncompressed_data_buffer.Clear()
     self._zip_file = None
     self._zip_info = None
 
@@ -101,27 +101,70 @@ class ZipFile(file_io.FileIO):
       raise IOError(
           u'Unable to open ZIP file with error: {0:s}'.format(exception))
 
-    self._uncompressed_data = b''
-    self._uncompressed_data_size = 0
-    self._uncompressed_data_offset = 0
+    self._uncompressed_data_buffer.Clear()
 
     while uncompressed_data_offset > 0:
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+      read_count = self._ReadCompressedData(
+          self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
+        break
+
+      uncompressed_data_offset -= self._uncompressed_data_buffer.Skip(
+          uncompressed_data_offset)
+
+  def _BufferUncompressedData(self, size):
+    """Buffers uncompressed data at the current offset.
+
+    Args:
+      size (int): number of bytes to buffer, where None represents all
+          the remaining data.
+
+    Returns:
+      int: number of bytes to read, which is smaller than the requested size
+          if less data remains.
+
+    Raises:
+      IOError: if the file-like object has not been opened, the current
+          offset is invalid or the ZIP file could not be opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(u'Invalid current offset value less than zero.')
+
+    if self._current_offset > self._uncompressed_stream_size:
+      return 0
 
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+    if (size is None or
+        self._current_offset + size > self._uncompressed_stream_size):
+      size = self._uncompressed_stream_size - self._current_offset
+
+    if self._realign_offset:
+      self._AlignUncompressedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    while self._uncompressed_data_buffer.size < size:
+      read_count = self._ReadCompressedData(
+          self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    return size
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
 
     Args:
       read_size: the number of bytes of compressed data to read.
+
+    Returns:
+      int: number of bytes of uncompressed data read.
     """
-    self._uncompressed_data = self._zip_ext_file.read(read_size)
-    self._uncompressed_data_size = len(self._uncompressed_data)
+    uncompressed_data = self._zip_ext_file.read(read_size)
+    self._uncompressed_data_buffer.Append(uncompressed_data)
+
+    return len(uncompressed_data)
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -142,55 +185,35 @@ class ZipFile(file_io.FileIO):
     Raises:
       IOError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError(u'Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError(u'Invalid current offset value less than zero.')
-
-    if self._current_offset > self._uncompressed_stream_size:
-      return b''
-
-    if (size is None or
-        self._current_offset + size > self._uncompressed_stream_size):
-      size = self._uncompressed_stream_size - self._current_offset
+    read_size = self._BufferUncompressedData(size)
 
-    if self._realign_offset:
-      self._AlignUncompressedDataOffset(self._current_offset)
-      self._realign_offset = False
-
-    uncompressed_data = b''
+    uncompressed_data = self._uncompressed_data_buffer.Read(read_size)
+    self._current_offset += len(uncompressed_data)
 
-    # Read in full blocks of uncompressed data.
-    while self._uncompressed_data_offset + size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
-
-      remaining_uncompressed_data_size = (
-          self._uncompressed_data_size - self._uncompressed_data_offset)
-
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
+    return uncompressed_data
 
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a preallocated buffer.
 
-      self._uncompressed_data_offset = 0
+    Args:
+      buffer (bytearray): buffer to read the data into, which can also be
+          another writable bytes-like object, such as a memoryview.
 
-    # Read in partial block of uncompressed data.
-    if (size > 0 and
-        self._uncompressed_data_offset + size <= self._uncompressed_data_size):
-      slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+    Returns:
+      int: number of bytes read, which is smaller than the size of the buffer
+          if less data remains.
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+    Raises:
+      IOError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+    read_size = self._BufferUncompressedData(len(buffer_view))
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+    read_count = self._uncompressed_data_buffer.ReadInto(
+        buffer_view[:read_size])
+    self._current_offset += read_count
 
-    return uncompressed_data
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks an offset within the file-like object.
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""A hasher to calculate message digest hashes of file entries.
+
+The data of the file entries is read by a pool of worker processes, each
+with its own resolver context, and every data stream is read only once
+to calculate all the requested message digest hashes.
+"""
+
+import hashlib
+import os
+
+from dfvfs.lib import errors
+from dfvfs.lib import worker_pool
+from dfvfs.resolver import resolver
+
+
+def _HashDataStream(task, resolver_context=None):
+  """Calculates the message digest hashes of a data stream.
+
+  Args:
+    task: the hash task (instance of FileHashTask).
+    resolver_context: optional resolver context (instance of Context).
+                      The default is None which represents the resolver
+                      context of the worker process.
+
+  Returns:
+    The hash result (instance of FileHashResult).
+  """
+  hash_result = FileHashResult(
+      task.path_spec, data_stream_name=task.data_stream_name,
+      path=task.path)
+
+  if not resolver_context:
+    resolver_context = worker_pool.GetWorkerResolverContext()
+
+  hash_contexts = [
+      (hash_name, hashlib.new(hash_name)) for hash_name in task.hash_names]
+
+  try:
+    if not task.data_stream_name:
+      file_object = resolver.Resolver.OpenFileObject(
+          task.path_spec, resolver_context=resolver_context)
+
+    else:
+      file_entry = resolver.Resolver.OpenFileEntry(
+          task.path_spec, resolver_context=resolver_context)
+      if not file_entry:
+        hash_result.error = u'Missing file entry.'
+        return hash_result
+
+      file_object = file_entry.GetFileObject(
+          data_stream_name=task.data_stream_name)
+
+    if not file_object:
+      hash_result.error = u'Missing file-like object.'
+      return hash_result
+
+    try:
+      for data in _ReadDataStream(file_object, task.read_buffer_size):
+        for _, hash_context in hash_contexts:
+          hash_context.update(data)
+
+    finally:
+      file_object.close()
+
+  except (IOError, OSError, RuntimeError, errors.Error) as exception:
+    hash_result.error = u'{0!s}'.format(exception)
+    return hash_result
+
+  for hash_name, hash_context in hash_contexts:
+    hash_result.hashes[hash_name] = hash_context.hexdigest()
+
+  return hash_result
+
+
+def _ReadDataStream(file_object, read_buffer_size):
+  """Reads the data of a data stream.
+
+  The data outside the allocated ranges of the file-like object, such as
+  the holes of a sparse file, is not read but returned as zero bytes. If
+  the allocated ranges cannot be determined, for example because the tables
+  of a storage media image are corrupted, all the data is read.
+
+  Args:
+    file_object (FileIO): file-like object of the data stream.
+    read_buffer_size (int): size of the data read at once.
+
+  Yields:
+    bytes: data of the data stream.
+  """
+  zero_data = None
+
+  offset = 0
+  file_size = file_object.get_size()
+
+  try:
+    allocated_ranges = file_object.GetAllocatedRanges()
+  except IOError:
+    allocated_ranges = [(0, file_size)]
+
+  allocated_ranges.append((file_size, 0))
+
+  for range_offset, range_size in allocated_ranges:
+    while offset < range_offset:
+      if zero_data is None:
+        zero_data = b'\x00' * read_buffer_size
+
+      zero_data_size = min(read_buffer_size, range_offset - offset)
+      if zero_data_size == read_buffer_size:
+        yield zero_data
+      else:
+        yield zero_data[:zero_data_size]
+
+      offset += zero_data_size
+
+    range_end_offset = range_offset + range_size
+    file_object.seek(range_offset, os.SEEK_SET)
+    while offset < range_end_offset:
+      data = file_object.read(min(
+          read_buffer_size, range_end_offset - offset))
+      if not data:
+        return
+
+      yield data
+      offset += len(data)
+
+
+class FileHashResult(object):
+  """Class that contains the message digest hashes of a data stream.
+
+  Attributes:
+    data_stream_name (str): name of the data stream, where an empty string
+        represents the default data stream.
+    error (str): description of the error that prevented the hashes from
+        being calculated or None if no error occurred.
+    hashes (dict[str, str]): hexadecimal message digest hashes per name
+        of the hash, such as "md5".
+    path (str): full path of the file entry or None if not available.
+    path_spec (PathSpec): path specification of the file entry.
+  """
+
+  def __init__(self, path_spec, data_stream_name=u'', path=None):
+    """Initializes the hash result.
+
+    Args:
+      path_spec (PathSpec): path specification of the file entry.
+      data_stream_name (Optional[str]): name of the data stream, where
+          an empty string represents the default data stream.
+      path (Optional[str]): full path of the file entry.
+    """
+    super(FileHashResult, self).__init__()
+    self.data_stream_name = data_stream_name
+    self.error = None
+    self.hashes = {}
+    self.path = path
+    self.path_spec = path_spec
+
+
+class FileHashTask(object):
+  """Class that defines the data stream a worker needs to hash.
+
+  Attributes:
+    data_stream_name (str): name of the data stream, where an empty string
+        represents the default data stream.
+    hash_names (list[str]): names of the hashes to calculate.
+    path (str): full path of the file entry or None if not available.
+    path_spec (PathSpec): path specification of the data stream.
+    read_buffer_size (int): size of the data read at once.
+  """
+
+  def __init__(
+      self, path_spec, hash_names, read_buffer_size, data_stream_name=u'',
+      path=None):
+    """Initializes the hash task.
+
+    Args:
+      path_spec (PathSpec): path specification of the data stream.
+      hash_names (list[str]): names of the hashes to calculate.
+      read_buffer_size (int): size of the data read at once.
+      data_stream_name (Optional[str]): name of the data stream, where
+          an empty string represents the default data stream.
+      path (Optional[str]): full path of the file entry.
+    """
+    super(FileHashTask, self).__init__()
+    self.data_stream_name = data_stream_name
+    self.hash_names = hash_names
+    self.path = path
+    self.path_spec = path_spec
+    self.read_buffer_size = read_buffer_size
+
+
+class FileHasher(object):
+  """Class that calculates message digest hashes of file entries.
+
+  The hashes are calculated by a pool of worker processes and the results
+  are returned in the order of the file entries. Note that worker processes
+  can only open encrypted volumes if the credentials were set in the key
+  chain of the resolver before the hasher was used and the operating system
+  forks the worker processes.
+  """
+
+  DEFAULT_HASH_NAMES = [u'md5', u'sha1', u'sha256']
+
+  # The default size of the data read at once.
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  # The number of tasks handed to a worker process at once.
+  _TASKS_CHUNK_SIZE = 4
+
+  def __init__(
+      self, hash_names=None, number_of_workers=None, resolver_context=None):
+    """Initializes the hasher.
+
+    Args:
+      hash_names (Optional[list[str]]): names of the hashes to calculate,
+          such as "md5", "sha1" and "sha256". The default is
+          DEFAULT_HASH_NAMES.
+      number_of_workers (Optional[int]): number of worker processes, where
+          None represents the number of CPUs and 0 or 1 calculates the
+          hashes in the current process.
+      resolver_context (Optional[Context]): resolver context used to walk
+          the file system and to calculate the hashes in the current
+          process. The default is None which represents the built-in
+          resolver context.
+
+    Raises:
+      ValueError: if a hash name is not supported or the number of worker
+          processes is invalid.
+    """
+    if not hash_names:
+      hash_names = self.DEFAULT_HASH_NAMES
+
+    for hash_name in hash_names:
+      try:
+        hashlib.new(hash_name)
+      except ValueError:
+        raise ValueError(u'Unsupported hash: {0:s}.'.format(hash_name))
+
+    super(FileHasher, self).__init__()
+    self._hash_names = list(hash_names)
+    self._number_of_workers = worker_pool.GetNumberOfWorkers(
+        number_of_workers)
+    self._resolver_context = resolver_context
+
+  @property
+  def hash_names(self):
+    """list[str]: names of the hashes to calculate."""
+    return list(self._hash_names)
+
+  def _GetFileEntryTasks(self, file_system, file_entry, parent_full_path):
+    """Recursively retrieves the hash tasks starting with a file entry.
+
+    Args:
+      file_system (FileSystem): file system.
+      file_entry (FileEntry): file entry.
+      parent_full_path (str): full path of the parent file entry.
+
+    Yields:
+      FileHashTask: hash task of a data stream.
+    """
+    # Since every file system implementation can have their own path
+    # segment separator we are using JoinPath to be platform and file system
+    # type independent.
+    full_path = file_system.JoinPath([parent_full_path, file_entry.name])
+    for data_stream in file_entry.data_streams:
+      yield FileHashTask(
+          file_entry.path_spec, self._hash_names, self._READ_BUFFER_SIZE,
+          data_stream_name=data_stream.name, path=full_path)
+
+    for sub_file_entry in file_entry.sub_file_entries:
+      for task in self._GetFileEntryTasks(
+          file_system, sub_file_entry, full_path):
+        yield task
+
+  def _GetFileSystemTasks(self, base_path_specs):
+    """Retrieves the hash tasks of file systems.
+
+    Args:
+      base_path_specs (list[PathSpec]): path specifications of the file
+          entries where to start hashing.
+
+    Yields:
+      FileHashTask: hash task of a data stream.
+    """
+    for base_path_spec in base_path_specs:
+      file_system = resolver.Resolver.OpenFileSystem(
+          base_path_spec, resolver_context=self._resolver_context)
+      try:
+        file_entry = resolver.Resolver.OpenFileEntry(
+            base_path_spec, resolver_context=self._resolver_context)
+        if file_entry is None:
+          yield FileHashTask(
+              base_path_spec, self._hash_names, self._READ_BUFFER_SIZE)
+          continue
+
+        for task in self._GetFileEntryTasks(file_system, file_entry, u''):
+          yield task
+
+      finally:
+        file_system.Close()
+
+  def _HashTasks(self, tasks):
+    """Calculates the hashes of the data streams of hash tasks.
+
+    Args:
+      tasks (iterable[FileHashTask]): hash tasks.
+
+    Yields:
+      FileHashResult: hash result of a data stream, in the order of the
+          hash tasks.
+    """
+    if self._number_of_workers <= 1:
+      for task in tasks:
+        yield _HashDataStream(task, resolver_context=self._resolver_context)
+      return
+
+    for hash_result in worker_pool.Map(
+        _HashDataStream, tasks, self._number_of_workers,
+        chunk_size=self._TASKS_CHUNK_SIZE):
+      yield hash_result
+
+  def HashFileSystems(self, base_path_specs):
+    """Recursively calculates hashes starting with base path specifications.
+
+    Every data stream of every file entry is hashed, where file entries are
+    walked in the current process while the data is hashed by the workers.
+
+    Args:
+      base_path_specs (list[PathSpec]): path specifications of the file
+          entries where to start hashing.
+
+    Yields:
+      FileHashResult: hash result of a data stream, in the order of the
+          file entries.
+    """
+    tasks = self._GetFileSystemTasks(base_path_specs)
+    for hash_result in self._HashTasks(tasks):
+      yield hash_result
+
+  def HashPathSpecs(self, path_specs):
+    """Calculates hashes of the default data streams of path specifications.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications.
+
+    Yields:
+      FileHashResult: hash result of a data stream, in the order of the
+          path specifications.
+    """
+    tasks = (
+        FileHashTask(path_spec, self._hash_names, self._READ_BUFFER_SIZE)
+        for path_spec in path_specs)
+    for hash_result in self._HashTasks(tasks):
+      yield hash_result
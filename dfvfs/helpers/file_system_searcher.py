@@ -8,7 +8,42 @@ import sre_constants
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import py2to3
+from dfvfs.lib import worker_pool
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver
+
+
+def _FindInSubtree(task):
+  """Searches for matching file entries within a subtree.
+
+  The file system is not closed, so that it remains cached in the resolver
+  context of the worker for the subtrees that are searched next.
+
+  Args:
+    task: a tuple containing the path specification of the file entry at
+          the root of the subtree (instance of PathSpec), a list of the
+          find specifications trie nodes (instances of FindSpecsTrieNode)
+          that match the file entry and a list of the find specifications
+          without a location (instances of FindSpec).
+
+  Returns:
+    A list of the path specifications of the matching file entries
+    (instances of PathSpec).
+  """
+  path_spec, trie_nodes, find_specs_without_location = task
+
+  file_system = resolver.Resolver.OpenFileSystem(
+      path_spec, resolver_context=worker_pool.GetWorkerResolverContext())
+  file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+  if not file_entry:
+    return []
+
+  searcher = FileSystemSearcher(file_system, path_spec)
+  # pylint: disable=protected-access
+  return [
+      matching_file_entry.path_spec
+      for matching_file_entry in searcher._FindInFileEntry(
+          file_entry, trie_nodes, find_specs_without_location)]
 
 
 class FindSpec(object):
@@ -16,9 +51,16 @@ class FindSpec(object):
 
   def __init__(
       self, file_entry_types=None, is_allocated=True, location=None,
-      location_glob=None, location_regex=None, case_sensitive=True):
+      location_glob=None, location_regex=None, case_sensitive=True,
+      creation_time_range=None, extensions=None, inode_range=None,
+      modification_time_range=None, size_range=None):
     """Initializes the find specification object.
 
+    The criteria are checked in order of the cost of retrieving the values
+    they match: first the name of the file entry and then the values of
+    its stat object. None of the criteria require reading the data of
+    the file entry.
+
     Args:
       file_entry_types: optional file entry types list or None to indicate
                         no preference.
@@ -44,12 +86,29 @@ class FindSpec(object):
                       separator.
       case_sensitive: optional boolean value to indicate string matches should
                       be case sensitive.
+      creation_time_range: optional tuple of the minimum and maximum creation
+                           time, as POSIX timestamps in seconds, or None to
+                           indicate no preference. Either bound can be None
+                           to indicate it is open. The bounds are inclusive.
+      extensions: optional list of file name extensions, such as "exe", or
+                  None to indicate no preference.
+      inode_range: optional tuple of the minimum and maximum inode number,
+                   or None to indicate no preference. Either bound can be
+                   None to indicate it is open. The bounds are inclusive.
+      modification_time_range: optional tuple of the minimum and maximum
+                               modification time, as POSIX timestamps in
+                               seconds, or None to indicate no preference.
+                               Either bound can be None to indicate it is
+                               open. The bounds are inclusive.
+      size_range: optional tuple of the minimum and maximum size in bytes,
+                  or None to indicate no preference. Either bound can be
+                  None to indicate it is open. The bounds are inclusive.
 
     Raises:
       TypeError: if the location, location_glob or location_regex type
                  is not supported.
       ValueError: if the location, location_glob or location_regex arguments
-                  are used at the same time.
+                  are used at the same time or if a range is invalid.
     """
     if (location is not None and location_glob is not None and
         location_regex is not None):
@@ -57,7 +116,19 @@ class FindSpec(object):
           u'The location, location_glob and location_regex arguments cannot '
           u'be used at same time.'))
 
+    for range_name, value_range in (
+        (u'creation_time_range', creation_time_range),
+        (u'inode_range', inode_range),
+        (u'modification_time_range', modification_time_range),
+        (u'size_range', size_range)):
+      self._CheckRangeArgument(range_name, value_range)
+
     super(FindSpec, self).__init__()
+    self._creation_time_range = creation_time_range
+    self._extensions = None
+    self._inode_range = inode_range
+    self._modification_time_range = modification_time_range
+    self._size_range = size_range
     self._file_entry_types = file_entry_types
     self._is_allocated = is_allocated
     self._is_case_sensitive = case_sensitive
@@ -65,7 +136,11 @@ class FindSpec(object):
     self._location = None
     self._location_regex = None
     self._location_segments = None
-    self._number_of_location_segments = 0
+
+    if extensions is not None:
+      if not case_sensitive:
+        extensions = [extension.lower() for extension in extensions]
+      self._extensions = frozenset(extensions)
 
     if location is not None:
       if isinstance(location, py2to3.STRING_TYPES):
@@ -113,11 +188,49 @@ class FindSpec(object):
     # TODO: add support for name
     # TODO: add support for owner (user, group)
     # TODO: add support for permissions (mode)
-    # TODO: add support for size
-    # TODO: add support for time values
     # TODO: add support for expression e.g.
     # attribute['$FILE_NAME'].creation_type == 'x'
 
+  def _CheckCreationTime(self, file_entry):
+    """Checks the creation_time_range find specification.
+
+    Args:
+      file_entry: the file entry (instance of FileEntry).
+
+    Returns:
+      True if the file entry matches the find specification, False if not or
+      None if no creation time range is defined.
+    """
+    if self._creation_time_range is None:
+      return
+
+    stat_object = file_entry.GetStat()
+    return self._CheckRange(
+        getattr(stat_object, u'crtime', None), self._creation_time_range)
+
+  def _CheckExtension(self, file_entry):
+    """Checks the extensions find specification.
+
+    Args:
+      file_entry: the file entry (instance of FileEntry).
+
+    Returns:
+      True if the file entry matches the find specification, False if not or
+      None if no extensions are defined.
+    """
+    if self._extensions is None:
+      return
+
+    name = file_entry.name
+    if not name or u'.' not in name:
+      return False
+
+    _, _, extension = name.rpartition(u'.')
+    if not self._is_case_sensitive:
+      extension = extension.lower()
+
+    return extension in self._extensions
+
   def _CheckFileEntryType(self, file_entry):
     """Checks the file entry type find specifications.
 
@@ -138,6 +251,23 @@ class FindSpec(object):
             self._CheckIsPipe(file_entry) or
             self._CheckIsSocket(file_entry))
 
+  def _CheckInode(self, file_entry):
+    """Checks the inode_range find specification.
+
+    Args:
+      file_entry: the file entry (instance of FileEntry).
+
+    Returns:
+      True if the file entry matches the find specification, False if not or
+      None if no inode range is defined.
+    """
+    if self._inode_range is None:
+      return
+
+    stat_object = file_entry.GetStat()
+    return self._CheckRange(
+        getattr(stat_object, u'ino', None), self._inode_range)
+
   def _CheckIsAllocated(self, file_entry):
     """Checks the is_allocated find specification.
 
@@ -230,92 +360,146 @@ class FindSpec(object):
       return False
     return file_entry.IsSocket()
 
-  def _CheckLocation(self, file_entry, search_depth):
-    """Checks the location find specification.
+  def _SplitPath(self, path, path_separator):
+    """Splits the path into path segments.
+
+    Args:
+      path: a string containing the path.
+      path_separator: a string containing the path separator.
+
+    Returns:
+      A list of path segements without the root path segment, which is an
+      empty string.
+    """
+    # Split the path with the path separator and remove empty path segments.
+    return list(filter(None, path.split(path_separator)))
+
+  def _CheckModificationTime(self, file_entry):
+    """Checks the modification_time_range find specification.
 
     Args:
       file_entry: the file entry (instance of FileEntry).
-      search_depth: the search depth.
 
     Returns:
-      True if the file entry matches the find specification, False if not.
+      True if the file entry matches the find specification, False if not or
+      None if no modification time range is defined.
     """
-    if self._location_segments is None:
+    if self._modification_time_range is None:
+      return
+
+    stat_object = file_entry.GetStat()
+    return self._CheckRange(
+        getattr(stat_object, u'mtime', None), self._modification_time_range)
+
+  def _CheckRange(self, value, value_range):
+    """Checks if a value is within a range.
+
+    Args:
+      value: the value or None if not available.
+      value_range: a tuple of the minimum and maximum value, where either
+                   can be None to indicate the bound is open.
+
+    Returns:
+      A boolean value indicating the value is within the range, where
+      a value that is not available is not within the range.
+    """
+    if value is None:
       return False
 
-    if search_depth < 0 or search_depth > self._number_of_location_segments:
+    minimum_value, maximum_value = value_range
+    if minimum_value is not None and value < minimum_value:
       return False
 
-    # Note that the root has no entry in the location segments and
-    # no name to match.
-    if search_depth == 0:
-      segment_name = u''
-    else:
-      segment_name = self._location_segments[search_depth - 1]
+    if maximum_value is not None and value > maximum_value:
+      return False
 
-      if self._is_regex:
-        if isinstance(segment_name, py2to3.STRING_TYPES):
-          # Allow '\n' to be matched by '.' and make '\w', '\W', '\b', '\B',
-          # '\d', '\D', '\s' and '\S' Unicode safe.
-          flags = re.DOTALL | re.UNICODE
-          if not self._is_case_sensitive:
-            flags |= re.IGNORECASE
-
-          try:
-            segment_name = r'^{0:s}$'.format(segment_name)
-            segment_name = re.compile(segment_name, flags=flags)
-          except sre_constants.error:
-            # TODO: set self._location_segments[search_depth - 1] to None ?
-            return False
-
-          self._location_segments[search_depth - 1] = segment_name
-
-      elif not self._is_case_sensitive:
-        segment_name = segment_name.lower()
-        self._location_segments[search_depth - 1] = segment_name
-
-    if search_depth > 0:
-      if self._is_regex:
-        if not segment_name.match(file_entry.name):
-          return False
+    return True
 
-      elif self._is_case_sensitive:
-        if segment_name != file_entry.name:
-          return False
+  def _CheckRangeArgument(self, range_name, value_range):
+    """Checks a range argument.
 
-      elif segment_name != file_entry.name.lower():
-        return False
+    Args:
+      range_name: a string containing the name of the range argument.
+      value_range: a tuple of the minimum and maximum value or None.
 
-    return True
+    Raises:
+      ValueError: if the range is invalid.
+    """
+    if value_range is None:
+      return
 
-  def _SplitPath(self, path, path_separator):
-    """Splits the path into path segments.
+    if not isinstance(value_range, tuple) or len(value_range) != 2:
+      raise ValueError(u'Unsupported {0:s} value.'.format(range_name))
+
+    minimum_value, maximum_value = value_range
+    if (minimum_value is not None and maximum_value is not None and
+        minimum_value > maximum_value):
+      raise ValueError(
+          u'Invalid {0:s} minimum value exceeds maximum value.'.format(
+              range_name))
+
+  def _CheckSize(self, file_entry):
+    """Checks the size_range find specification.
 
     Args:
-      path: a string containing the path.
-      path_separator: a string containing the path separator.
+      file_entry: the file entry (instance of FileEntry).
 
     Returns:
-      A list of path segements without the root path segment, which is an
-      empty string.
+      True if the file entry matches the find specification, False if not or
+      None if no size range is defined.
     """
-    # Split the path with the path separator and remove empty path segments.
-    return list(filter(None, path.split(path_separator)))
+    if self._size_range is None:
+      return
 
-  def AtMaximumDepth(self, search_depth):
-    """Determines if the find specification is at maximum depth.
+    stat_object = file_entry.GetStat()
+    return self._CheckRange(
+        getattr(stat_object, u'size', None), self._size_range)
 
-    Args:
-      search_depth: the search depth.
+  def _GetLocationSegmentRegexFlags(self):
+    """Retrieves the regular expression flags of the location segments.
 
     Returns:
-      True if at maximum depth, False if not.
+      An integer containing the regular expression flags.
     """
-    if self._location_segments is not None:
-      if search_depth == self._number_of_location_segments:
-        return True
+    # Allow '\n' to be matched by '.' and make '\w', '\W', '\b', '\B',
+    # '\d', '\D', '\s' and '\S' Unicode safe.
+    flags = re.DOTALL | re.UNICODE
+    if not self._is_case_sensitive:
+      flags |= re.IGNORECASE
+    return flags
 
-    return False
+  def GetLocationSegmentKeys(self):
+    """Retrieves the keys used to match the location segments.
+
+    The keys are used to merge the location segments of find specifications
+    in the find specifications trie.
+
+    Returns:
+      A list of tuples of a string containing the key type and the key
+      or None if no location is specified. The key type is "name" for
+      a case sensitive name, "lower_case_name" for a case insensitive name,
+      which is stored in lower case, or "regex" for a regular expression,
+      where the key is a tuple of the pattern and the regular expression
+      flags.
+    """
+    if self._location_segments is None:
+      return
+
+    location_segment_keys = []
+    for segment_name in self._location_segments:
+      if self._is_regex:
+        pattern = r'^{0:s}$'.format(segment_name)
+        key = (u'regex', (pattern, self._GetLocationSegmentRegexFlags()))
+
+      elif self._is_case_sensitive:
+        key = (u'name', segment_name)
+
+      else:
+        key = (u'lower_case_name', segment_name.lower())
+
+      location_segment_keys.append(key)
+
+    return location_segment_keys
 
   def Initialize(self, file_system):
     """Initializes find specification for matching.
@@ -336,46 +520,137 @@ class FindSpec(object):
       self._location_segments = self._SplitPath(
           self._location_regex, path_separator)
 
-    if self._location_segments is not None:
-      self._number_of_location_segments = len(self._location_segments)
-
-  def Matches(self, file_entry, search_depth):
-    """Determines if the file entry matches the find specification.
+  def MatchesFileEntry(self, file_entry):
+    """Determines if the file entry matches the non-location criteria.
 
     Args:
       file_entry: the file entry (instance of FileEntry).
-      search_depth: the search depth.
 
     Returns:
-      A tuple containing:
-        True if the file entry matches the find specification, False otherwise.
-        True if the location matches, False if not or None if no location
-        specified.
+      A boolean value indicating if the file entry matches the criteria
+      of the find specification other than the location.
     """
-    if self._location_segments is None:
-      location_match = None
+    # The name is checked first since it does not require the stat object.
+    for check_function in (
+        self._CheckExtension, self._CheckFileEntryType,
+        self._CheckIsAllocated, self._CheckSize, self._CheckInode,
+        self._CheckModificationTime, self._CheckCreationTime):
+      match = check_function(file_entry)
+      if match is not None and not match:
+        return False
+
+    return True
+
+
+class FindSpecsTrieNode(object):
+  """Class that implements a node of the find specifications trie.
+
+  The trie merges the location segments of find specifications, so that
+  location segments that are shared by find specifications are matched
+  once.
+
+  Attributes:
+    find_specs: a list of the find specifications (instances of FindSpec)
+                of which the location ends at the node.
+  """
+
+  def __init__(self):
+    """Initializes the find specifications trie node."""
+    super(FindSpecsTrieNode, self).__init__()
+    self._lower_case_name_nodes = {}
+    self._name_nodes = {}
+    self._regex_nodes = []
+    self._regex_nodes_per_key = {}
+    self.find_specs = []
+
+  def AddChildNode(self, key):
+    """Adds a child node or retrieves the existing child node.
+
+    Args:
+      key: a tuple of a string containing the key type and the key, as
+           returned by FindSpec.GetLocationSegmentKeys().
+
+    Returns:
+      The child node (instance of FindSpecsTrieNode).
+
+    Raises:
+      ValueError: if the key is not supported or its regular expression
+                  is invalid.
+    """
+    key_type, key_value = key
+    if key_type == u'name':
+      child_nodes = self._name_nodes
+    elif key_type == u'lower_case_name':
+      child_nodes = self._lower_case_name_nodes
+    elif key_type == u'regex':
+      child_nodes = self._regex_nodes_per_key
     else:
-      location_match = self._CheckLocation(file_entry, search_depth)
-      if not location_match:
-        return False, location_match
+      raise ValueError(u'Unsupported key type: {0:s}.'.format(key_type))
 
-      if search_depth != self._number_of_location_segments:
-        return False, location_match
+    child_node = child_nodes.get(key_value, None)
+    if child_node is None:
+      if key_type == u'regex':
+        pattern, flags = key_value
+        try:
+          regex = re.compile(pattern, flags=flags)
+        except sre_constants.error:
+          raise ValueError(
+              u'Invalid regular expression: {0:s}.'.format(pattern))
 
-    match = self._CheckFileEntryType(file_entry)
-    if match is not None and not match:
-      return False, location_match
+      child_node = FindSpecsTrieNode()
+      child_nodes[key_value] = child_node
 
-    match = self._CheckIsAllocated(file_entry)
-    if match is not None and not match:
-      return False, location_match
+      if key_type == u'regex':
+        self._regex_nodes.append((regex, child_node))
 
-    return True, location_match
+    return child_node
+
+  def GetChildNodes(self, name):
+    """Retrieves the child nodes of which the location segment matches a name.
+
+    Args:
+      name: a string containing the name of a file entry.
+
+    Returns:
+      A list of child nodes (instances of FindSpecsTrieNode).
+    """
+    child_nodes = []
+
+    child_node = self._name_nodes.get(name, None)
+    if child_node:
+      child_nodes.append(child_node)
+
+    if self._lower_case_name_nodes:
+      child_node = self._lower_case_name_nodes.get(name.lower(), None)
+      if child_node:
+        child_nodes.append(child_node)
+
+    for regex, child_node in self._regex_nodes:
+      if regex.match(name):
+        child_nodes.append(child_node)
+
+    return child_nodes
+
+  def HasChildNodes(self):
+    """Determines if the node has child nodes.
+
+    Returns:
+      A boolean value indicating if the node has child nodes.
+    """
+    return bool(
+        self._name_nodes or self._lower_case_name_nodes or self._regex_nodes)
 
 
 class FileSystemSearcher(object):
   """Searcher object to find file entries within a file system."""
 
+  # The type indicators of the file systems of which the back-end releases
+  # the global interpreter lock (GIL), which can be searched in parallel
+  # by threads instead of processes.
+  _THREAD_SAFE_TYPE_INDICATORS = frozenset([
+      definitions.TYPE_INDICATOR_NTFS,
+      definitions.TYPE_INDICATOR_TSK])
+
   def __init__(self, file_system, mount_point):
     """Initializes the file system searcher.
 
@@ -401,42 +676,203 @@ class FileSystemSearcher(object):
     self._file_system = file_system
     self._mount_point = mount_point
 
-  def _FindInFileEntry(self, file_entry, find_specs, search_depth):
+  def _CompileFindSpecs(self, find_specs):
+    """Compiles find specifications into a find specifications trie.
+
+    Args:
+      find_specs: a list of find specifications (instances of FindSpec).
+
+    Returns:
+      A tuple containing the root node of the find specifications trie
+      (instance of FindSpecsTrieNode) and a list of the find specifications
+      without a location (instances of FindSpec), which can match file
+      entries at any depth.
+    """
+    root_node = FindSpecsTrieNode()
+    find_specs_without_location = []
+
+    for find_spec in find_specs:
+      find_spec.Initialize(self._file_system)
+
+      location_segment_keys = find_spec.GetLocationSegmentKeys()
+      if location_segment_keys is None:
+        find_specs_without_location.append(find_spec)
+        continue
+
+      trie_node = root_node
+      try:
+        for key in location_segment_keys:
+          trie_node = trie_node.AddChildNode(key)
+      except ValueError:
+        # A find specification with an invalid regular expression does not
+        # match any file entry.
+        continue
+
+      trie_node.find_specs.append(find_spec)
+
+    return root_node, find_specs_without_location
+
+  def _FindInFileEntry(
+      self, file_entry, trie_nodes, find_specs_without_location):
     """Searches for matching file entries within the file entry.
 
     Args:
       file_entry: the file entry (instance of FileEntry).
-      find_specs: a list of find specifications (instances of FindSpec).
-      search_depth: the search depth.
+      trie_nodes: a list of the find specifications trie nodes (instances
+                  of FindSpecsTrieNode) of which the location segment
+                  matches the file entry.
+      find_specs_without_location: a list of the find specifications
+                                   without a location (instances of
+                                   FindSpec).
 
     Yields:
-      The path specification of the matching file entries (instances of
-      PathSpec).
+      The matching file entries (instances of FileEntry).
     """
-    sub_find_specs = []
-    for find_spec in find_specs:
-      match, location_match = find_spec.Matches(file_entry, search_depth)
-      if match:
-        yield file_entry.path_spec
+    if self._MatchesFileEntry(
+        file_entry, trie_nodes, find_specs_without_location):
+      yield file_entry
 
-      if location_match != False and not find_spec.AtMaximumDepth(search_depth):
-        sub_find_specs.append(find_spec)
+    try:
+      for sub_file_entry, sub_trie_nodes in self._GetSubFileEntries(
+          file_entry, trie_nodes, find_specs_without_location):
+        for matching_file_entry in self._FindInFileEntry(
+            sub_file_entry, sub_trie_nodes, find_specs_without_location):
+          yield matching_file_entry
+
+    except errors.AccessError:
+      pass
+
+  def _GetStartFileEntry(self):
+    """Retrieves the file entry where to start the search.
+
+    Returns:
+      The file entry (instance of FileEntry).
+    """
+    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+        self._file_system.type_indicator):
+      return self._file_system.GetFileEntryByPathSpec(self._mount_point)
+
+    return self._file_system.GetRootFileEntry()
+
+  def _GetSubFileEntries(
+      self, file_entry, trie_nodes, find_specs_without_location):
+    """Retrieves the sub file entries that can match a find specification.
+
+    Args:
+      file_entry: the file entry (instance of FileEntry).
+      trie_nodes: a list of the find specifications trie nodes (instances
+                  of FindSpecsTrieNode) of which the location segment
+                  matches the file entry.
+      find_specs_without_location: a list of the find specifications
+                                   without a location (instances of
+                                   FindSpec).
+
+    Yields:
+      A tuple containing a sub file entry (instance of FileEntry) and
+      a list of the find specifications trie nodes (instances of
+      FindSpecsTrieNode) of which the location segment matches the sub
+      file entry.
+    """
+    # Only search the sub file entries if a find specification can still
+    # match one of them.
+    if not find_specs_without_location and not any(
+        trie_node.HasChildNodes() for trie_node in trie_nodes):
+      return
+
+    for sub_file_entry in file_entry.sub_file_entries:
+      sub_trie_nodes = []
+      if trie_nodes:
+        name = sub_file_entry.name
+        for trie_node in trie_nodes:
+          sub_trie_nodes.extend(trie_node.GetChildNodes(name))
+
+      if not sub_trie_nodes and not find_specs_without_location:
+        continue
+
+      yield sub_file_entry, sub_trie_nodes
+
+  def _GetSubtrees(
+      self, file_entry, trie_nodes, find_specs_without_location, depth,
+      split_depth):
+    """Splits the search into subtrees.
+
+    The file entries above the split depth are matched in the current
+    thread.
 
-    if not sub_find_specs:
+    Args:
+      file_entry: the file entry (instance of FileEntry).
+      trie_nodes: a list of the find specifications trie nodes (instances
+                  of FindSpecsTrieNode) of which the location segment
+                  matches the file entry.
+      find_specs_without_location: a list of the find specifications
+                                   without a location (instances of
+                                   FindSpec).
+      depth: the depth of the file entry relative to the start of
+             the search.
+      split_depth: the depth at which the search is split into subtrees.
+
+    Yields:
+      A tuple containing the path specification of a matching file entry
+      (instance of PathSpec) or None and a subtree search task or None.
+      The subtree search task is a tuple of the path specification of the
+      file entry at the root of the subtree, the trie nodes that match
+      the file entry and the find specifications without a location.
+    """
+    if depth >= split_depth:
+      yield None, (
+          file_entry.path_spec, trie_nodes, find_specs_without_location)
       return
 
-    search_depth += 1
+    if self._MatchesFileEntry(
+        file_entry, trie_nodes, find_specs_without_location):
+      yield file_entry.path_spec, None
+
     try:
-      for sub_file_entry in file_entry.sub_file_entries:
-        for matching_path_spec in self._FindInFileEntry(
-            sub_file_entry, sub_find_specs, search_depth):
-          yield matching_path_spec
+      for sub_file_entry, sub_trie_nodes in self._GetSubFileEntries(
+          file_entry, trie_nodes, find_specs_without_location):
+        for subtree in self._GetSubtrees(
+            sub_file_entry, sub_trie_nodes, find_specs_without_location,
+            depth + 1, split_depth):
+          yield subtree
+
     except errors.AccessError:
       pass
 
+  def _MatchesFileEntry(
+      self, file_entry, trie_nodes, find_specs_without_location):
+    """Determines if a file entry matches a find specification.
+
+    Args:
+      file_entry: the file entry (instance of FileEntry).
+      trie_nodes: a list of the find specifications trie nodes (instances
+                  of FindSpecsTrieNode) of which the location segment
+                  matches the file entry.
+      find_specs_without_location: a list of the find specifications
+                                   without a location (instances of
+                                   FindSpec).
+
+    Returns:
+      A boolean value indicating if the file entry matches.
+    """
+    for trie_node in trie_nodes:
+      for find_spec in trie_node.find_specs:
+        if find_spec.MatchesFileEntry(file_entry):
+          return True
+
+    for find_spec in find_specs_without_location:
+      if find_spec.MatchesFileEntry(file_entry):
+        return True
+
+    return False
+
   def Find(self, find_specs=None):
     """Searches for matching file entries within the file system.
 
+    The find specifications are compiled into a trie of their location
+    segments, so that the file system is only searched for file entries
+    that can match one of the find specifications. A file entry that
+    matches multiple find specifications is returned once.
+
     Args:
       find_specs: a list of find specifications (instances of FindSpec).
                   The default is None, which will return all allocated
@@ -446,20 +882,38 @@ class FileSystemSearcher(object):
       The path specification of the matching file entries (instances of
       PathSpec).
     """
-    if not find_specs:
-      find_specs.append(FindSpec())
+    for file_entry in self.FindEntries(find_specs=find_specs):
+      yield file_entry.path_spec
 
-    for find_spec in find_specs:
-      find_spec.Initialize(self._file_system)
+  def FindEntries(self, find_specs=None):
+    """Searches for matching file entries within the file system.
 
-    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
-        self._file_system.type_indicator):
-      file_entry = self._file_system.GetFileEntryByPathSpec(self._mount_point)
-    else:
-      file_entry = self._file_system.GetRootFileEntry()
+    Unlike Find() the file entries that were opened during the search are
+    returned, so that they do not need to be opened again using their path
+    specification, which is available as the path_spec attribute.
+
+    Args:
+      find_specs: a list of find specifications (instances of FindSpec).
+                  The default is None, which will return all allocated
+                  file entries.
 
-    for matching_path_spec in self._FindInFileEntry(file_entry, find_specs, 0):
-      yield matching_path_spec
+    Yields:
+      The matching file entries (instances of FileEntry), of which the stat
+      object has been retrieved.
+    """
+    if not find_specs:
+      find_specs = [FindSpec()]
+
+    root_node, find_specs_without_location = self._CompileFindSpecs(
+        find_specs)
+
+    file_entry = self._GetStartFileEntry()
+    for matching_file_entry in self._FindInFileEntry(
+        file_entry, [root_node], find_specs_without_location):
+      # The stat object is already retrieved if the find specification
+      # matched the file entry type or allocation status.
+      matching_file_entry.GetStat()
+      yield matching_file_entry
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -517,6 +971,111 @@ class FileSystemSearcher(object):
         self._file_system.PATH_SEPARATOR,
         self._file_system.PATH_SEPARATOR.join(path_segments))
 
+  def _ParallelFind(
+      self, find_specs, number_of_workers, ordered, split_depth, use_threads):
+    """Searches for matching file entries within the file system in parallel.
+
+    Args:
+      find_specs: a list of find specifications (instances of FindSpec).
+      number_of_workers: number of workers.
+      ordered: boolean value to indicate the matching file entries should
+               be returned in the same order as Find() returns them.
+      split_depth: depth, relative to the start of the search, of the file
+                   entries at the root of the subtrees.
+      use_threads: boolean value to indicate the workers should be threads
+                   instead of processes or None.
+
+    Yields:
+      The path specification of the matching file entries (instances of
+      PathSpec).
+    """
+    if number_of_workers <= 1:
+      for matching_path_spec in self.Find(find_specs=find_specs):
+        yield matching_path_spec
+      return
+
+    if not find_specs:
+      find_specs = [FindSpec()]
+
+    root_node, find_specs_without_location = self._CompileFindSpecs(
+        find_specs)
+
+    # The subtrees are determined before the workers are started, since
+    # the file system cannot be used concurrently.
+    file_entry = self._GetStartFileEntry()
+    subtrees = list(self._GetSubtrees(
+        file_entry, [root_node], find_specs_without_location, 0,
+        split_depth))
+
+    if use_threads is None:
+      use_threads = (
+          self._file_system.type_indicator in
+          self._THREAD_SAFE_TYPE_INDICATORS)
+
+    tasks = [task for _, task in subtrees if task]
+
+    results = worker_pool.Map(
+        _FindInSubtree, tasks, number_of_workers, ordered=ordered,
+        use_threads=use_threads)
+
+    for matching_path_spec, _ in subtrees:
+      if matching_path_spec:
+        yield matching_path_spec
+
+      elif ordered:
+        for matching_path_spec in next(results):
+          yield matching_path_spec
+
+    # Retrieving the remaining results stops the worker pool.
+    for matching_path_specs in results:
+      for matching_path_spec in matching_path_specs:
+        yield matching_path_spec
+
+  def ParallelFind(
+      self, find_specs=None, number_of_workers=None, ordered=True,
+      split_depth=1, use_threads=None):
+    """Searches for matching file entries within the file system in parallel.
+
+    The search is split into the subtrees of the file entries at the split
+    depth, which are searched by a pool of workers. Every worker opens
+    the file system with its own resolver context. Note that worker
+    processes can only open encrypted volumes if the credentials were set
+    in the key chain of the resolver before the search and the operating
+    system forks the worker processes.
+
+    Args:
+      find_specs: a list of find specifications (instances of FindSpec).
+                  The default is None, which will return all allocated
+                  file entries.
+      number_of_workers: optional number of workers, where None represents
+                         the number of CPUs and 0 or 1 searches in
+                         the current thread.
+      ordered: optional boolean value to indicate the matching file entries
+               should be returned in the same order as Find() returns them.
+               If False the matching file entries are returned as soon as
+               their subtree has been searched.
+      split_depth: optional depth, relative to the start of the search,
+                   of the file entries at the root of the subtrees.
+      use_threads: optional boolean value to indicate the workers should
+                   be threads instead of processes. The default is None,
+                   which uses threads for file systems of which the
+                   back-end releases the global interpreter lock (GIL).
+
+    Returns:
+      A generator of the path specification of the matching file entries
+      (instances of PathSpec).
+
+    Raises:
+      ValueError: if the number of workers or split depth is invalid.
+    """
+    number_of_workers = worker_pool.GetNumberOfWorkers(number_of_workers)
+
+    if split_depth < 1:
+      raise ValueError(u'Invalid split depth: {0:d}.'.format(split_depth))
+
+    return self._ParallelFind(
+        find_specs, number_of_workers, ordered, split_depth, use_threads)
+
   def SplitPath(self, path):
     """Splits the path into path segments.
 
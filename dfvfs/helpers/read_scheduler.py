@@ -0,0 +1,676 @@
+# -*- coding: utf-8 -*-
+"""A scheduler to read the data of many file entries in storage order.
+
+The extents of the data streams are sorted by their offset in the file-like
+object that contains the file system, such as a volume, and adjacent extents
+are read at once. This prevents the storage media image from being read, and
+for example decompressed, multiple times when many small files are read.
+"""
+
+import hashlib
+import itertools
+import os
+
+from dfvfs.helpers import file_hasher
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.resolver import resolver
+
+
+class _DataConsumer(object):
+  """Class that keeps the data of a data stream."""
+
+  def __init__(self):
+    """Initializes the data consumer."""
+    super(_DataConsumer, self).__init__()
+    self._data_parts = []
+
+  def GetData(self):
+    """Retrieves the data.
+
+    Returns:
+      bytes: data.
+    """
+    return b''.join(self._data_parts)
+
+  def Update(self, data):
+    """Updates the consumer with data.
+
+    Args:
+      data (bytes): data.
+    """
+    self._data_parts.append(data)
+
+
+class _HashConsumer(object):
+  """Class that calculates message digest hashes of a data stream."""
+
+  def __init__(self, hash_names):
+    """Initializes the hash consumer.
+
+    Args:
+      hash_names (list[str]): names of the hashes to calculate.
+    """
+    super(_HashConsumer, self).__init__()
+    self._hash_contexts = [
+        (hash_name, hashlib.new(hash_name)) for hash_name in hash_names]
+
+  def GetHashes(self):
+    """Retrieves the hashes.
+
+    Returns:
+      dict[str, str]: hexadecimal message digest hashes per name of the hash.
+    """
+    return {
+        hash_name: hash_context.hexdigest()
+        for hash_name, hash_context in self._hash_contexts}
+
+  def Update(self, data):
+    """Updates the consumer with data.
+
+    Args:
+      data (bytes): data.
+    """
+    for _, hash_context in self._hash_contexts:
+      hash_context.update(data)
+
+
+class _PendingDataTracker(object):
+  """Class that keeps track of the data read out of order of all data streams.
+
+  If the total size of the data that is kept by the read states exceeds
+  the maximum size, the data of the read states that keep the most data
+  is discarded, until the total size no longer exceeds the maximum size.
+
+  Attributes:
+    size (int): total size of the data that is kept.
+  """
+
+  def __init__(self, maximum_size):
+    """Initializes the pending data tracker.
+
+    Args:
+      maximum_size (int): maximum total size of the data that is kept.
+    """
+    super(_PendingDataTracker, self).__init__()
+    self._maximum_size = maximum_size
+    self._read_states = set()
+    self.size = 0
+
+  def Update(self, read_state, size):
+    """Updates the size of the data that is kept by a read state.
+
+    Args:
+      read_state (_DataStreamReadState): read state.
+      size (int): number of bytes the data of the read state increased,
+          or if negative decreased, by.
+    """
+    self.size += size
+    if read_state.pending_data_size:
+      self._read_states.add(read_state)
+    else:
+      self._read_states.discard(read_state)
+
+    while self.size > self._maximum_size and self._read_states:
+      largest_read_state = max(
+          self._read_states, key=lambda state: state.pending_data_size)
+      self._read_states.remove(largest_read_state)
+      self.size -= largest_read_state.pending_data_size
+      largest_read_state.DiscardPendingData()
+
+
+class _DataStreamReadState(object):
+  """Class that keeps track of the data of a data stream that has been read.
+
+  The data is passed to the consumer in order of the offset within the data
+  stream, where data that is read out of order is kept until the preceding
+  data has been read. If the size of the data that is kept exceeds
+  the maximum pending data size, or the pending data tracker discards it,
+  the data is discarded and the remainder of the data stream should be
+  read sequentially instead.
+
+  Attributes:
+    consumer (_DataConsumer|_HashConsumer): consumer of the data of the data
+        stream.
+    data_size (int): size of the data of the data stream.
+    error (str): description of the error that prevented the data from
+        being read or None if no error occurred.
+    path_spec (PathSpec): path specification of the file entry.
+    read_sequentially (bool): True if the data that was read out of order
+        was discarded and the remainder of the data stream should be read
+        sequentially.
+  """
+
+  # The maximum size of the data that is read out of order and kept
+  # per data stream.
+  _MAXIMUM_PENDING_DATA_SIZE = 16 * 1024 * 1024
+
+  # The maximum size of the zero bytes passed to the consumer at once.
+  _MAXIMUM_ZERO_DATA_SIZE = 1024 * 1024
+
+  def __init__(
+      self, path_spec, data_size, consumer, pending_data_tracker=None):
+    """Initializes the read state.
+
+    Args:
+      path_spec (PathSpec): path specification of the file entry.
+      data_size (int): size of the data of the data stream.
+      consumer (_DataConsumer|_HashConsumer): consumer of the data of the data
+          stream.
+      pending_data_tracker (Optional[_PendingDataTracker]): tracker of
+          the data read out of order of all data streams.
+    """
+    super(_DataStreamReadState, self).__init__()
+    self._data_offset = 0
+    self._pending_data = {}
+    self._pending_data_size = 0
+    self._pending_data_tracker = pending_data_tracker
+    self.consumer = consumer
+    self.data_size = data_size
+    self.error = None
+    self.path_spec = path_spec
+    self.read_sequentially = False
+
+  @property
+  def data_offset(self):
+    """int: offset of the data that has not been passed to the consumer."""
+    return self._data_offset
+
+  @property
+  def pending_data_size(self):
+    """int: size of the data that is read out of order and kept."""
+    return self._pending_data_size
+
+  @property
+  def is_complete(self):
+    """bool: True if all the data has been passed to the consumer."""
+    return self._data_offset >= self.data_size
+
+  def _Consume(self, data):
+    """Passes data to the consumer.
+
+    Args:
+      data (bytes|int): data or the number of zero bytes, such as
+          the data of a sparse extent.
+    """
+    if isinstance(data, bytes):
+      self.consumer.Update(data)
+      self._data_offset += len(data)
+      return
+
+    while data > 0:
+      zero_data_size = min(data, self._MAXIMUM_ZERO_DATA_SIZE)
+      self.consumer.Update(b'\x00' * zero_data_size)
+      self._data_offset += zero_data_size
+      data -= zero_data_size
+
+  def _UpdatePendingDataSize(self, size):
+    """Updates the size of the data that is read out of order and kept.
+
+    Args:
+      size (int): number of bytes the data increased, or if negative
+          decreased, by.
+    """
+    self._pending_data_size += size
+    if self._pending_data_size > self._MAXIMUM_PENDING_DATA_SIZE:
+      size -= self._pending_data_size
+      self.DiscardPendingData()
+
+    if self._pending_data_tracker and size:
+      self._pending_data_tracker.Update(self, size)
+
+  def DiscardPendingData(self):
+    """Discards the data that is read out of order and kept.
+
+    The data that is read out of order afterwards is no longer kept and
+    the remainder of the data stream should be read sequentially.
+    """
+    self._pending_data = {}
+    self._pending_data_size = 0
+    self.read_sequentially = True
+
+  def Feed(self, data_offset, data):
+    """Feeds data of the data stream.
+
+    Args:
+      data_offset (int): offset of the data within the data stream.
+      data (bytes|int): data or the number of zero bytes, such as
+          the data of a sparse extent.
+    """
+    if data_offset != self._data_offset:
+      if self.read_sequentially:
+        return
+
+      self._pending_data[data_offset] = data
+
+      # The number of zero bytes of a sparse extent is not kept as data.
+      if isinstance(data, bytes):
+        self._UpdatePendingDataSize(len(data))
+      return
+
+    self._Consume(data)
+
+    consumed_data_size = 0
+    while self._data_offset in self._pending_data:
+      data = self._pending_data.pop(self._data_offset)
+      if isinstance(data, bytes):
+        consumed_data_size += len(data)
+      self._Consume(data)
+
+    if consumed_data_size:
+      self._UpdatePendingDataSize(-consumed_data_size)
+
+
+class ExtentReadScheduler(object):
+  """Class that reads the data of many file entries in storage order.
+
+  The data streams are read in order of their extents, where data streams
+  of which the extents cannot be determined, such as those with resident
+  or compressed data, are read first. The results are returned when all
+  the data of a data stream has been read, hence not in the order of
+  the path specifications.
+  """
+
+  # The default maximum size of the data between extents that is read
+  # to combine the extents into a single read.
+  _MAXIMUM_GAP_SIZE = 64 * 1024
+
+  # The default maximum size of the data read at once.
+  _MAXIMUM_READ_SIZE = 16 * 1024 * 1024
+
+  # The default maximum total size of the data that is read out of order
+  # and kept until the preceding data of its data stream has been read.
+  _MAXIMUM_PENDING_DATA_SIZE = 64 * 1024 * 1024
+
+  # The size of the data read at once from data streams of which
+  # the extents cannot be determined.
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(
+      self, maximum_gap_size=None, maximum_pending_data_size=None,
+      maximum_read_size=None, resolver_context=None):
+    """Initializes the read scheduler.
+
+    Args:
+      maximum_gap_size (Optional[int]): maximum size of the data between
+          extents that is read to combine the extents into a single read.
+      maximum_pending_data_size (Optional[int]): maximum total size of
+          the data that is read out of order and kept, where the data of
+          the data streams that keep the most data is discarded and read
+          sequentially afterwards.
+      maximum_read_size (Optional[int]): maximum size of the data read
+          at once.
+      resolver_context (Optional[Context]): resolver context. The default
+          is None which represents the built-in resolver context.
+
+    Raises:
+      ValueError: if the maximum gap size, maximum pending data size or
+          maximum read size is invalid.
+    """
+    if maximum_gap_size is None:
+      maximum_gap_size = self._MAXIMUM_GAP_SIZE
+
+    elif maximum_gap_size < 0:
+      raise ValueError(
+          u'Invalid maximum gap size: {0:d}.'.format(maximum_gap_size))
+
+    if maximum_pending_data_size is None:
+      maximum_pending_data_size = self._MAXIMUM_PENDING_DATA_SIZE
+
+    elif maximum_pending_data_size < 0:
+      raise ValueError(u'Invalid maximum pending data size: {0:d}.'.format(
+          maximum_pending_data_size))
+
+    if maximum_read_size is None:
+      maximum_read_size = self._MAXIMUM_READ_SIZE
+
+    elif maximum_read_size <= 0:
+      raise ValueError(
+          u'Invalid maximum read size: {0:d}.'.format(maximum_read_size))
+
+    super(ExtentReadScheduler, self).__init__()
+    self._maximum_gap_size = maximum_gap_size
+    self._maximum_pending_data_size = maximum_pending_data_size
+    self._maximum_read_size = maximum_read_size
+    self._resolver_context = resolver_context
+
+  def _GetExtentReads(self, file_entry, data_stream_name, read_state):
+    """Retrieves the reads of the extents of a data stream.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      data_stream_name (str): data stream name, where an empty string
+          represents the default data stream.
+      read_state (_DataStreamReadState): read state of the data stream.
+
+    Returns:
+      list[tuple[int, int, int]]: offset of the read relative to the start
+          of the file-like object that contains the file system, size of
+          the read and offset of the data of the read within the data stream
+          or None if the data stream cannot be read by extent.
+    """
+    # The valid data size of a NTFS data stream is not available through
+    # pytsk3 and the data beyond it is read as zero bytes, hence the extents
+    # do not necessarily correspond to the data.
+    if (file_entry.type_indicator == definitions.TYPE_INDICATOR_TSK and
+        file_entry.GetFileSystem().IsNTFS()):
+      return
+
+    extents = file_entry.GetExtents(data_stream_name=data_stream_name)
+
+    extents_size = 0
+    for extent in extents:
+      if extent.extent_type == definitions.EXTENT_TYPE_COMPRESSED:
+        return
+      extents_size += extent.size
+
+    if extents_size < read_state.data_size:
+      return
+
+    extent_reads = []
+    data_offset = 0
+    for extent in extents:
+      if data_offset >= read_state.data_size:
+        break
+
+      extent_size = min(extent.size, read_state.data_size - data_offset)
+
+      if extent.extent_type == definitions.EXTENT_TYPE_SPARSE:
+        read_state.Feed(data_offset, extent_size)
+
+      else:
+        for read_offset in range(
+            0, extent_size, self._maximum_read_size):
+          read_size = min(self._maximum_read_size, extent_size - read_offset)
+          extent_reads.append((
+              extent.offset + read_offset, read_size,
+              data_offset + read_offset))
+
+      data_offset += extent_size
+
+    return extent_reads
+
+  def _ReadDataStream(self, file_object, read_state):
+    """Reads a data stream sequentially.
+
+    The data stream is read from the offset of the data that has not been
+    passed to the consumer of the read state.
+
+    Args:
+      file_object (FileIO): file-like object of the data stream.
+      read_state (_DataStreamReadState): read state of the data stream.
+    """
+    data_offset = read_state.data_offset
+    file_object.seek(data_offset, os.SEEK_SET)
+
+    data = file_object.read(self._READ_BUFFER_SIZE)
+    while data:
+      read_state.Feed(data_offset, data)
+      data_offset += len(data)
+      data = file_object.read(self._READ_BUFFER_SIZE)
+
+  def _ReadDataStreams(self, path_specs, data_stream_name, create_consumer):
+    """Reads the data of data streams in storage order.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications of the file
+          entries.
+      data_stream_name (str): data stream name, where an empty string
+          represents the default data stream.
+      create_consumer (callable): function that creates the consumer of
+          the data of a data stream, such as _DataConsumer.
+
+    Yields:
+      _DataStreamReadState: read state of a data stream that has been read
+          or could not be read.
+    """
+    pending_data_tracker = _PendingDataTracker(
+        self._maximum_pending_data_size)
+    reads = []
+    read_states = []
+    volume_path_specs = {}
+
+    for path_spec in path_specs:
+      read_state = _DataStreamReadState(
+          path_spec, 0, create_consumer(),
+          pending_data_tracker=pending_data_tracker)
+
+      try:
+        file_entry = resolver.Resolver.OpenFileEntry(
+            path_spec, resolver_context=self._resolver_context)
+        if not file_entry:
+          read_state.error = u'Missing file entry.'
+          yield read_state
+          continue
+
+        file_object = file_entry.GetFileObject(
+            data_stream_name=data_stream_name)
+        if not file_object:
+          read_state.error = u'Missing file-like object.'
+          yield read_state
+          continue
+
+        try:
+          read_state.data_size = file_object.get_size()
+
+          extent_reads = None
+          if path_spec.HasParent():
+            extent_reads = self._GetExtentReads(
+                file_entry, data_stream_name, read_state)
+
+          if extent_reads is None:
+            self._ReadDataStream(file_object, read_state)
+
+        finally:
+          file_object.close()
+
+      except (IOError, OSError, RuntimeError, errors.Error) as exception:
+        read_state.error = u'{0!s}'.format(exception)
+        yield read_state
+        continue
+
+      if extent_reads is None or read_state.is_complete:
+        yield read_state
+        continue
+
+      # The extents are relative to the file-like object that contains
+      # the file system, which is defined by the parent path specification.
+      volume_identifier = path_spec.parent.comparable
+      volume_path_specs[volume_identifier] = path_spec.parent
+
+      read_state_index = len(read_states)
+      read_states.append(read_state)
+
+      for volume_offset, read_size, data_offset in extent_reads:
+        reads.append((
+            volume_identifier, volume_offset, read_size, read_state_index,
+            data_offset))
+
+    reads.sort()
+
+    for volume_identifier, volume_reads in itertools.groupby(
+        reads, key=lambda read: read[0]):
+      volume_reads = list(volume_reads)
+      volume_path_spec = volume_path_specs[volume_identifier]
+
+      try:
+        volume_file_object = resolver.Resolver.OpenFileObject(
+            volume_path_spec, resolver_context=self._resolver_context)
+
+      except (IOError, OSError, RuntimeError, errors.Error) as exception:
+        for _, _, _, read_state_index, _ in volume_reads:
+          read_states[read_state_index].error = u'{0!s}'.format(exception)
+        continue
+
+      try:
+        for read_state in self._ReadVolume(
+            volume_file_object, volume_reads, read_states):
+          yield read_state
+
+      finally:
+        volume_file_object.close()
+
+    # The remainder of data streams of which too much data was read out of
+    # order is read sequentially.
+    for read_state in read_states:
+      if read_state is None:
+        continue
+
+      if read_state.read_sequentially and not read_state.error:
+        self._ReadRemainingDataStream(read_state, data_stream_name)
+
+      if not read_state.error and not read_state.is_complete:
+        read_state.error = u'Unable to read data.'
+      yield read_state
+
+  def _ReadRemainingDataStream(self, read_state, data_stream_name):
+    """Reads the remainder of a data stream sequentially.
+
+    Args:
+      read_state (_DataStreamReadState): read state of the data stream.
+      data_stream_name (str): data stream name, where an empty string
+          represents the default data stream.
+    """
+    try:
+      file_entry = resolver.Resolver.OpenFileEntry(
+          read_state.path_spec, resolver_context=self._resolver_context)
+      file_object = None
+      if file_entry:
+        file_object = file_entry.GetFileObject(
+            data_stream_name=data_stream_name)
+
+      if not file_object:
+        read_state.error = u'Missing file-like object.'
+        return
+
+      try:
+        self._ReadDataStream(file_object, read_state)
+      finally:
+        file_object.close()
+
+    except (IOError, OSError, RuntimeError, errors.Error) as exception:
+      read_state.error = u'{0!s}'.format(exception)
+
+  def _ReadVolume(self, file_object, reads, read_states):
+    """Reads the data of data streams from the file-like object of a volume.
+
+    Reads of which the data is adjacent, or only separated by a gap smaller
+    than the maximum gap size, are combined into a single read.
+
+    Args:
+      file_object (FileIO): file-like object that contains the file system.
+      reads (list[tuple[str, int, int, int, int]]): reads sorted by offset,
+          which contain the identifier of the volume, the offset relative
+          to the start of the volume, the size, the index of the read state
+          and the offset of the data within the data stream.
+      read_states (list[_DataStreamReadState]): read states, where the read
+          state is replaced by None once it has been yielded.
+
+    Yields:
+      _DataStreamReadState: read state of a data stream that has been read.
+    """
+    read_index = 0
+    number_of_reads = len(reads)
+
+    while read_index < number_of_reads:
+      _, start_offset, read_size, _, _ = reads[read_index]
+      end_offset = start_offset + read_size
+
+      last_read_index = read_index + 1
+      while last_read_index < number_of_reads:
+        _, volume_offset, read_size, _, _ = reads[last_read_index]
+        if volume_offset - end_offset > self._maximum_gap_size:
+          break
+
+        read_end_offset = max(end_offset, volume_offset + read_size)
+        if read_end_offset - start_offset > self._maximum_read_size:
+          break
+
+        end_offset = read_end_offset
+        last_read_index += 1
+
+      file_object.seek(start_offset, os.SEEK_SET)
+      data = file_object.read(end_offset - start_offset)
+
+      for _, volume_offset, read_size, read_state_index, data_offset in reads[
+          read_index:last_read_index]:
+        read_state = read_states[read_state_index]
+        if read_state is None or read_state.error:
+          continue
+
+        relative_offset = volume_offset - start_offset
+        read_data = data[relative_offset:relative_offset + read_size]
+        if len(read_data) < read_size:
+          read_state.error = u'Unable to read data at offset: 0x{0:08x}.'.format(
+              volume_offset)
+          continue
+
+        read_state.Feed(data_offset, read_data)
+        if read_state.is_complete:
+          read_states[read_state_index] = None
+          yield read_state
+
+      read_index = last_read_index
+
+  def HashDataStreams(self, path_specs, data_stream_name=u'', hash_names=None):
+    """Calculates message digest hashes of data streams in storage order.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications of the file
+          entries.
+      data_stream_name (Optional[str]): data stream name, where an empty
+          string represents the default data stream.
+      hash_names (Optional[list[str]]): names of the hashes to calculate,
+          such as "md5", "sha1" and "sha256". The default is
+          FileHasher.DEFAULT_HASH_NAMES.
+
+    Yields:
+      FileHashResult: hash result of a data stream, in the order the data
+          streams have been read.
+
+    Raises:
+      ValueError: if a hash name is not supported.
+    """
+    if not hash_names:
+      hash_names = file_hasher.FileHasher.DEFAULT_HASH_NAMES
+
+    for hash_name in hash_names:
+      try:
+        hashlib.new(hash_name)
+      except ValueError:
+        raise ValueError(u'Unsupported hash: {0:s}.'.format(hash_name))
+
+    for read_state in self._ReadDataStreams(
+        path_specs, data_stream_name, lambda: _HashConsumer(hash_names)):
+      hash_result = file_hasher.FileHashResult(
+          read_state.path_spec, data_stream_name=data_stream_name)
+      hash_result.error = read_state.error
+
+      if not read_state.error:
+        hash_result.hashes = read_state.consumer.GetHashes()
+
+      yield hash_result
+
+  def ReadDataStreams(self, path_specs, data_stream_name=u''):
+    """Reads the data of data streams in storage order.
+
+    Note that all the data of a data stream is kept in memory until it has
+    been read completely.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications of the file
+          entries.
+      data_stream_name (Optional[str]): data stream name, where an empty
+          string represents the default data stream.
+
+    Yields:
+      tuple[PathSpec, bytes]: path specification of the file entry and
+          the data of the data stream or None if the data could not be read,
+          in the order the data streams have been read.
+    """
+    for read_state in self._ReadDataStreams(
+        path_specs, data_stream_name, _DataConsumer):
+      if read_state.error:
+        yield read_state.path_spec, None
+      else:
+        yield read_state.path_spec, read_state.consumer.GetData()
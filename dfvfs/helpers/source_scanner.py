@@ -317,6 +317,20 @@ class SourceScannerContext(object):
 class SourceScanner(object):
   """Searcher object to find volumes within a volume system."""
 
+  # The format categories that are scanned for in the same pass, per format
+  # category. _ScanNode() scans a scan node for a file system after it has
+  # scanned it for a volume system. A storage media image is scanned for
+  # separately since the storage media image scan node, and not the source
+  # scan node, is scanned next when a storage media image is found.
+  _SCAN_FORMAT_CATEGORIES = {
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM: [
+          definitions.FORMAT_CATEGORY_FILE_SYSTEM],
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+          definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE],
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: [
+          definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+          definitions.FORMAT_CATEGORY_FILE_SYSTEM]}
+
   def __init__(self, resolver_context=None):
     """Initializes the source scanner object.
 
@@ -327,10 +341,48 @@ class SourceScanner(object):
     """
     super(SourceScanner, self).__init__()
     self._resolver_context = resolver_context
+    self._type_indicators_cache = None
 
   # TODO: add functions to check if path spec type is an Image type,
   # FS type, etc.
 
+  def _GetTypeIndicators(self, source_path_spec, format_category):
+    """Determines the supported format types of a specific format category.
+
+    While scanning, the format categories that _ScanNode() scans for after
+    the requested format category are determined in the same pass over
+    the data and cached per path specification.
+
+    Args:
+      source_path_spec: the source path specification (instance of
+                        dfvfs.PathSpec).
+      format_category: the format category.
+
+    Returns:
+      A list of the supported format type indicators.
+
+    Raises:
+      IOError: if the format types cannot be determined.
+      RuntimeError: if the format types cannot be determined.
+    """
+    if self._type_indicators_cache is None:
+      return analyzer.Analyzer.GetTypeIndicators(
+          source_path_spec, [format_category],
+          resolver_context=self._resolver_context)[format_category]
+
+    categorized_type_indicators = self._type_indicators_cache.get(
+        source_path_spec, None)
+
+    if (categorized_type_indicators is None or
+        format_category not in categorized_type_indicators):
+      categorized_type_indicators = analyzer.Analyzer.GetTypeIndicators(
+          source_path_spec, self._SCAN_FORMAT_CATEGORIES[format_category],
+          resolver_context=self._resolver_context)
+      self._type_indicators_cache[source_path_spec] = (
+          categorized_type_indicators)
+
+    return categorized_type_indicators[format_category]
+
   def _ScanNode(self, scan_context, scan_node, auto_recurse=True):
     """Scans for supported formats using a scan node.
 
@@ -561,7 +613,11 @@ class SourceScanner(object):
       scan_node = scan_context.GetUnscannedScanNode()
 
     if scan_node:
-      self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+      self._type_indicators_cache = {}
+      try:
+        self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+      finally:
+        self._type_indicators_cache = None
 
   def ScanForFileSystem(self, source_path_spec):
     """Scans the path specification for a supported file system format.
@@ -579,9 +635,9 @@ class SourceScanner(object):
                     system type is found.
     """
     try:
-      type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
-    except RuntimeError as exception:
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM)
+    except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           u'Unable to process source path specification with error: '
           u'{0:s}').format(exception))
@@ -621,9 +677,9 @@ class SourceScanner(object):
                     media image type is found.
     """
     try:
-      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
-    except RuntimeError as exception:
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
+    except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           u'Unable to process source path specification with error: '
           u'{0:s}').format(exception))
@@ -682,8 +738,8 @@ class SourceScanner(object):
         return source_path_spec
 
     try:
-      type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
     except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           u'Unable to process source path specification with error: '
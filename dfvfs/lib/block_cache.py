@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""The block cache.
+
+The block cache stores aligned blocks of data read from file-like objects,
+so that repeated small reads of the same data, such as those of file system
+metadata, do not need to be read and decoded again by the underlying
+file-like objects.
+"""
+
+import collections
+
+
+class BlockCache(object):
+  """Class that implements the block cache.
+
+  The blocks are stored in least recently used (LRU) order and the least
+  recently used blocks are evicted when the combined size of the cached
+  blocks exceeds the maximum size of the cache.
+  """
+
+  def __init__(self, maximum_size, block_size=32768):
+    """Initializes the block cache.
+
+    Args:
+      maximum_size (int): maximum combined size of the cached blocks
+          in bytes.
+      block_size (Optional[int]): size of a block in bytes.
+
+    Raises:
+      ValueError: if the maximum size or block size is invalid.
+    """
+    if maximum_size <= 0:
+      raise ValueError(u'Invalid maximum size: {0:d}.'.format(maximum_size))
+
+    if block_size <= 0:
+      raise ValueError(u'Invalid block size: {0:d}.'.format(block_size))
+
+    super(BlockCache, self).__init__()
+    self._block_size = block_size
+    self._blocks = collections.OrderedDict()
+    self._maximum_size = maximum_size
+    self._size = 0
+
+  @property
+  def block_size(self):
+    """int: size of a block in bytes."""
+    return self._block_size
+
+  @property
+  def maximum_size(self):
+    """int: maximum combined size of the cached blocks in bytes."""
+    return self._maximum_size
+
+  @property
+  def size(self):
+    """int: combined size of the cached blocks in bytes."""
+    return self._size
+
+  def _EvictBlocks(self, maximum_size):
+    """Evicts least recently used blocks until the cache fits a maximum size.
+
+    Args:
+      maximum_size (int): maximum combined size of the cached blocks
+          in bytes.
+    """
+    while self._blocks and self._size > maximum_size:
+      _, block_data = self._blocks.popitem(last=False)
+      self._size -= len(block_data)
+
+  def CacheBlock(self, identifier, block_index, block_data):
+    """Caches a block.
+
+    Blocks larger than the maximum size of the cache are not cached.
+
+    Args:
+      identifier (str): identifier of the file-like object that contains
+          the block, such as the comparable of its path specification.
+      block_index (int): index of the block within the file-like object.
+      block_data (bytes): data of the block.
+    """
+    block_data_size = len(block_data)
+    if block_data_size > self._maximum_size:
+      return
+
+    key = (identifier, block_index)
+    existing_block_data = self._blocks.pop(key, None)
+    if existing_block_data is not None:
+      self._size -= len(existing_block_data)
+
+    self._EvictBlocks(self._maximum_size - block_data_size)
+
+    self._blocks[key] = block_data
+    self._size += block_data_size
+
+  def Empty(self):
+    """Empties the cache."""
+    self._blocks = collections.OrderedDict()
+    self._size = 0
+
+  def GetBlock(self, identifier, block_index):
+    """Retrieves a cached block.
+
+    The block is marked as most recently used.
+
+    Args:
+      identifier (str): identifier of the file-like object that contains
+          the block, such as the comparable of its path specification.
+      block_index (int): index of the block within the file-like object.
+
+    Returns:
+      bytes: data of the block or None if not cached.
+    """
+    key = (identifier, block_index)
+    block_data = self._blocks.pop(key, None)
+    if block_data is not None:
+      self._blocks[key] = block_data
+
+    return block_data
+
+  def SetMaximumSize(self, maximum_size):
+    """Sets the maximum combined size of the cached blocks.
+
+    Args:
+      maximum_size (int): maximum combined size of the cached blocks
+          in bytes.
+
+    Raises:
+      ValueError: if the maximum size is invalid.
+    """
+    if maximum_size <= 0:
+      raise ValueError(u'Invalid maximum size: {0:d}.'.format(maximum_size))
+
+    self._maximum_size = maximum_size
+    self._EvictBlocks(maximum_size)
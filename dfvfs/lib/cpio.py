@@ -2,8 +2,7 @@
 """Helper functions for Copy in and out (CPIO) archive file support."""
 
 import os
-
-import construct
+import struct
 
 
 class CPIOArchiveFileEntry(object):
@@ -47,72 +46,41 @@ class CPIOArchiveFile(object):
   _CPIO_SIGNATURE_NEW_ASCII = b'070701'
   _CPIO_SIGNATURE_NEW_ASCII_WITH_CHECKSUM = b'070702'
 
-  _CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_STRUCT = construct.Struct(
-      u'cpio_binary_big_endian_file_entry',
-      construct.UBInt16(u'signature'),
-      construct.UBInt16(u'device_number'),
-      construct.UBInt16(u'inode_number'),
-      construct.UBInt16(u'mode'),
-      construct.UBInt16(u'user_identifier'),
-      construct.UBInt16(u'group_identifier'),
-      construct.UBInt16(u'number_of_links'),
-      construct.UBInt16(u'special_device_number'),
-      construct.UBInt16(u'modification_time_upper'),
-      construct.UBInt16(u'modification_time_lower'),
-      construct.UBInt16(u'path_string_size'),
-      construct.UBInt16(u'file_size_upper'),
-      construct.UBInt16(u'file_size_lower'))
-
-  _CPIO_BINARY_LITTLE_ENDIAN_FILE_ENTRY_STRUCT = construct.Struct(
-      u'cpio_binary_little_endian_file_entry',
-      construct.ULInt16(u'signature'),
-      construct.ULInt16(u'device_number'),
-      construct.ULInt16(u'inode_number'),
-      construct.ULInt16(u'mode'),
-      construct.ULInt16(u'user_identifier'),
-      construct.ULInt16(u'group_identifier'),
-      construct.ULInt16(u'number_of_links'),
-      construct.ULInt16(u'special_device_number'),
-      construct.ULInt16(u'modification_time_upper'),
-      construct.ULInt16(u'modification_time_lower'),
-      construct.ULInt16(u'path_string_size'),
-      construct.ULInt16(u'file_size_upper'),
-      construct.ULInt16(u'file_size_lower'))
-
-  _CPIO_PORTABLE_ASCII_FILE_ENTRY_STRUCT = construct.Struct(
-      u'cpio_portable_ascii_file_entry',
-      construct.Bytes(u'signature', 6),
-      construct.Bytes(u'device_number', 6),
-      construct.Bytes(u'inode_number', 6),
-      construct.Bytes(u'mode', 6),
-      construct.Bytes(u'user_identifier', 6),
-      construct.Bytes(u'group_identifier', 6),
-      construct.Bytes(u'number_of_links', 6),
-      construct.Bytes(u'special_device_number', 6),
-      construct.Bytes(u'modification_time', 11),
-      construct.Bytes(u'path_string_size', 6),
-      construct.Bytes(u'file_size', 11))
-
-  _CPIO_NEW_ASCII_FILE_ENTRY_STRUCT = construct.Struct(
-      u'cpio_portable_ascii_file_entry',
-      construct.Bytes(u'signature', 6),
-      construct.Bytes(u'inode_number', 8),
-      construct.Bytes(u'mode', 8),
-      construct.Bytes(u'user_identifier', 8),
-      construct.Bytes(u'group_identifier', 8),
-      construct.Bytes(u'number_of_links', 8),
-      construct.Bytes(u'modification_time', 8),
-      construct.Bytes(u'file_size', 8),
-      construct.Bytes(u'device_major_number', 8),
-      construct.Bytes(u'device_minor_number', 8),
-      construct.Bytes(u'special_device_major_number', 8),
-      construct.Bytes(u'special_device_minor_number', 8),
-      construct.Bytes(u'path_string_size', 8),
-      construct.Bytes(u'checksum', 8))
+  # The file entry header structures per file format. The structures are
+  # precompiled since they are used to parse every file entry.
+
+  # signature, device_number, inode_number, mode, user_identifier,
+  # group_identifier, number_of_links, special_device_number,
+  # modification_time_upper, modification_time_lower, path_string_size,
+  # file_size_upper, file_size_lower
+  _CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_STRUCT = struct.Struct(u'>13H')
+
+  _CPIO_BINARY_LITTLE_ENDIAN_FILE_ENTRY_STRUCT = struct.Struct(u'<13H')
+
+  # signature, device_number, inode_number, mode, user_identifier,
+  # group_identifier, number_of_links, special_device_number,
+  # modification_time, path_string_size, file_size
+  _CPIO_PORTABLE_ASCII_FILE_ENTRY_STRUCT = struct.Struct(
+      u'6s6s6s6s6s6s6s6s11s6s11s')
+
+  # signature, inode_number, mode, user_identifier, group_identifier,
+  # number_of_links, modification_time, file_size, device_major_number,
+  # device_minor_number, special_device_major_number,
+  # special_device_minor_number, path_string_size, checksum
+  _CPIO_NEW_ASCII_FILE_ENTRY_STRUCT = struct.Struct(
+      u'6s8s8s8s8s8s8s8s8s8s8s8s8s8s')
+
+  _FILE_ENTRY_STRUCTS = {
+      u'bin-big-endian': _CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_STRUCT,
+      u'bin-little-endian': _CPIO_BINARY_LITTLE_ENDIAN_FILE_ENTRY_STRUCT,
+      u'crc': _CPIO_NEW_ASCII_FILE_ENTRY_STRUCT,
+      u'newc': _CPIO_NEW_ASCII_FILE_ENTRY_STRUCT,
+      u'odc': _CPIO_PORTABLE_ASCII_FILE_ENTRY_STRUCT}
 
   def __init__(self):
     """Initializes the CPIO archive file object."""
     super(CPIOArchiveFile, self).__init__()
+    self._directory_file_entries = None
     self._file_entries = None
     self._file_object = None
     self._file_object_opened_in_object = False
@@ -131,59 +99,53 @@ class CPIOArchiveFile(object):
     """
     self._file_object.seek(file_offset, os.SEEK_SET)
 
-    if self.file_format == u'bin-big-endian':
-      file_entry_struct = self._CPIO_BINARY_BIG_ENDIAN_FILE_ENTRY_STRUCT
-    elif self.file_format == u'bin-little-endian':
-      file_entry_struct = self._CPIO_BINARY_LITTLE_ENDIAN_FILE_ENTRY_STRUCT
-    elif self.file_format == u'odc':
-      file_entry_struct = self._CPIO_PORTABLE_ASCII_FILE_ENTRY_STRUCT
-    elif self.file_format in (u'crc', u'newc'):
-      file_entry_struct = self._CPIO_NEW_ASCII_FILE_ENTRY_STRUCT
+    file_entry_struct = self._FILE_ENTRY_STRUCTS[self.file_format]
+    file_entry_struct_size = file_entry_struct.size
 
-    file_entry_struct_size = file_entry_struct.sizeof()
+    file_entry_data = self._file_object.read(file_entry_struct_size)
 
     try:
-      file_entry_struct = file_entry_struct.parse_stream(self._file_object)
-    except construct.FieldError as exception:
+      file_entry_values = file_entry_struct.unpack(file_entry_data)
+    except struct.error as exception:
       raise IOError((
           u'Unable to parse file entry data section with error: '
-          u'{0:s}').format(exception))
+          u'{0!s}').format(exception))
 
     file_offset += file_entry_struct_size
 
-    if self.file_format in (u'bin-big-endian', u'bin-little-endian'):
-      inode_number = file_entry_struct.inode_number
-      mode = file_entry_struct.mode
-      user_identifier = file_entry_struct.user_identifier
-      group_identifier = file_entry_struct.group_identifier
-
-      modification_time = (
-          (file_entry_struct.modification_time_upper << 16) |
-          file_entry_struct.modification_time_lower)
-
-      path_string_size = file_entry_struct.path_string_size
-
-      file_size = (
-          (file_entry_struct.file_size_upper << 16) |
-          file_entry_struct.file_size_lower)
-
-    elif self.file_format == u'odc':
-      inode_number = int(file_entry_struct.inode_number, 8)
-      mode = int(file_entry_struct.mode, 8)
-      user_identifier = int(file_entry_struct.user_identifier, 8)
-      group_identifier = int(file_entry_struct.group_identifier, 8)
-      modification_time = int(file_entry_struct.modification_time, 8)
-      path_string_size = int(file_entry_struct.path_string_size, 8)
-      file_size = int(file_entry_struct.file_size, 8)
-
-    elif self.file_format in (u'crc', u'newc'):
-      inode_number = int(file_entry_struct.inode_number, 16)
-      mode = int(file_entry_struct.mode, 16)
-      user_identifier = int(file_entry_struct.user_identifier, 16)
-      group_identifier = int(file_entry_struct.group_identifier, 16)
-      modification_time = int(file_entry_struct.modification_time, 16)
-      path_string_size = int(file_entry_struct.path_string_size, 16)
-      file_size = int(file_entry_struct.file_size, 16)
+    try:
+      if self.file_format in (u'bin-big-endian', u'bin-little-endian'):
+        inode_number = file_entry_values[2]
+        mode = file_entry_values[3]
+        user_identifier = file_entry_values[4]
+        group_identifier = file_entry_values[5]
+        modification_time = (
+            (file_entry_values[8] << 16) | file_entry_values[9])
+        path_string_size = file_entry_values[10]
+        file_size = (file_entry_values[11] << 16) | file_entry_values[12]
+
+      elif self.file_format == u'odc':
+        inode_number = int(file_entry_values[2], 8)
+        mode = int(file_entry_values[3], 8)
+        user_identifier = int(file_entry_values[4], 8)
+        group_identifier = int(file_entry_values[5], 8)
+        modification_time = int(file_entry_values[8], 8)
+        path_string_size = int(file_entry_values[9], 8)
+        file_size = int(file_entry_values[10], 8)
+
+      elif self.file_format in (u'crc', u'newc'):
+        inode_number = int(file_entry_values[1], 16)
+        mode = int(file_entry_values[2], 16)
+        user_identifier = int(file_entry_values[3], 16)
+        group_identifier = int(file_entry_values[4], 16)
+        modification_time = int(file_entry_values[6], 16)
+        file_size = int(file_entry_values[7], 16)
+        path_string_size = int(file_entry_values[12], 16)
+
+    except ValueError as exception:
+      raise IOError((
+          u'Unable to parse file entry data section with error: '
+          u'{0!s}').format(exception))
 
     path_string_data = self._file_object.read(path_string_size)
     file_offset += path_string_size
@@ -231,7 +193,11 @@ class CPIOArchiveFile(object):
     return file_entry
 
   def _ReadFileEntries(self):
-    """Reads the file entries from the cpio archive."""
+    """Reads the file entries from the cpio archive.
+
+    The file entries are indexed by their path and by the path of their
+    parent directory.
+    """
     file_offset = 0
     while file_offset < self._file_size:
       file_entry = self._ReadFileEntry(file_offset)
@@ -245,8 +211,13 @@ class CPIOArchiveFile(object):
 
       self._file_entries[file_entry.path] = file_entry
 
+      parent_path, _, _ = file_entry.path.rpartition(u'/')
+      self._directory_file_entries.setdefault(parent_path, []).append(
+          file_entry)
+
   def Close(self):
     """Closes the CPIO archive file."""
+    self._directory_file_entries = None
     self._file_entries = None
     self._file_object = None
     self._file_size = None
@@ -262,6 +233,23 @@ class CPIOArchiveFile(object):
 
     return path in self._file_entries
 
+  def GetDirectoryFileEntries(self, path=u''):
+    """Retrieves the file entries of a directory.
+
+    Args:
+      path: optional string containing the path of the directory, where
+            an empty string represents the root directory.
+
+    Yields:
+      A CPIO archive file entry (instance of CPIOArchiveFileEntry).
+    """
+    if self._directory_file_entries is None:
+      return
+
+    path = path.rstrip(u'/')
+    for file_entry in self._directory_file_entries.get(path, []):
+      yield file_entry
+
   def GetFileEntries(self, path_prefix=u''):
     """Retrieves the file entries.
 
@@ -314,6 +302,7 @@ class CPIOArchiveFile(object):
     if self.file_format is None:
       raise IOError(u'Unsupported CPIO format.')
 
+    self._directory_file_entries = {}
     self._file_entries = {}
     self._file_object = file_object
     self._file_size = file_object.get_size()
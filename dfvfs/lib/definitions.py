@@ -25,6 +25,11 @@ ENCRYPTION_MODE_CFB = u'cfb'
 ENCRYPTION_MODE_ECB = u'ecb'
 ENCRYPTION_MODE_OFB = u'ofb'
 
+# The extent type definitions.
+EXTENT_TYPE_COMPRESSED = u'compressed'
+EXTENT_TYPE_DATA = u'data'
+EXTENT_TYPE_SPARSE = u'sparse'
+
 # The type indicator definitions.
 TYPE_INDICATOR_BDE = u'BDE'
 TYPE_INDICATOR_BZIP2 = u'BZIP2'
@@ -47,6 +52,7 @@ TYPE_INDICATOR_SQLITE_BLOB = u'SQLITE_BLOB'
 TYPE_INDICATOR_TAR = u'TAR'
 TYPE_INDICATOR_TSK = u'TSK'
 TYPE_INDICATOR_TSK_PARTITION = u'TSK_PARTITION'
+TYPE_INDICATOR_TSK_UNALLOCATED = u'TSK_UNALLOCATED'
 TYPE_INDICATOR_VHDI = u'VHDI'
 TYPE_INDICATOR_VMDK = u'VMDK'
 TYPE_INDICATOR_VSHADOW = u'VSHADOW'
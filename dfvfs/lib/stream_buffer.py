@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""The stream buffer.
+
+The stream buffer contains data that was produced by a stream file-like
+object, such as the output of a decompressor, decoder or decrypter, but that
+has not been read yet. The data is referenced using memoryviews, hence it is
+only copied when it is read, for example directly into a preallocated buffer
+of the caller.
+"""
+
+import collections
+
+
+class StreamBuffer(object):
+  """Class that implements the stream buffer.
+
+  The buffer is a first-in first-out queue of the data appended to it.
+  Reading or skipping data only advances the offset of the start of
+  the buffer in the first data, it does not copy the remaining data.
+
+  The data that was read or skipped of the first data remains available
+  to rewind the buffer to, until other data is appended.
+  """
+
+  def __init__(self):
+    """Initializes the stream buffer."""
+    super(StreamBuffer, self).__init__()
+    self._data_offset = 0
+    self._data_queue = collections.deque()
+    self._size = 0
+
+  @property
+  def size(self):
+    """int: number of bytes of data in the buffer."""
+    return self._size
+
+  def Append(self, data):
+    """Appends data to the buffer.
+
+    The data is not copied, hence it should not be changed while it is
+    in the buffer.
+
+    Args:
+      data (bytes): data.
+    """
+    if data:
+      # Data that has been read entirely is no longer retained.
+      if not self._size:
+        self._data_offset = 0
+        self._data_queue.clear()
+
+      self._data_queue.append(data)
+      self._size += len(data)
+
+  def Clear(self):
+    """Removes all the data from the buffer."""
+    self._data_offset = 0
+    self._data_queue.clear()
+    self._size = 0
+
+  def Read(self, size=None):
+    """Reads data from the buffer.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None represents
+          all the data in the buffer.
+
+    Returns:
+      bytes: data read, which is smaller than the requested size if
+          the buffer contains less data.
+    """
+    if size is None or size > self._size:
+      size = self._size
+
+    if size <= 0:
+      return b''
+
+    data = self._data_queue[0]
+    data_offset = self._data_offset
+    data_end_offset = data_offset + size
+    data_size = len(data)
+
+    if data_end_offset > data_size:
+      # The data spans multiple appended data, which are copied once into
+      # a preallocated buffer.
+      read_buffer = bytearray(size)
+      self.ReadInto(read_buffer)
+      return bytes(read_buffer)
+
+    if data_end_offset < data_size or len(self._data_queue) == 1:
+      self._data_offset = data_end_offset
+    else:
+      self._data_offset = 0
+      self._data_queue.popleft()
+
+    self._size -= size
+
+    # Data that is read entirely is returned without copying it.
+    if data_offset > 0 or data_end_offset < data_size:
+      data = data[data_offset:data_end_offset]
+
+    return data
+
+  def ReadInto(self, buffer):
+    """Reads data from the buffer into a preallocated buffer.
+
+    Args:
+      buffer (bytearray): buffer to read the data into, which can also be
+          another writable bytes-like object, such as a memoryview.
+
+    Returns:
+      int: number of bytes read, which is smaller than the size of
+          the buffer if the stream buffer contains less data.
+    """
+    buffer_view = memoryview(buffer)
+    read_size = min(len(buffer_view), self._size)
+
+    buffer_offset = 0
+    while buffer_offset < read_size:
+      data = self._data_queue[0]
+      copy_size = min(
+          len(data) - self._data_offset, read_size - buffer_offset)
+
+      data_view = memoryview(data)
+      buffer_view[buffer_offset:buffer_offset + copy_size] = data_view[
+          self._data_offset:self._data_offset + copy_size]
+      buffer_offset += copy_size
+
+      self.Skip(copy_size)
+
+    return read_size
+
+  def Rewind(self, size):
+    """Rewinds the buffer to data that was read or skipped.
+
+    Args:
+      size (int): number of bytes to rewind.
+
+    Returns:
+      bool: True if the buffer was rewound, False if the data is no longer
+          retained.
+    """
+    if size < 0 or size > self._data_offset:
+      return False
+
+    self._data_offset -= size
+    self._size += size
+    return True
+
+  def Skip(self, size):
+    """Skips data in the buffer.
+
+    Args:
+      size (int): number of bytes to skip.
+
+    Returns:
+      int: number of bytes skipped, which is smaller than the requested size
+          if the buffer contains less data.
+    """
+    size = min(size, self._size)
+    if size <= 0:
+      return 0
+
+    data_offset = self._data_offset + size
+    while (len(self._data_queue) > 1 and
+           data_offset >= len(self._data_queue[0])):
+      data_offset -= len(self._data_queue.popleft())
+
+    self._data_offset = data_offset
+    self._size -= size
+    return size
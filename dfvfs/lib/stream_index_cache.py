@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""The stream index cache.
+
+The stream index cache persists information about streams that is expensive
+to determine, such as the uncompressed size of a compressed stream, in
+a directory on disk so that it can be reused by other processes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from dfvfs.lib import py2to3
+
+
+class StreamIndexCache(object):
+  """Class that implements the stream index cache.
+
+  Every stream index is stored in a separate JSON file, of which the name
+  is derived from the identifier of the stream. The stream index is only
+  returned if the fingerprint of the stream matches the stored fingerprint.
+  """
+
+  # The size of the data at the start and the end of the stream used
+  # to calculate the fingerprint.
+  _FINGERPRINT_DATA_SIZE = 64 * 1024
+
+  # The version of the format of the stream index files.
+  _FORMAT_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes the stream index cache.
+
+    Args:
+      path (str): path of the directory that contains the stream index files.
+
+    Raises:
+      ValueError: if the path does not exist or is not a directory.
+    """
+    if not os.path.isdir(path):
+      raise ValueError(u'No such directory: {0:s}.'.format(path))
+
+    super(StreamIndexCache, self).__init__()
+    self._path = path
+
+  def _GetStreamIndexPath(self, identifier):
+    """Retrieves the path of the stream index file.
+
+    Args:
+      identifier (str): identifier of the stream, such as the comparable
+          of the path specification of the stream.
+
+    Returns:
+      str: path of the stream index file.
+    """
+    if isinstance(identifier, py2to3.UNICODE_TYPE):
+      identifier = identifier.encode(u'utf-8')
+
+    filename = u'{0:s}.json'.format(hashlib.sha256(identifier).hexdigest())
+    return os.path.join(self._path, filename)
+
+  def GetFingerprint(self, file_object):
+    """Calculates the fingerprint of the data of a stream.
+
+    The fingerprint is calculated over the size of the data and a limited
+    amount of data at the start and the end of the stream, so it is cheap
+    to calculate regardless of the size of the stream.
+
+    Args:
+      file_object (FileIO): file-like object of the data of the stream.
+
+    Returns:
+      str: fingerprint of the data of the stream.
+    """
+    data_size = file_object.get_size()
+
+    hash_context = hashlib.sha256()
+    hash_context.update(u'{0:d}'.format(data_size).encode(u'ascii'))
+
+    file_object.seek(0, os.SEEK_SET)
+    hash_context.update(file_object.read(self._FINGERPRINT_DATA_SIZE))
+
+    if data_size > self._FINGERPRINT_DATA_SIZE:
+      tail_offset = max(
+          self._FINGERPRINT_DATA_SIZE, data_size - self._FINGERPRINT_DATA_SIZE)
+      file_object.seek(tail_offset, os.SEEK_SET)
+      hash_context.update(file_object.read(self._FINGERPRINT_DATA_SIZE))
+
+    return hash_context.hexdigest()
+
+  def GetStreamIndex(self, identifier, fingerprint):
+    """Retrieves a stream index.
+
+    Args:
+      identifier (str): identifier of the stream, such as the comparable
+          of the path specification of the stream.
+      fingerprint (str): fingerprint of the data of the stream.
+
+    Returns:
+      dict[str, object]: stream index or None if not available or if
+          the stored stream index is stale or cannot be read.
+    """
+    stream_index_path = self._GetStreamIndexPath(identifier)
+    if not os.path.exists(stream_index_path):
+      return
+
+    try:
+      with open(stream_index_path, 'rb') as file_object:
+        stream_index_data = json.loads(file_object.read().decode(u'utf-8'))
+
+    except (IOError, OSError, UnicodeDecodeError, ValueError):
+      return
+
+    if not isinstance(stream_index_data, dict):
+      return
+
+    if (stream_index_data.get(u'format_version', None) !=
+        self._FORMAT_VERSION or
+        stream_index_data.get(u'identifier', None) != identifier or
+        stream_index_data.get(u'fingerprint', None) != fingerprint):
+      return
+
+    return stream_index_data.get(u'stream_index', None)
+
+  def StoreStreamIndex(self, identifier, fingerprint, stream_index):
+    """Stores a stream index.
+
+    The stream index is written to a temporary file first, which is then
+    renamed, so that concurrent readers never see a partially written
+    stream index. Failures to store the stream index are ignored since
+    the cache is an optimization.
+
+    Args:
+      identifier (str): identifier of the stream, such as the comparable
+          of the path specification of the stream.
+      fingerprint (str): fingerprint of the data of the stream.
+      stream_index (dict[str, object]): stream index, which must be
+          serializable to JSON.
+    """
+    stream_index_data = {
+        u'fingerprint': fingerprint,
+        u'format_version': self._FORMAT_VERSION,
+        u'identifier': identifier,
+        u'stream_index': stream_index}
+
+    stream_index_path = self._GetStreamIndexPath(identifier)
+
+    try:
+      file_descriptor, temporary_path = tempfile.mkstemp(
+          dir=self._path, suffix=u'.tmp')
+
+    except (IOError, OSError):
+      return
+
+    try:
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        file_object.write(json.dumps(stream_index_data).encode(u'utf-8'))
+
+      try:
+        os.rename(temporary_path, stream_index_path)
+      except OSError:
+        # On Windows rename fails if the destination already exists.
+        os.remove(stream_index_path)
+        os.rename(temporary_path, stream_index_path)
+
+    except (IOError, OSError):
+      try:
+        os.remove(temporary_path)
+      except OSError:
+        pass
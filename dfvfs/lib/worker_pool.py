@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Helper functions to process tasks with a pool of worker threads or processes.
+
+Every worker uses its own resolver context, since the file-like and file
+system objects cached in a resolver context cannot be shared between threads
+or processes.
+"""
+
+import multiprocessing
+import multiprocessing.pool
+import threading
+
+from dfvfs.resolver import context
+
+
+# The state of a worker thread or process.
+_worker_state = threading.local()
+
+
+def _InitializeWorker(initializer, initializer_arguments):
+  """Initializes a worker thread or process.
+
+  Args:
+    initializer (callable): function that initializes the data of the worker
+        or None.
+    initializer_arguments (tuple): arguments of the initializer function.
+  """
+  _worker_state.resolver_context = context.Context()
+  _worker_state.data = None
+  if initializer:
+    _worker_state.data = initializer(*initializer_arguments)
+
+
+def GetNumberOfWorkers(number_of_workers):
+  """Retrieves the number of workers.
+
+  Args:
+    number_of_workers (int): number of workers, where None represents
+        the number of CPUs.
+
+  Returns:
+    int: number of workers.
+
+  Raises:
+    ValueError: if the number of workers is invalid.
+  """
+  if number_of_workers is None:
+    return multiprocessing.cpu_count()
+
+  if number_of_workers < 0:
+    raise ValueError(
+        u'Invalid number of workers: {0:d}.'.format(number_of_workers))
+
+  return number_of_workers
+
+
+def GetWorkerData():
+  """Retrieves the data of the current worker.
+
+  Returns:
+    object: data returned by the initializer function of the worker.
+  """
+  return _worker_state.data
+
+
+def GetWorkerResolverContext():
+  """Retrieves the resolver context of the current worker.
+
+  Returns:
+    Context: resolver context of the worker.
+  """
+  return _worker_state.resolver_context
+
+
+def Map(
+    function, tasks, number_of_workers, chunk_size=1, initializer=None,
+    initializer_arguments=(), ordered=True, use_threads=False):
+  """Processes tasks with a pool of workers.
+
+  The pool is stopped once all the results have been retrieved. Worker
+  processes can only call functions defined at the module level.
+
+  Args:
+    function (callable): function that processes a task.
+    tasks (iterable[object]): tasks.
+    number_of_workers (int): number of workers.
+    chunk_size (Optional[int]): number of tasks handed to a worker at once.
+    initializer (Optional[callable]): function that initializes the data of
+        a worker, which is available to the function using GetWorkerData().
+    initializer_arguments (Optional[tuple]): arguments of the initializer
+        function.
+    ordered (Optional[bool]): True if the results should be returned in
+        the order of the tasks, False if they should be returned as soon as
+        they are available.
+    use_threads (Optional[bool]): True if the workers should be threads
+        instead of processes.
+
+  Yields:
+    object: result of the function.
+  """
+  if use_threads:
+    pool_class = multiprocessing.pool.ThreadPool
+  else:
+    pool_class = multiprocessing.Pool
+
+  pool = pool_class(
+      processes=number_of_workers, initializer=_InitializeWorker,
+      initargs=(initializer, initializer_arguments))
+
+  try:
+    if ordered:
+      results = pool.imap(function, tasks, chunk_size)
+    else:
+      results = pool.imap_unordered(function, tasks, chunk_size)
+
+    for result in results:
+      yield result
+
+    pool.close()
+
+  except:
+    pool.terminate()
+    raise
+
+  finally:
+    pool.join()
@@ -22,6 +22,7 @@ from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import tar_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.path import tsk_partition_path_spec
+from dfvfs.path import tsk_unallocated_path_spec
 from dfvfs.path import vhdi_path_spec
 from dfvfs.path import vmdk_path_spec
 from dfvfs.path import vshadow_path_spec
@@ -7,12 +7,21 @@ import abc
 class PathSpec(object):
   """Class that implements the path specification object interface.
 
+  The comparable representation and the hash of a path specification are
+  determined once and then cached. A path specification therefore becomes
+  immutable once its comparable or hash has been determined, for example
+  when it is used as a key in the resolver cache.
+
   Attributes:
     parent (PathSpec): parent path specification.
   """
 
   _IS_SYSTEM_LEVEL = False
 
+  # Names of the attributes that cache the comparable representation.
+  _CACHED_ATTRIBUTE_NAMES = frozenset([
+      u'_comparable', u'_hash', u'_sub_comparable'])
+
   def __init__(self, parent=None, **kwargs):
     """Initializes the path specification object.
 
@@ -29,20 +38,91 @@ class PathSpec(object):
           u', '.join(kwargs)))
 
     super(PathSpec, self).__init__()
+    self._comparable = None
+    self._hash = None
+    self._sub_comparable = None
     self.parent = parent
 
   def __eq__(self, other):
     """Determines if the path specification is equal to the other."""
-    return isinstance(other, PathSpec) and self.comparable == other.comparable
+    if self is other:
+      return True
+
+    if not isinstance(other, PathSpec):
+      return False
+
+    if hash(self) != hash(other):
+      return False
+
+    # Path specifications with the same parent object only differ in their
+    # own part of the comparable.
+    if self.parent is other.parent:
+      # Accessing the comparable property caches the sub comparable.
+      _ = self.comparable
+      _ = other.comparable
+      # pylint: disable=protected-access
+      return self._sub_comparable == other._sub_comparable
+
+    return self.comparable == other.comparable
+
+  def __getstate__(self):
+    """Retrieves the state of the path specification for copy and pickle.
+
+    Returns:
+      dict[str, object]: state of the path specification without the cached
+          comparable representation, so copies are mutable.
+    """
+    return {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in iter(self.__dict__.items())
+        if attribute_name not in self._CACHED_ATTRIBUTE_NAMES}
 
   def __hash__(self):
     """Returns the hash of a path specification."""
-    return hash(self.comparable)
+    if self._hash is None:
+      self._hash = hash(self.comparable)
+    return self._hash
+
+  def __ne__(self, other):
+    """Determines if the path specification is not equal to the other."""
+    return not self.__eq__(other)
+
+  def __setattr__(self, name, value):
+    """Sets an attribute of the path specification.
+
+    Args:
+      name (str): name of the attribute.
+      value (object): value of the attribute.
+
+    Raises:
+      AttributeError: if the comparable representation of the path
+          specification has been determined.
+    """
+    if (name not in self._CACHED_ATTRIBUTE_NAMES and
+        self.__dict__.get(u'_comparable', None) is not None):
+      raise AttributeError(
+          u'Path specification is immutable once its comparable has been '
+          u'determined.')
+
+    super(PathSpec, self).__setattr__(name, value)
+
+  def __setstate__(self, state):
+    """Restores the state of the path specification for copy and pickle.
+
+    Args:
+      state (dict[str, object]): state of the path specification.
+    """
+    self.__dict__.update(state)
+    self.__dict__[u'_comparable'] = None
+    self.__dict__[u'_hash'] = None
+    self.__dict__[u'_sub_comparable'] = None
 
   def _GetComparable(self, sub_comparable_string=u''):
     """Retrieves the comparable representation.
 
-    This is a convenience function for constructing comparables.
+    This is a convenience function for constructing comparables. The
+    comparable representation is only constructed once, since it includes
+    the comparable representations of all parent path specifications.
 
     Args:
       sub_comparable_string (str): sub comparable string.
@@ -50,16 +130,20 @@ class PathSpec(object):
     Returns:
       str: comparable representation of the path specification.
     """
-    string_parts = []
+    if self._comparable is None:
+      string_parts = []
+
+      string_parts.append(u'type: {0:s}'.format(self.type_indicator))
 
-    string_parts.append(getattr(self.parent, u'comparable', u''))
-    string_parts.append(u'type: {0:s}'.format(self.type_indicator))
+      if sub_comparable_string:
+        string_parts.append(u', {0:s}'.format(sub_comparable_string))
+      string_parts.append(u'\n')
 
-    if sub_comparable_string:
-      string_parts.append(u', {0:s}'.format(sub_comparable_string))
-    string_parts.append(u'\n')
+      self._sub_comparable = u''.join(string_parts)
+      self._comparable = u''.join([
+          getattr(self.parent, u'comparable', u''), self._sub_comparable])
 
-    return u''.join(string_parts)
+    return self._comparable
 
   @abc.abstractproperty
   def comparable(self):
@@ -82,7 +166,7 @@ class PathSpec(object):
     """
     path_spec_dict = {}
     for attribute_name, attribute_value in iter(self.__dict__.items()):
-      if attribute_value is None:
+      if attribute_value is None or attribute_name.startswith(u'_'):
         continue
 
       if attribute_name == u'parent':
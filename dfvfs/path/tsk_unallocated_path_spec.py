@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""The SleuthKit (TSK) unallocated space path specification implementation."""
+
+from dfvfs.lib import definitions
+from dfvfs.path import factory
+from dfvfs.path import path_spec
+
+
+class TSKUnallocatedPathSpec(path_spec.PathSpec):
+  """Class that implements the TSK unallocated space path specification.
+
+  The path specification represents the unallocated blocks of the file
+  system that is contained in the parent as one contiguous stream.
+  """
+
+  TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK_UNALLOCATED
+
+  def __init__(self, parent=None, **kwargs):
+    """Initializes the path specification object.
+
+    Note that the TSK unallocated space path specification must have
+    a parent.
+
+    Args:
+      parent (Optional[PathSpec]): parent path specification.
+
+    Raises:
+      ValueError: when parent is not set.
+    """
+    if not parent:
+      raise ValueError(u'Missing parent value.')
+
+    super(TSKUnallocatedPathSpec, self).__init__(parent=parent, **kwargs)
+
+  @property
+  def comparable(self):
+    """str: comparable representation of the path specification."""
+    return self._GetComparable()
+
+
+# Register the path specification with the factory.
+factory.Factory.RegisterPathSpec(TSKUnallocatedPathSpec)
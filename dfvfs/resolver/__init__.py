@@ -61,6 +61,11 @@ try:
 except ImportError:
   pass
 
+try:
+  from dfvfs.resolver import tsk_unallocated_resolver_helper
+except ImportError:
+  pass
+
 try:
   from dfvfs.resolver import vhdi_resolver_helper
 except ImportError:
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The resolver objects cache."""
 
+import collections
+
 from dfvfs.lib import errors
 
 
@@ -43,7 +45,12 @@ class ObjectsCacheValue(object):
 
 
 class ObjectsCache(object):
-  """Class that implements the resolver object cache."""
+  """Class that implements the resolver object cache.
+
+  The cache retains dereferenced objects, so that they can be reused.
+  When the maximum number of cached values is reached the least recently
+  used dereferenced object is evicted from the cache.
+  """
 
   def __init__(self, maximum_number_of_cached_values):
     """Initializes the resolver objects cache object.
@@ -59,36 +66,75 @@ class ObjectsCache(object):
           u'Invalid maximum number of cached objects value zero or less.')
 
     super(ObjectsCache, self).__init__()
+    # The identifiers of the dereferenced objects are ordered from least
+    # to most recently used.
+    self._dereferenced_identifiers = collections.OrderedDict()
+    self._identifiers = {}
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
     self._values = {}
 
+  def _EvictObject(self):
+    """Evicts the least recently used dereferenced object.
+
+    Returns:
+      The evicted VFS object or None if all cached objects are referenced.
+    """
+    if not self._dereferenced_identifiers:
+      return
+
+    identifier, _ = self._dereferenced_identifiers.popitem(last=False)
+    cache_value = self._values.pop(identifier)
+    self._identifiers.pop(id(cache_value.vfs_object), None)
+    return cache_value.vfs_object
+
   def CacheObject(self, identifier, vfs_object):
     """Caches a VFS object.
 
-    This method ignores the cache value reference count.
+    This method ignores the cache value reference count. If the maximum
+    number of cached values is reached dereferenced objects are evicted
+    from the cache. The caller is responsible for closing the evicted
+    objects.
 
     Args:
       identifier: string that identifies the VFS object.
       vfs_object: the VFS object to cache.
 
+    Returns:
+      A list of the VFS objects that were evicted from the cache.
+
     Raises:
-      CacheFullError: if he maximum number of cached values is reached.
+      CacheFullError: if he maximum number of cached values is reached and
+                      none of the cached objects is dereferenced.
       KeyError: if the VFS object already is cached.
     """
     if identifier in self._values:
       raise KeyError(u'Object already cached for identifier: {0:s}'.format(
           identifier))
 
-    if len(self._values) == self._maximum_number_of_cached_values:
+    evicted_objects = []
+    while len(self._values) >= self._maximum_number_of_cached_values:
+      evicted_object = self._EvictObject()
+      if evicted_object is None:
+        break
+
+      evicted_objects.append(evicted_object)
+
+    if len(self._values) >= self._maximum_number_of_cached_values:
       raise errors.CacheFullError(u'Maximum number of cached values reached.')
 
+    self._dereferenced_identifiers[identifier] = True
+    self._identifiers[id(vfs_object)] = identifier
     self._values[identifier] = ObjectsCacheValue(vfs_object)
 
+    return evicted_objects
+
   def Empty(self):
     """Empties the cache.
 
     This method ignores the cache value reference count.
     """
+    self._dereferenced_identifiers.clear()
+    self._identifiers.clear()
     self._values.clear()
 
   def GetCacheValue(self, identifier):
@@ -100,9 +146,6 @@ class ObjectsCache(object):
     Returns:
       The cache value object (instance of ObjectsCacheValue) or
       None if not cached.
-
-    Raises:
-      RuntimeError: if the cache value is missing.
     """
     return self._values.get(identifier, None)
 
@@ -120,14 +163,29 @@ class ObjectsCache(object):
     Raises:
       RuntimeError: if the cache value is missing.
     """
-    for identifier, cache_value in iter(self._values.items()):
-      if not cache_value:
-        raise RuntimeError(u'Missing cache value.')
+    identifier = self._identifiers.get(id(vfs_object), None)
+    if identifier is None:
+      return None, None
+
+    cache_value = self._values.get(identifier, None)
+    if not cache_value:
+      raise RuntimeError(u'Missing cache value.')
+
+    if cache_value.vfs_object is not vfs_object:
+      return None, None
 
-      if cache_value.vfs_object == vfs_object:
-        return identifier, cache_value
+    return identifier, cache_value
 
-    return None, None
+  def GetDereferencedObjects(self):
+    """Retrieves the cached objects that are dereferenced.
+
+    Returns:
+      A list of the dereferenced VFS objects, ordered from least to most
+      recently used.
+    """
+    return [
+        self._values[identifier].vfs_object
+        for identifier in iter(self._dereferenced_identifiers.keys())]
 
   def GetObject(self, identifier):
     """Retrieves a cached object based on the identifier.
@@ -149,7 +207,8 @@ class ObjectsCache(object):
   def GrabObject(self, identifier):
     """Grabs a cached object based on the identifier.
 
-    This method increments the cache value reference count.
+    This method increments the cache value reference count, hence the object
+    is no longer evicted until it is dereferenced again.
 
     Args:
       identifier: string that identifies the VFS object.
@@ -168,11 +227,13 @@ class ObjectsCache(object):
           identifier))
 
     cache_value.IncrementReferenceCount()
+    self._dereferenced_identifiers.pop(identifier, None)
 
   def ReleaseObject(self, identifier):
     """Releases a cached object based on the identifier.
 
-    This method decrements the cache value reference count.
+    This method decrements the cache value reference count. An object that
+    is dereferenced becomes the most recently used dereferenced object.
 
     Args:
       identifier: string that identifies the VFS object.
@@ -191,6 +252,8 @@ class ObjectsCache(object):
           identifier))
 
     cache_value.DecrementReferenceCount()
+    if cache_value.IsDereferenced():
+      self._dereferenced_identifiers[identifier] = True
 
   def RemoveObject(self, identifier):
     """Removes a cached object based on the identifier.
@@ -207,7 +270,9 @@ class ObjectsCache(object):
       raise KeyError(u'Missing cached object for identifier: {0:s}'.format(
           identifier))
 
-    del self._values[identifier]
+    cache_value = self._values.pop(identifier)
+    self._dereferenced_identifiers.pop(identifier, None)
+    self._identifiers.pop(id(cache_value.vfs_object), None)
 
   def SetMaximumNumberOfCachedValues(self, maximum_number_of_cached_values):
     """Sets the maximum number of cached values.
@@ -1,15 +1,26 @@
 # -*- coding: utf-8 -*-
 """The resolver context object."""
 
+from dfvfs.lib import block_cache
+from dfvfs.lib import stream_index_cache
 from dfvfs.resolver import cache
 
 
 class Context(object):
-  """Class that implements the resolver context."""
+  """Class that implements the resolver context.
+
+  File-like and file system objects that are released remain open and
+  cached, so that they can be reused without having to reopen them, until
+  they are evicted from the cache to make room for other objects.
+
+  The context also contains the block cache that is shared by the block
+  cached file-like objects, which bounds the memory used to cache data.
+  """
 
   def __init__(
       self, maximum_number_of_file_objects=128,
-      maximum_number_of_file_systems=16):
+      maximum_number_of_file_systems=16, stream_index_cache_path=None,
+      maximum_block_cache_size=32 * 1024 * 1024):
     """Initializes the resolver context object.
 
     Args:
@@ -19,12 +30,30 @@ class Context(object):
       maximum_number_of_file_systems: optional maximum number of file system
                                       objects cached in the context. The
                                       default is 16.
+      stream_index_cache_path: optional path of the directory in which
+                               stream indexes, such as the uncompressed
+                               size of compressed streams, are persisted.
+                               The default is None, which disables
+                               persisting stream indexes.
+      maximum_block_cache_size: optional maximum combined size in bytes of
+                                the blocks of data cached in the context
+                                by block cached file-like objects. The
+                                default is 32 MiB, 0 disables the block
+                                cache.
     """
     super(Context, self).__init__()
+    self._block_cache = None
     self._file_object_cache = cache.ObjectsCache(
         maximum_number_of_file_objects)
     self._file_system_cache = cache.ObjectsCache(
         maximum_number_of_file_systems)
+    self._stream_index_cache = None
+
+    if maximum_block_cache_size:
+      self.SetMaximumBlockCacheSize(maximum_block_cache_size)
+
+    if stream_index_cache_path:
+      self.SetStreamIndexCachePath(stream_index_cache_path)
 
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
@@ -45,27 +74,109 @@ class Context(object):
   def CacheFileObject(self, path_spec, file_object):
     """Caches a file-like object based on a path specification.
 
+    Dereferenced file-like objects that are evicted from the cache to make
+    room for the file-like object are closed.
+
     Args:
       path_spec: the path specification (instance of PathSpec).
       file_object: the file-like object (instance of FileIO).
+
+    Raises:
+      CacheFullError: if the maximum number of cached file-like objects is
+                      reached and none of them is dereferenced.
     """
-    self._file_object_cache.CacheObject(path_spec.comparable, file_object)
+    evicted_file_objects = self._file_object_cache.CacheObject(
+        path_spec.comparable, file_object)
+
+    for evicted_file_object in evicted_file_objects:
+      evicted_file_object.CloseDereferenced()
 
   def CacheFileSystem(self, path_spec, file_system):
     """Caches a file system object based on a path specification.
 
+    Dereferenced file system objects that are evicted from the cache to make
+    room for the file system object are closed.
+
     Args:
       path_spec: the path specification (instance of PathSpec).
       file_system: the file system object (instance of vfs.FileSystem).
+
+    Raises:
+      CacheFullError: if the maximum number of cached file system objects is
+                      reached and none of them is dereferenced.
     """
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
-    self._file_system_cache.CacheObject(identifier, file_system)
+    evicted_file_systems = self._file_system_cache.CacheObject(
+        identifier, file_system)
+
+    for evicted_file_system in evicted_file_systems:
+      evicted_file_system.CloseDereferenced()
 
   def Empty(self):
-    """Empties the caches."""
-    self._file_object_cache.Empty()
+    """Empties the caches.
+
+    Dereferenced objects are closed, referenced objects are closed by their
+    owners.
+    """
+    # File systems are closed first since they can reference file-like
+    # objects.
+    dereferenced_file_systems = (
+        self._file_system_cache.GetDereferencedObjects())
     self._file_system_cache.Empty()
 
+    for file_system in dereferenced_file_systems:
+      file_system.CloseDereferenced()
+
+    dereferenced_file_objects = (
+        self._file_object_cache.GetDereferencedObjects())
+    self._file_object_cache.Empty()
+
+    for file_object in dereferenced_file_objects:
+      file_object.CloseDereferenced()
+
+    if self._block_cache:
+      self._block_cache.Empty()
+
+  def EvictFileObject(self, file_object):
+    """Evicts a dereferenced file-like object from the cache.
+
+    The caller is responsible for closing the evicted file-like object.
+
+    Args:
+      file_object: the file-like object (instance of FileIO).
+
+    Returns:
+      A boolean value indicating true if the file-like object was evicted or
+      false if it is not cached or still referenced.
+    """
+    identifier, cache_value = self._file_object_cache.GetCacheValueByObject(
+        file_object)
+    if not identifier or not cache_value.IsDereferenced():
+      return False
+
+    self._file_object_cache.RemoveObject(identifier)
+    return True
+
+  def EvictFileSystem(self, file_system):
+    """Evicts a dereferenced file system object from the cache.
+
+    The caller is responsible for closing the evicted file system object.
+
+    Args:
+      file_system: the file system object (instance of vfs.FileSystem).
+
+    Returns:
+      A boolean value indicating true if the file system object was evicted
+      or false if it is not cached or still referenced.
+    """
+    identifier, cache_value = self._file_system_cache.GetCacheValueByObject(
+        file_system)
+    if not identifier or not cache_value.IsDereferenced():
+      return False
+
+    self._file_system_cache.RemoveObject(identifier)
+    return True
+
   def ForceRemoveFileObject(self, path_spec):
     """Forces the removal of a file-like object based on a path specification.
 
@@ -82,8 +193,20 @@ class Context(object):
     while not cache_value.IsDereferenced():
       cache_value.vfs_object.close()
 
+    if self.EvictFileObject(cache_value.vfs_object):
+      cache_value.vfs_object.CloseDereferenced()
+
     return True
 
+  def GetBlockCache(self):
+    """Retrieves the block cache.
+
+    Returns:
+      The block cache (instance of BlockCache) or None if the block cache
+      is disabled.
+    """
+    return self._block_cache
+
   def GetFileObject(self, path_spec):
     """Retrieves a file-like object defined by path specification.
 
@@ -140,6 +263,15 @@ class Context(object):
 
     return cache_value.reference_count
 
+  def GetStreamIndexCache(self):
+    """Retrieves the stream index cache.
+
+    Returns:
+      The stream index cache (instance of StreamIndexCache) or None if
+      persisting stream indexes is disabled.
+    """
+    return self._stream_index_cache
+
   def GrabFileObject(self, path_spec):
     """Grabs a cached file-like object defined by path specification.
 
@@ -157,67 +289,118 @@ class Context(object):
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     self._file_system_cache.GrabObject(identifier)
 
+  def IsFileObjectReferenced(self, file_object):
+    """Determines if a cached file-like object is referenced.
+
+    Args:
+      file_object: the file-like object (instance of FileIO).
+
+    Returns:
+      A boolean value indicating true if the file-like object is cached and
+      referenced.
+    """
+    _, cache_value = self._file_object_cache.GetCacheValueByObject(
+        file_object)
+    return bool(cache_value and not cache_value.IsDereferenced())
+
+  def IsFileSystemReferenced(self, file_system):
+    """Determines if a cached file system object is referenced.
+
+    Args:
+      file_system: the file system object (instance of vfs.FileSystem).
+
+    Returns:
+      A boolean value indicating true if the file system object is cached
+      and referenced.
+    """
+    _, cache_value = self._file_system_cache.GetCacheValueByObject(
+        file_system)
+    return bool(cache_value and not cache_value.IsDereferenced())
+
   def ReleaseFileObject(self, file_object):
     """Releases a cached file-like object.
 
+    A dereferenced file-like object remains cached, and open, until it is
+    evicted from the cache.
+
     Args:
       file_object: the file-like object (instance of FileIO).
 
     Returns:
-      A boolean value indicating true if the file-like object can be closed.
+      A boolean value indicating true if the file-like object can be closed,
+      which is the case if it is no longer cached, for example because it
+      was evicted.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
-      RuntimeError: if the file-like object is not cached or an inconsistency
-                    is detected in the cache.
+      RuntimeError: if an inconsistency is detected in the cache.
     """
     identifier, cache_value = self._file_object_cache.GetCacheValueByObject(
         file_object)
 
     if not identifier:
-      raise RuntimeError(u'Object not cached.')
+      return True
 
     if not cache_value:
       raise RuntimeError(u'Invalid cache value.')
 
     self._file_object_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_object_cache.RemoveObject(identifier)
-
-    return result
+    return False
 
   def ReleaseFileSystem(self, file_system):
     """Releases a cached file system object.
 
+    A dereferenced file system object remains cached, and open, until it
+    is evicted from the cache.
+
     Args:
       file_system: the file systemobject (instance of vfs.FileSystem).
 
     Returns:
-      A boolean value indicating true if the file system object can be closed.
+      A boolean value indicating true if the file system object can be closed,
+      which is the case if it is no longer cached, for example because it
+      was evicted.
 
     Raises:
       PathSpecError: if the path specification is incorrect.
-      RuntimeError: if the file system object is not cached or an inconsistency
-                    is detected in the cache.
+      RuntimeError: if an inconsistency is detected in the cache.
     """
     identifier, cache_value = self._file_system_cache.GetCacheValueByObject(
         file_system)
 
     if not identifier:
-      raise RuntimeError(u'Object not cached.')
+      return True
 
     if not cache_value:
       raise RuntimeError(u'Invalid cache value.')
 
     self._file_system_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_system_cache.RemoveObject(identifier)
+    return False
 
-    return result
+  def SetMaximumBlockCacheSize(self, maximum_block_cache_size):
+    """Sets the maximum combined size of the blocks in the block cache.
+
+    Args:
+      maximum_block_cache_size: the maximum combined size in bytes of
+                                the blocks of data cached in the context
+                                or 0 to disable the block cache.
+
+    Raises:
+      ValueError: if the maximum block cache size is invalid.
+    """
+    if maximum_block_cache_size < 0:
+      raise ValueError(
+          u'Invalid maximum block cache size: {0:d}.'.format(
+              maximum_block_cache_size))
+
+    if not maximum_block_cache_size:
+      self._block_cache = None
+    elif not self._block_cache:
+      self._block_cache = block_cache.BlockCache(maximum_block_cache_size)
+    else:
+      self._block_cache.SetMaximumSize(maximum_block_cache_size)
 
   def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
     """Sets the maximum number of cached filei-like objects.
@@ -238,3 +421,20 @@ class Context(object):
     """
     self._file_system_cache.SetMaximumNumberOfCachedValues(
         maximum_number_of_file_systems)
+
+  def SetStreamIndexCachePath(self, stream_index_cache_path):
+    """Sets the path of the stream index cache directory.
+
+    Args:
+      stream_index_cache_path: the path of the directory in which stream
+                               indexes are persisted or None to disable
+                               persisting stream indexes.
+
+    Raises:
+      ValueError: if the path does not exist or is not a directory.
+    """
+    if not stream_index_cache_path:
+      self._stream_index_cache = None
+    else:
+      self._stream_index_cache = stream_index_cache.StreamIndexCache(
+          stream_index_cache_path)
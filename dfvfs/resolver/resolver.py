@@ -58,8 +58,8 @@ class Resolver(object):
 
     file_entry = file_system.GetFileEntryByPathSpec(path_spec_object)
 
-    # Release the file system so it will be removed from the cache
-    # when the file entry is destroyed.
+    # Release the file system so it will be dereferenced, and can be evicted
+    # from the cache, when the file entry is destroyed.
     resolver_context.ReleaseFileSystem(file_system)
 
     return file_entry
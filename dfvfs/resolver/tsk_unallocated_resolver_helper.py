@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""The TSK unallocated space path specification resolver helper."""
+
+# This is necessary to prevent a circular import.
+import dfvfs.file_io.tsk_unallocated_file_io
+
+from dfvfs.lib import definitions
+from dfvfs.resolver import resolver
+from dfvfs.resolver import resolver_helper
+
+
+class TSKUnallocatedResolverHelper(resolver_helper.ResolverHelper):
+  """Class that implements the TSK unallocated space resolver helper."""
+
+  TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK_UNALLOCATED
+
+  def NewFileObject(self, resolver_context):
+    """Creates a new file-like object.
+
+    Args:
+      resolver_context: the resolver context (instance of resolver.Context).
+
+    Returns:
+      The file-like object (instance of file_io.FileIO).
+    """
+    return dfvfs.file_io.tsk_unallocated_file_io.TSKUnallocatedFile(
+        resolver_context)
+
+
+resolver.Resolver.RegisterHelper(TSKUnallocatedResolverHelper())
@@ -29,19 +29,13 @@ class CPIODirectory(file_entry.Directory):
       return
 
     cpio_archive_file = self._file_system.GetCPIOArchiveFile()
-    for cpio_archive_file_entry in cpio_archive_file.GetFileEntries(
-        path_prefix=location[1:]):
+    for cpio_archive_file_entry in cpio_archive_file.GetDirectoryFileEntries(
+        path=location[1:]):
 
       path = cpio_archive_file_entry.path
       if not path:
         continue
 
-      _, suffix = self._file_system.GetPathSegmentAndSuffix(location[1:], path)
-
-      # Ignore anything that is part of a sub directory or the directory itself.
-      if suffix or path == location:
-        continue
-
       path_spec_location = self._file_system.JoinPath([path])
       yield cpio_path_spec.CPIOPathSpec(
           location=path_spec_location, parent=self.path_spec.parent)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""The Virtual File System (VFS) extent object."""
+
+from dfvfs.lib import definitions
+
+
+class Extent(object):
+  """Class that contains an extent of a data stream.
+
+  An extent is a contiguous range of data of a data stream that is stored
+  in the file-like object that contains the file system, such as a volume.
+
+  Attributes:
+    extent_type (str): type of the extent, for example EXTENT_TYPE_SPARSE.
+    offset (int): offset of the extent relative to the start of the file-like
+        object that contains the file system, which is 0 for a sparse extent.
+    size (int): size of the extent.
+  """
+
+  def __init__(
+      self, extent_type=definitions.EXTENT_TYPE_DATA, offset=None, size=None):
+    """Initializes the extent.
+
+    Args:
+      extent_type (Optional[str]): type of the extent, for example
+          EXTENT_TYPE_SPARSE.
+      offset (Optional[int]): offset of the extent relative to the start of
+          the file-like object that contains the file system.
+      size (Optional[int]): size of the extent.
+    """
+    super(Extent, self).__init__()
+    self.extent_type = extent_type
+    self.offset = offset
+    self.size = size
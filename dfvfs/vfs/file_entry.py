@@ -276,6 +276,26 @@ class FileEntry(object):
     """
     return False
 
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    The extents can be used to read the data of multiple file entries in
+    the order it is stored in the file-like object that contains the file
+    system.
+
+    Args:
+      data_stream_name: optional data stream name. The default is
+                        an empty string which represents the default
+                        data stream.
+
+    Returns:
+      A list of the extents (instances of Extent) of the data stream, which
+      is empty if the data stream has no extents, for example because its
+      data is stored in the file system metadata, or if the file system
+      does not support extents.
+    """
+    return []
+
   def GetFileObject(self, data_stream_name=u''):
     """Retrieves the file-like object.
 
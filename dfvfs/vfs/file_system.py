@@ -71,6 +71,9 @@ class FileSystem(object):
   def Close(self):
     """Closes the file system object.
 
+    A cached file system object that is no longer referenced remains open
+    internally, so that it can be reused.
+
     Raises:
       IOError: if the file system object was not opened or the close failed.
     """
@@ -90,6 +93,27 @@ class FileSystem(object):
       self._is_open = False
       self._path_spec = None
 
+    elif not self._resolver_context.IsFileSystemReferenced(self):
+      self._is_open = False
+
+  def CloseDereferenced(self):
+    """Closes a dereferenced file system object that was retained by the cache.
+
+    A dereferenced file system object remains cached, with its resources
+    open, until it is evicted from the cache, after which the resolver
+    context closes it.
+
+    Raises:
+      IOError: if the file system object is open or was not retained by
+               the cache.
+    """
+    if self._is_open or not self._is_cached:
+      raise IOError(u'Not a dereferenced file system object.')
+
+    self._is_cached = False
+    self._Close()
+    self._path_spec = None
+
   def DirnamePath(self, path):
     """Determines the directory name of the path.
 
@@ -218,16 +242,28 @@ class FileSystem(object):
       PathSpecError: if the path specification is incorrect.
       ValueError: if the path specification or mode is invalid.
     """
-    if self._is_open and not self._is_cached:
-      raise IOError(u'Already open.')
-
     if mode != 'rb':
       raise ValueError(u'Unsupport mode: {0:s}.'.format(mode))
 
     if not path_spec:
       raise ValueError(u'Missing path specification.')
 
-    if not self._is_open:
+    cached_file_system = None
+    if self._is_cached:
+      cached_file_system = self._resolver_context.GetFileSystem(path_spec)
+
+    if self._is_open and cached_file_system is not self:
+      raise IOError(u'Already open.')
+
+    # A dereferenced file system object that remained cached is evicted
+    # from the cache and closed when it is opened with a different path
+    # specification.
+    if (self._is_cached and not self._is_open and
+        cached_file_system is not self):
+      self._resolver_context.EvictFileSystem(self)
+      self.CloseDereferenced()
+
+    if not self._is_open and not self._is_cached:
       self._Open(path_spec, mode=mode)
       self._is_open = True
       self._path_spec = path_spec
@@ -236,6 +272,10 @@ class FileSystem(object):
         self._resolver_context.CacheFileSystem(path_spec, self)
         self._is_cached = True
 
+    elif not self._is_open:
+      # A dereferenced file system object that remained cached is reused.
+      self._is_open = True
+
     if self._is_cached:
       self._resolver_context.GrabFileSystem(path_spec)
 
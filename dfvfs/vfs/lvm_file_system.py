@@ -7,6 +7,7 @@ import pyvslvm
 import dfvfs.vfs.lvm_file_entry
 
 from dfvfs import dependencies
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import lvm
@@ -68,11 +69,15 @@ class LVMFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
+      cached_file_object = block_cache_io.BlockCachedFile(
+          self._resolver_context, file_object=file_object,
+          identifier=path_spec.parent.comparable)
+      cached_file_object.open()
       vslvm_handle = pyvslvm.handle()
-      vslvm_handle.open_file_object(file_object)
+      vslvm_handle.open_file_object(cached_file_object)
       # TODO: implement multi physical volume support.
       vslvm_handle.open_physical_volume_files_as_file_objects([
-          file_object])
+          cached_file_object])
       vslvm_volume_group = vslvm_handle.get_volume_group()
     except:
       file_object.close()
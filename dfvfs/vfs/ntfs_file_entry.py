@@ -12,10 +12,16 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import ntfs_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import extent
 from dfvfs.vfs import file_entry
 from dfvfs.vfs import vfs_stat
 
 
+_ATTRIBUTE_TYPE_DATA = 0x00000080
+
+_EXTENT_FLAG_IS_SPARSE = 0x00000001
+_EXTENT_FLAG_IS_COMPRESSED = 0x00000002
+
 _FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
 
 
@@ -419,6 +425,30 @@ class NTFSFileEntry(file_entry.FileEntry):
 
     return stat_object
 
+  def _GetValidDataSize(self, fsntfs_file_entry, data_stream_name):
+    """Retrieves the valid data size of a data stream.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+      data_stream_name (str): data stream name, where an empty string
+          represents the default data stream.
+
+    Returns:
+      int: valid data size of the data stream, which is 0 if the data stream
+          has no $DATA attribute.
+    """
+    valid_data_size = 0
+    for fsntfs_attribute in fsntfs_file_entry.attributes:
+      if fsntfs_attribute.attribute_type != _ATTRIBUTE_TYPE_DATA:
+        continue
+
+      attribute_name = fsntfs_attribute.attribute_name or u''
+      if attribute_name == data_stream_name:
+        valid_data_size = max(
+            valid_data_size, fsntfs_attribute.valid_data_size)
+
+    return valid_data_size
+
   def _IsLink(self, file_attribute_flags):
     """Determines if a file entry is a link.
 
@@ -459,6 +489,74 @@ class NTFSFileEntry(file_entry.FileEntry):
         yield NTFSFileEntry(
             self._resolver_context, self._file_system, path_spec)
 
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    Args:
+      data_stream_name (Optional[str]): data stream name, where an empty
+          string represents the default data stream.
+
+    Returns:
+      list[Extent]: extents of the data stream, which is empty if the data
+          stream does not exist or its data is resident.
+
+    Raises:
+      BackEndError: if the pyfsntfs file entry is missing.
+    """
+    fsntfs_file_entry = self.GetNTFSFileEntry()
+    if not fsntfs_file_entry:
+      raise errors.BackEndError(u'Missing pyfsntfs file entry.')
+
+    if data_stream_name:
+      fsntfs_data_stream = (
+          fsntfs_file_entry.get_alternate_data_stream_by_name(
+              data_stream_name))
+    elif fsntfs_file_entry.has_default_data_stream():
+      fsntfs_data_stream = fsntfs_file_entry
+    else:
+      fsntfs_data_stream = None
+
+    if not fsntfs_data_stream:
+      return []
+
+    valid_data_size = self._GetValidDataSize(
+        fsntfs_file_entry, data_stream_name)
+
+    extents = []
+    data_offset = 0
+    for extent_index in range(fsntfs_data_stream.number_of_extents):
+      extent_offset, extent_size, extent_flags = (
+          fsntfs_data_stream.get_extent(extent_index))
+
+      if extent_flags & _EXTENT_FLAG_IS_SPARSE:
+        extent_type = definitions.EXTENT_TYPE_SPARSE
+        extent_offset = 0
+      elif extent_flags & _EXTENT_FLAG_IS_COMPRESSED:
+        extent_type = definitions.EXTENT_TYPE_COMPRESSED
+      else:
+        extent_type = definitions.EXTENT_TYPE_DATA
+
+      # The data beyond the valid data size is read as zero bytes, hence
+      # the corresponding part of the extent is represented as sparse.
+      if (extent_type == definitions.EXTENT_TYPE_DATA and
+          data_offset + extent_size > valid_data_size):
+        initialized_size = max(valid_data_size - data_offset, 0)
+        if initialized_size > 0:
+          extents.append(extent.Extent(
+              extent_type=extent_type, offset=extent_offset,
+              size=initialized_size))
+
+        extent_type = definitions.EXTENT_TYPE_SPARSE
+        extent_offset = 0
+        extent_size -= initialized_size
+        data_offset += initialized_size
+
+      extents.append(extent.Extent(
+          extent_type=extent_type, offset=extent_offset, size=extent_size))
+      data_offset += extent_size
+
+    return extents
+
   def GetFileObject(self, data_stream_name=u''):
     """Retrieves the file-like object.
 
@@ -480,8 +578,9 @@ class NTFSFileEntry(file_entry.FileEntry):
       return
 
     # Make sure to make the changes on a copy of the path specification, so we
-    # do not alter self.path_spec.
-    path_spec = copy.deepcopy(self.path_spec)
+    # do not alter self.path_spec. A shallow copy shares the parent path
+    # specification, which is immutable.
+    path_spec = copy.copy(self.path_spec)
     if data_stream_name:
       setattr(path_spec, u'data_stream', data_stream_name)
 
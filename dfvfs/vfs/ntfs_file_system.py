@@ -6,6 +6,7 @@ import pyfsntfs
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.ntfs_file_entry
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import ntfs_path_spec
@@ -13,16 +14,24 @@ from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 
 
+_FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
+
+
 class NTFSFileSystem(file_system.FileSystem):
   """Class that implements a file system object using pyfsntfs."""
 
   MFT_ENTRY_ROOT_DIRECTORY = 5
 
+  LOCATION_ORPHAN_FILES = u'\\$OrphanFiles'
   LOCATION_ROOT = u'\\'
   PATH_SEPARATOR = u'\\'
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_NTFS
 
+  _ATTRIBUTE_TYPE_FILE_NAME = 0x00000030
+
+  _FILE_NAME_NAMESPACE_DOS = 2
+
   def __init__(self, resolver_context):
     """Initializes a file system object.
 
@@ -30,6 +39,7 @@ class NTFSFileSystem(file_system.FileSystem):
       resolver_context (Context): resolver context.
     """
     super(NTFSFileSystem, self).__init__(resolver_context)
+    self._directory_paths = {}
     self._file_object = None
     self._fsntfs_volume = None
 
@@ -39,11 +49,98 @@ class NTFSFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._directory_paths = {}
     self._fsntfs_volume = None
 
     self._file_object.close()
     self._file_object = None
 
+  def _GetDirectoryPath(self, file_reference):
+    """Retrieves the path of a directory from its file reference.
+
+    The path is reconstructed from the parent file references of the $FILE_NAME
+    attributes of the directory and its parents. The paths are cached, so that
+    the parents are only read once.
+
+    Args:
+      file_reference (int): NTFS file reference of the directory.
+
+    Returns:
+      str: path of the directory. The path of a directory of which a parent
+          no longer exists, for example because its MFT entry was reused,
+          is relative to LOCATION_ORPHAN_FILES.
+    """
+    directory_names = []
+    parent_file_references = set()
+
+    path = None
+    while path is None:
+      mft_entry = file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK
+      if mft_entry == self.MFT_ENTRY_ROOT_DIRECTORY:
+        path = self.LOCATION_ROOT
+        break
+
+      path = self._directory_paths.get(file_reference, None)
+      if path is not None:
+        break
+
+      # Prevent loops in corrupted parent file references.
+      if file_reference in parent_file_references:
+        break
+      parent_file_references.add(file_reference)
+
+      try:
+        fsntfs_file_entry = self._fsntfs_volume.get_file_entry(mft_entry)
+      except IOError:
+        break
+
+      # The sequence number of the MFT entry changes when it is reused.
+      if fsntfs_file_entry.file_reference != file_reference:
+        break
+
+      file_name_attributes = self._GetFileNameAttributes(fsntfs_file_entry)
+      if not file_name_attributes:
+        break
+
+      _, fsntfs_attribute = file_name_attributes[0]
+      directory_names.append((file_reference, fsntfs_attribute.name))
+      file_reference = fsntfs_attribute.parent_file_reference
+
+    if path is None:
+      path = self.LOCATION_ORPHAN_FILES
+
+    for file_reference, directory_name in reversed(directory_names):
+      path = self.JoinPath([path, directory_name])
+      self._directory_paths[file_reference] = path
+
+    return path
+
+  def _GetFileNameAttributes(self, fsntfs_file_entry):
+    """Retrieves the $FILE_NAME attributes that define names of a file entry.
+
+    The short (DOS) names are ignored if the file entry has other names.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+
+    Returns:
+      list[tuple[int, pyfsntfs.file_name_attribute]]: index and $FILE_NAME
+          attribute.
+    """
+    file_name_attributes = []
+    dos_file_name_attributes = []
+    for attribute_index in range(fsntfs_file_entry.number_of_attributes):
+      fsntfs_attribute = fsntfs_file_entry.get_attribute(attribute_index)
+      if fsntfs_attribute.attribute_type != self._ATTRIBUTE_TYPE_FILE_NAME:
+        continue
+
+      if fsntfs_attribute.name_space == self._FILE_NAME_NAMESPACE_DOS:
+        dos_file_name_attributes.append((attribute_index, fsntfs_attribute))
+      else:
+        file_name_attributes.append((attribute_index, fsntfs_attribute))
+
+    return file_name_attributes or dos_file_name_attributes
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -64,8 +161,12 @@ class NTFSFileSystem(file_system.FileSystem):
     try:
       file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
+      cached_file_object = block_cache_io.BlockCachedFile(
+          self._resolver_context, file_object=file_object,
+          identifier=path_spec.parent.comparable)
+      cached_file_object.open()
       fsnfts_volume = pyfsntfs.volume()
-      fsnfts_volume.open_file_object(file_object)
+      fsnfts_volume.open_file_object(cached_file_object)
     except:
       file_object.close()
       raise
@@ -145,6 +246,48 @@ class NTFSFileSystem(file_system.FileSystem):
         self._resolver_context, self, path_spec,
         fsntfs_file_entry=fsntfs_file_entry)
 
+  def GetFileEntriesSequentially(self):
+    """Retrieves the file entries in the order of their MFT entries.
+
+    The MFT entries are read sequentially instead of walking the directory
+    tree, which includes the file entries of unallocated (deleted) MFT
+    entries and of MFT entries that are not referenced by a directory.
+    The location of a file entry is reconstructed from the parent file
+    references of its $FILE_NAME attributes. A file entry with multiple
+    (hard link) names is returned once for every name, where short (DOS)
+    names are ignored. MFT entries without a name, such as extension
+    MFT entries, are ignored.
+
+    Yields:
+      NTFSFileEntry: file entry.
+    """
+    yield self.GetRootFileEntry()
+
+    for mft_entry in range(self._fsntfs_volume.number_of_file_entries):
+      if mft_entry == self.MFT_ENTRY_ROOT_DIRECTORY:
+        continue
+
+      try:
+        fsntfs_file_entry = self._fsntfs_volume.get_file_entry(mft_entry)
+      except IOError:
+        continue
+
+      if fsntfs_file_entry.base_record_file_reference:
+        continue
+
+      for attribute_index, fsntfs_attribute in self._GetFileNameAttributes(
+          fsntfs_file_entry):
+        directory_path = self._GetDirectoryPath(
+            fsntfs_attribute.parent_file_reference)
+        location = self.JoinPath([directory_path, fsntfs_attribute.name])
+
+        path_spec = ntfs_path_spec.NTFSPathSpec(
+            location=location, mft_attribute=attribute_index,
+            mft_entry=mft_entry, parent=self._path_spec.parent)
+        yield dfvfs.vfs.ntfs_file_entry.NTFSFileEntry(
+            self._resolver_context, self, path_spec,
+            fsntfs_file_entry=fsntfs_file_entry)
+
   def GetNTFSVolume(self):
     """Retrieves the file system info object.
 
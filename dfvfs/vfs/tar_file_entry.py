@@ -31,45 +31,8 @@ class TARDirectory(file_entry.Directory):
     # the location string does.
     tar_path = location[1:]
 
-    # Set of top level sub directories that have been yielded.
-    processed_directories = set()
-
-    tar_file = self._file_system.GetTARFile()
-    for tar_info in iter(tar_file.getmembers()):
-      path = tar_info.name
-
-      # Determine if the start of the TAR info name is similar to
-      # the location string. If not the file TAR info refers to is not in
-      # the same directory.
-      if not path or not path.startswith(tar_path):
-        continue
-
-      # Ignore the directory itself.
-      if path == tar_path:
-        continue
-
-      path_segment, suffix = self._file_system.GetPathSegmentAndSuffix(
-          tar_path, path)
-      if not path_segment:
-        continue
-
-      # Sometimes the TAR file lacks directories, therefore we will
-      # provide virtual ones.
-      if suffix:
-        path_spec_location = self._file_system.JoinPath([
-            location, path_segment])
-        is_directory = True
-
-      else:
-        path_spec_location = self._file_system.JoinPath([path])
-        is_directory = tar_info.isdir()
-
-      if is_directory:
-        if path_spec_location in processed_directories:
-          continue
-
-        processed_directories.add(path_spec_location)
-
+    for path in self._file_system.GetDirectoryEntryPaths(tar_path):
+      path_spec_location = self._file_system.JoinPath([path])
       yield tar_path_spec.TARPathSpec(
           location=path_spec_location, parent=self.path_spec.parent)
 
@@ -200,21 +163,20 @@ class TARFileEntry(file_entry.FileEntry):
   @property
   def sub_file_entries(self):
     """generator(TARFileEntry): sub file entries."""
-    tar_file = self._file_system.GetTARFile()
-
     if self._directory is None:
       self._directory = self._GetDirectory()
 
-    if self._directory and tar_file:
+    if self._directory:
       for path_spec in self._directory.entries:
         location = getattr(path_spec, u'location', None)
         if location is None:
           continue
 
         kwargs = {}
-        try:
-          kwargs[u'tar_info'] = tar_file.getmember(location[1:])
-        except KeyError:
+        tar_info = self._file_system.GetTARInfoByPath(location[1:])
+        if tar_info:
+          kwargs[u'tar_info'] = tar_info
+        else:
           kwargs[u'is_virtual'] = True
 
         yield TARFileEntry(
@@ -261,10 +223,6 @@ class TARFileEntry(file_entry.FileEntry):
       if len(location) == 1:
         return
 
-      tar_file = self._file_system.GetTARFile()
-      try:
-        self._tar_info = tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+      self._tar_info = self._file_system.GetTARInfoByPath(location[1:])
 
     return self._tar_info
@@ -16,6 +16,10 @@ from dfvfs.vfs import file_system
 class TARFileSystem(file_system.FileSystem):
   """Class that implements a file system using tarfile.
 
+  The TAR members are indexed when the file system is opened, which
+  includes the directories that are implied by the paths of the members
+  but are not stored in the TAR file.
+
   Attributes:
     encoding (str): file entry name encoding.
   """
@@ -31,16 +35,59 @@ class TARFileSystem(file_system.FileSystem):
       encoding (Optional[str]): file entry name encoding.
     """
     super(TARFileSystem, self).__init__(resolver_context)
+    self._directory_entry_paths = {}
     self._file_object = None
     self._tar_file = None
+    self._tar_infos = {}
     self.encoding = encoding
 
+  def _BuildIndex(self, tar_file):
+    """Builds the index of the TAR members.
+
+    The index maps the path of every member to its TAR info and the path
+    of every directory, including implied directories, to the paths of its
+    directory entries. Note that the paths do not have the leading path
+    separator the locations have and if a path is stored more than once
+    the last TAR info is used, similar to tarfile.getmember().
+
+    Args:
+      tar_file (tarfile.TARFile): TAR file.
+    """
+    directory_entry_paths = {u'': []}
+    entry_paths = set()
+    tar_infos = {}
+
+    for tar_info in iter(tar_file.getmembers()):
+      path = tar_info.name.rstrip(self.PATH_SEPARATOR)
+      if not path:
+        continue
+
+      tar_infos[path] = tar_info
+
+      if tar_info.isdir():
+        directory_entry_paths.setdefault(path, [])
+
+      # Sometimes the TAR file lacks directories, therefore the parent
+      # directories are added as implied directories.
+      while path and path not in entry_paths:
+        entry_paths.add(path)
+
+        parent_path, _, _ = path.rpartition(self.PATH_SEPARATOR)
+        directory_entry_paths.setdefault(parent_path, []).append(path)
+        path = parent_path
+
+    self._directory_entry_paths = directory_entry_paths
+    self._tar_infos = tar_infos
+
   def _Close(self):
     """Closes the file system.
 
     Raises:
       IOError: if the close failed.
     """
+    self._directory_entry_paths = {}
+    self._tar_infos = {}
+
     self._tar_file.close()
     self._tar_file = None
 
@@ -71,6 +118,7 @@ class TARFileSystem(file_system.FileSystem):
       # Explicitly tell tarfile not to use compression. Compression should be
       # handled by the file-like object.
       tar_file = tarfile.open(mode='r:', fileobj=file_object)
+      self._BuildIndex(tar_file)
     except:
       file_object.close()
       raise
@@ -93,24 +141,8 @@ class TARFileSystem(file_system.FileSystem):
         not location.startswith(self.LOCATION_ROOT)):
       return False
 
-    if len(location) == 1:
-      return True
-
-    try:
-      self._tar_file.getmember(location[1:])
-      return True
-    except KeyError:
-      pass
-
-    # Check if location could be a virtual directory.
-
-    for name in iter(self._tar_file.getnames()):
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    path = location[1:]
+    return path in self._tar_infos or path in self._directory_entry_paths
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -132,14 +164,27 @@ class TARFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs[u'tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
+    tar_info = self._tar_infos.get(location[1:], None)
+    if tar_info:
+      kwargs[u'tar_info'] = tar_info
+    else:
       kwargs[u'is_virtual'] = True
 
     return dfvfs.vfs.tar_file_entry.TARFileEntry(
         self._resolver_context, self, path_spec, **kwargs)
 
+  def GetDirectoryEntryPaths(self, path):
+    """Retrieves the paths of the entries of a directory.
+
+    Args:
+      path (str): path of the directory, without the leading path separator.
+
+    Returns:
+      list[str]: paths of the directory entries, without the leading path
+          separator, or an empty list if the path is not a directory.
+    """
+    return list(self._directory_entry_paths.get(path, []))
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -157,3 +202,15 @@ class TARFileSystem(file_system.FileSystem):
       tarfile.TARFile: TAR file.
     """
     return self._tar_file
+
+  def GetTARInfoByPath(self, path):
+    """Retrieves the TAR info of a path.
+
+    Args:
+      path (str): path of the TAR member, without the leading path separator.
+
+    Returns:
+      tarfile.TARInfo: TAR info or None if the path is not stored in
+          the TAR file, such as an implied directory.
+    """
+    return self._tar_infos.get(path, None)
@@ -9,6 +9,7 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import extent
 from dfvfs.vfs import file_entry
 from dfvfs.vfs import vfs_stat
 
@@ -63,6 +64,19 @@ class TSKDataStream(file_entry.DataStream):
 class TSKDirectory(file_entry.Directory):
   """Class that implements a directory object using pytsk3."""
 
+  def __init__(self, file_system, path_spec, tsk_file=None):
+    """Initializes the directory object.
+
+    Args:
+      file_system (FileSystem): file system.
+      path_spec (PathSpec): path specification.
+      tsk_file (Optional[pytsk3.File]): TSK file of the directory, which
+          is used to open the directory instead of opening it by inode
+          or location.
+    """
+    super(TSKDirectory, self).__init__(file_system, path_spec)
+    self._tsk_file = tsk_file
+
   def _EntriesGenerator(self):
     """Retrieves directory entries.
 
@@ -72,6 +86,24 @@ class TSKDirectory(file_entry.Directory):
     Yields:
       TSKPathSpec: path specification.
 
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    for path_spec, _ in self.GetEntriesAndTSKFiles():
+      yield path_spec
+
+  def GetEntriesAndTSKFiles(self):
+    """Retrieves directory entries and their TSK files.
+
+    The TSK files of the directory entries are already opened by pytsk3
+    when the directory is read, hence passing them to the file entries
+    of the directory entries prevents the file entries from opening them
+    again.
+
+    Yields:
+      tuple[TSKPathSpec, pytsk3.File]: path specification and TSK file
+          of the directory entry.
+
     Raises:
       BackEndError: if pytsk3 cannot open the directory.
     """
@@ -84,7 +116,9 @@ class TSKDirectory(file_entry.Directory):
     tsk_directory = None
 
     try:
-      if inode is not None:
+      if self._tsk_file is not None:
+        tsk_directory = self._tsk_file.as_directory()
+      elif inode is not None:
         tsk_directory = fs_info.open_dir(inode=inode)
       elif location is not None:
         tsk_directory = fs_info.open_dir(path=location)
@@ -163,9 +197,10 @@ class TSKDirectory(file_entry.Directory):
             directory_entry = self._file_system.JoinPath([
                 location, directory_entry])
 
-      yield tsk_path_spec.TSKPathSpec(
+      path_spec = tsk_path_spec.TSKPathSpec(
           inode=directory_entry_inode, location=directory_entry,
           parent=self.path_spec.parent)
+      yield path_spec, tsk_directory_entry
 
 
 class TSKFileEntry(file_entry.FileEntry):
@@ -267,6 +302,51 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return self._data_streams
 
+  def _GetDataStreamTSKAttribute(self, data_stream_name):
+    """Retrieves the TSK attribute that contains the data of a data stream.
+
+    Args:
+      data_stream_name (str): data stream name, where an empty string
+          represents the default data stream.
+
+    Returns:
+      pytsk3.Attribute: TSK attribute or None if not available.
+
+    Raises:
+      BackEndError: if the TSK File .info or .info.meta attribute is missing.
+    """
+    tsk_file = self.GetTSKFile()
+    if not tsk_file or not tsk_file.info or not tsk_file.info.meta:
+      raise errors.BackEndError(u'Missing TSK File .info or .info.meta.')
+
+    if self._file_system.IsHFS():
+      known_data_attribute_types = [
+          pytsk3.TSK_FS_ATTR_TYPE_HFS_DEFAULT,
+          pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA]
+
+    elif self._file_system.IsNTFS():
+      known_data_attribute_types = [pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA]
+
+    else:
+      # Only regular files have a data stream, see _GetDataStreams().
+      tsk_fs_meta_type = getattr(
+          tsk_file.info.meta, u'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
+      if tsk_fs_meta_type != pytsk3.TSK_FS_META_TYPE_REG:
+        return
+
+      known_data_attribute_types = [pytsk3.TSK_FS_ATTR_TYPE_DEFAULT]
+
+    for tsk_attribute in tsk_file:
+      if getattr(tsk_attribute, u'info', None) is None:
+        continue
+
+      attribute_type = getattr(tsk_attribute.info, u'type', None)
+      if attribute_type not in known_data_attribute_types:
+        continue
+
+      if TSKDataStream(tsk_attribute).name == data_stream_name:
+        return tsk_attribute
+
   def _GetDirectory(self):
     """Retrieves a directory.
 
@@ -278,7 +358,8 @@ class TSKFileEntry(file_entry.FileEntry):
 
     if (self._stat_object and
         self._stat_object.type == self._stat_object.TYPE_DIRECTORY):
-      return TSKDirectory(self._file_system, self.path_spec)
+      return TSKDirectory(
+          self._file_system, self.path_spec, tsk_file=self.GetTSKFile())
     return
 
   def _GetLink(self):
@@ -503,8 +584,71 @@ class TSKFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
+      parent_inode = getattr(self.path_spec, u'inode', None)
+      if parent_inode is None and self._stat_object:
+        parent_inode = self._stat_object.ino
+
+      for path_spec, tsk_file in self._directory.GetEntriesAndTSKFiles():
+        yield TSKFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            parent_inode=parent_inode, tsk_file=tsk_file)
+
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    Args:
+      data_stream_name (Optional[str]): data stream name, where an empty
+          string represents the default data stream.
+
+    Returns:
+      list[Extent]: extents of the data stream, which is empty if the data
+          stream does not exist or its data is resident.
+
+    Raises:
+      BackEndError: if the TSK File .info or .info.meta attribute is missing.
+    """
+    tsk_attribute = self._GetDataStreamTSKAttribute(data_stream_name)
+    if not tsk_attribute:
+      return []
+
+    attribute_flags = int(getattr(tsk_attribute.info, u'flags', 0))
+    if attribute_flags & pytsk3.TSK_FS_ATTR_RES:
+      return []
+
+    is_compressed = bool(attribute_flags & pytsk3.TSK_FS_ATTR_COMP)
+    data_size = getattr(tsk_attribute.info, u'size', 0)
+
+    tsk_fs_info = self._file_system.GetFsInfo()
+    block_size = tsk_fs_info.info.block_size
+
+    extents = []
+    for tsk_attribute_run in tsk_attribute:
+      extent_offset = tsk_attribute_run.addr * block_size
+      extent_size = tsk_attribute_run.len * block_size
+
+      # The last run of data that is not compressed can contain more blocks
+      # than needed to store the data.
+      if not is_compressed:
+        data_offset = tsk_attribute_run.offset * block_size
+        if data_offset >= data_size:
+          break
+        extent_size = min(extent_size, data_size - data_offset)
+
+      run_flags = int(getattr(tsk_attribute_run, u'flags', 0))
+      if run_flags & (
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER |
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_SPARSE):
+        extent_type = definitions.EXTENT_TYPE_SPARSE
+        extent_offset = 0
+      elif is_compressed:
+        extent_type = definitions.EXTENT_TYPE_COMPRESSED
+      else:
+        extent_type = definitions.EXTENT_TYPE_DATA
+
+      extents.append(extent.Extent(
+          extent_type=extent_type, offset=extent_offset, size=extent_size))
+
+    return extents
 
   def GetFileObject(self, data_stream_name=u''):
     """Retrieves the file-like object.
@@ -521,7 +665,7 @@ class TSKFileEntry(file_entry.FileEntry):
     if data_stream_name and data_stream_name not in data_stream_names:
       return
 
-    path_spec = copy.deepcopy(self.path_spec)
+    path_spec = copy.copy(self.path_spec)
     if data_stream_name:
       setattr(path_spec, u'data_stream', data_stream_name)
 
@@ -6,6 +6,7 @@ import pytsk3
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.tsk_file_entry
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import tsk_image
@@ -17,10 +18,15 @@ from dfvfs.vfs import file_system
 class TSKFileSystem(file_system.FileSystem):
   """Class that implements a file system object using pytsk3."""
 
+  LOCATION_ORPHAN_FILES = u'/$OrphanFiles'
   LOCATION_ROOT = u'/'
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK
 
+  _DIRECTORY_META_TYPES = frozenset([
+      pytsk3.TSK_FS_META_TYPE_DIR,
+      pytsk3.TSK_FS_META_TYPE_VIRT_DIR])
+
   def __init__(self, resolver_context):
     """Initializes a file system object.
 
@@ -43,6 +49,144 @@ class TSKFileSystem(file_system.FileSystem):
     self._file_object.close()
     self._file_object = None
 
+  def _GetDirectoryEntryNames(self, tsk_file):
+    """Retrieves the names of the directory entries of a directory.
+
+    The names include those marked as unallocated, such as the names of
+    previously deleted files.
+
+    Args:
+      tsk_file (pytsk3.File): TSK file of the directory.
+
+    Yields:
+      tuple[int, str, bool]: inode, name and True if the name is allocated.
+    """
+    try:
+      tsk_directory = tsk_file.as_directory()
+    except IOError:
+      return
+
+    for tsk_directory_entry in tsk_directory:
+      # Note that because pytsk3.TSK_FS_FILE does not explicitly defines name
+      # we need to check if the attribute exists and has a value other
+      # than None.
+      tsk_fs_name = getattr(
+          getattr(tsk_directory_entry, u'info', None), u'name', None)
+      if tsk_fs_name is None:
+        continue
+
+      inode = getattr(tsk_fs_name, u'meta_addr', 0)
+      # On non-NTFS file systems ignore inode 0.
+      if inode == 0 and not self.IsNTFS():
+        continue
+
+      try:
+        # pytsk3 returns an UTF-8 encoded byte string.
+        name = getattr(tsk_fs_name, u'name', b'').decode(u'utf8')
+      except UnicodeError:
+        # Continue here since we cannot represent the name.
+        continue
+
+      # Ignore references to self or parent.
+      if not name or name in [u'.', u'..']:
+        continue
+
+      flags = int(getattr(tsk_fs_name, u'flags', 0))
+      yield inode, name, not flags & pytsk3.TSK_FS_NAME_FLAG_UNALLOC
+
+  def _GetDirectoryPath(self, inode, inode_names, directory_paths):
+    """Retrieves the path of a directory from the names of its parents.
+
+    The path is reconstructed from the names of the directory and its parents,
+    preferring allocated names. The paths are cached, so that the names of
+    the parents are only looked up once.
+
+    Args:
+      inode (int): inode of the directory.
+      inode_names (dict[int, list[tuple[str, int, bool]]]): name, inode of
+          the parent directory and True if the name is allocated, per inode.
+      directory_paths (dict[int, str]): paths per directory inode.
+
+    Returns:
+      str: path of the directory or None if the names of the directory and
+          its parents are not known (yet).
+    """
+    directory_names = []
+    parent_inodes = set()
+
+    path = directory_paths.get(inode, None)
+    while path is None:
+      # Prevent loops in corrupted directory entries.
+      if inode in parent_inodes:
+        return
+      parent_inodes.add(inode)
+
+      names = inode_names.get(inode, None)
+      if not names:
+        return
+
+      name, parent_inode, _ = sorted(
+          names, key=lambda name_tuple: not name_tuple[2])[0]
+      directory_names.append((inode, name))
+
+      inode = parent_inode
+      path = directory_paths.get(inode, None)
+
+    for inode, directory_name in reversed(directory_names):
+      path = self.JoinPath([path, directory_name])
+      directory_paths[inode] = path
+
+    return path
+
+  def _GetSequentialFileEntries(
+      self, inode, tsk_file, inode_names, directory_paths,
+      resolve_orphans=False):
+    """Retrieves the file entries of the names of an inode.
+
+    Args:
+      inode (int): inode.
+      tsk_file (pytsk3.File): TSK file of the inode.
+      inode_names (dict[int, list[tuple[str, int, bool]]]): name, inode of
+          the parent directory and True if the name is allocated, per inode.
+      directory_paths (dict[int, str]): paths per directory inode.
+      resolve_orphans (Optional[bool]): True if names of which the parent
+          directory cannot be resolved are relative to LOCATION_ORPHAN_FILES
+          and an unallocated inode without a name is an orphan file.
+
+    Returns:
+      list[TSKFileEntry]: file entries or None if the location of one of
+          the names cannot be determined.
+    """
+    locations = []
+    for name, parent_inode, _ in inode_names.get(inode, []):
+      directory_path = self._GetDirectoryPath(
+          parent_inode, inode_names, directory_paths)
+      if directory_path is None:
+        if not resolve_orphans:
+          return
+        directory_path = self.LOCATION_ORPHAN_FILES
+        parent_inode = None
+
+      locations.append((self.JoinPath([directory_path, name]), parent_inode))
+
+    if not locations and resolve_orphans:
+      flags = int(getattr(tsk_file.info.meta, u'flags', 0))
+      if (flags & pytsk3.TSK_FS_META_FLAG_UNALLOC and
+          flags & pytsk3.TSK_FS_META_FLAG_USED):
+        location = self.JoinPath([
+            self.LOCATION_ORPHAN_FILES, u'OrphanFile-{0:d}'.format(inode)])
+        locations.append((location, None))
+
+    file_entries = []
+    for location, parent_inode in locations:
+      path_spec = tsk_path_spec.TSKPathSpec(
+          inode=inode, location=location, parent=self._path_spec.parent)
+      file_entries.append(dfvfs.vfs.tsk_file_entry.TSKFileEntry(
+          self._resolver_context, self, path_spec, parent_inode=parent_inode,
+          tsk_file=tsk_file))
+
+    return file_entries
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -64,7 +208,11 @@ class TSKFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
-      tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
+      cached_file_object = block_cache_io.BlockCachedFile(
+          self._resolver_context, file_object=file_object,
+          identifier=path_spec.parent.comparable)
+      cached_file_object.open()
+      tsk_image_object = tsk_image.TSKFileSystemImage(cached_file_object)
       tsk_file_system = pytsk3.FS_Info(tsk_image_object)
     except:
       file_object.close()
@@ -149,6 +297,101 @@ class TSKFileSystem(file_system.FileSystem):
     return dfvfs.vfs.tsk_file_entry.TSKFileEntry(
         self._resolver_context, self, path_spec, tsk_file=tsk_file)
 
+  def GetFileEntriesSequentially(self):
+    """Retrieves the file entries in the order of their inodes.
+
+    The inodes from the first to the last inode are read sequentially instead
+    of walking the directory tree, which includes the file entries of
+    previously deleted files. Since pytsk3 does not expose the names of
+    an inode, the names are read from the directories as they are read and
+    the location of a file entry is reconstructed from the names of its
+    parent directories. A file entry of which the location cannot be
+    determined yet, since one of its parent directories has a higher inode,
+    is returned after the other file entries. Every inode is read only once.
+
+    A file entry with multiple (hard link) names is returned once for every
+    name. Unallocated inodes without a name, of which the metadata is used,
+    are returned as orphan files relative to LOCATION_ORPHAN_FILES when they
+    are read, other inodes without a name are ignored.
+
+    Yields:
+      TSKFileEntry: file entry.
+    """
+    root_file_entry = self.GetRootFileEntry()
+    yield root_file_entry
+
+    root_inode = self.GetRootInode()
+
+    directory_paths = {root_inode: self.LOCATION_ROOT}
+    inode_names = {}
+    for inode, name, is_allocated in self._GetDirectoryEntryNames(
+        root_file_entry.GetTSKFile()):
+      inode_names.setdefault(inode, []).append((name, root_inode, is_allocated))
+
+    tsk_fs_info = self._tsk_file_system.info
+    unresolved_tsk_files = []
+
+    for inode in range(tsk_fs_info.first_inum, tsk_fs_info.last_inum + 1):
+      if inode == root_inode:
+        continue
+
+      try:
+        tsk_file = self._tsk_file_system.open_meta(inode=inode)
+      except IOError:
+        continue
+
+      tsk_fs_meta = tsk_file.info.meta
+      meta_type = getattr(tsk_fs_meta, u'type', None)
+
+      # Virtual directories are not read, since pytsk3 determines the entries
+      # of the virtual $OrphanFiles directory by walking the directory tree.
+      if meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
+        for entry_inode, name, is_allocated in self._GetDirectoryEntryNames(
+            tsk_file):
+          inode_names.setdefault(entry_inode, []).append(
+              (name, inode, is_allocated))
+
+      number_of_names = len(inode_names.get(inode, []))
+      flags = int(getattr(tsk_fs_meta, u'flags', 0))
+
+      if not number_of_names and flags & pytsk3.TSK_FS_META_FLAG_UNALLOC:
+        # An unallocated inode without a name is returned as an orphan file
+        # if its metadata is used, otherwise it is ignored.
+        file_entries = self._GetSequentialFileEntries(
+            inode, tsk_file, inode_names, directory_paths,
+            resolve_orphans=True)
+
+      else:
+        if meta_type in self._DIRECTORY_META_TYPES:
+          number_of_links = 1
+        else:
+          number_of_links = getattr(tsk_fs_meta, u'nlink', 1)
+
+        # Defer a file entry of which not all (hard link) names are known.
+        if number_of_names < number_of_links:
+          file_entries = None
+        elif not number_of_names:
+          continue
+        else:
+          file_entries = self._GetSequentialFileEntries(
+              inode, tsk_file, inode_names, directory_paths)
+
+      # The TSK file of a deferred file entry is retained, so that its inode
+      # is not read again.
+      if file_entries is None:
+        unresolved_tsk_files.append((inode, tsk_file))
+        continue
+
+      for file_entry in file_entries:
+        yield file_entry
+
+    for inode, tsk_file in unresolved_tsk_files:
+      file_entries = self._GetSequentialFileEntries(
+          inode, tsk_file, inode_names, directory_paths, resolve_orphans=True)
+
+      for file_entry in file_entries:
+        yield file_entry
+
   def GetFsInfo(self):
     """Retrieves the file system info object.
 
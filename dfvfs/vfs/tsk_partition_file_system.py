@@ -6,6 +6,7 @@ import pytsk3
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.tsk_partition_file_entry
 
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import tsk_image
@@ -63,7 +64,11 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
-      tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
+      cached_file_object = block_cache_io.BlockCachedFile(
+          self._resolver_context, file_object=file_object,
+          identifier=path_spec.parent.comparable)
+      cached_file_object.open()
+      tsk_image_object = tsk_image.TSKFileSystemImage(cached_file_object)
       tsk_volume = pytsk3.Volume_Info(tsk_image_object)
     except:
       file_object.close()
@@ -116,7 +121,13 @@ class TSKPartitionFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     if location is None and partition_index is not None:
-      path_spec.location = u'/p{0:d}'.format(partition_index)
+      # Path specifications are immutable hence a copy with the location
+      # is created.
+      path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+          location=u'/p{0:d}'.format(partition_index),
+          part_index=getattr(path_spec, u'part_index', None),
+          start_offset=getattr(path_spec, u'start_offset', None),
+          parent=path_spec.parent)
 
     return dfvfs.vfs.tsk_partition_file_entry.TSKPartitionFileEntry(
         self._resolver_context, self, path_spec)
@@ -7,6 +7,7 @@ import pyvshadow
 import dfvfs.vfs.vshadow_file_entry
 
 from dfvfs import dependencies
+from dfvfs.file_io import block_cache_io
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import vshadow
@@ -67,8 +68,12 @@ class VShadowFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
+      cached_file_object = block_cache_io.BlockCachedFile(
+          self._resolver_context, file_object=file_object,
+          identifier=path_spec.parent.comparable)
+      cached_file_object.open()
       vshadow_volume = pyvshadow.volume()
-      vshadow_volume.open_file_object(file_object)
+      vshadow_volume.open_file_object(cached_file_object)
     except:
       file_object.close()
       raise
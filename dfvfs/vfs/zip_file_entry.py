@@ -5,7 +5,6 @@ from dfdatetime import time_elements as dfdatetime_time_elements
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
-from dfvfs.lib import py2to3
 from dfvfs.path import zip_path_spec
 from dfvfs.vfs import file_entry
 from dfvfs.vfs import vfs_stat
@@ -29,24 +28,7 @@ class ZipDirectory(file_entry.Directory):
         not location.startswith(self._file_system.PATH_SEPARATOR)):
       return
 
-    zip_file = self._file_system.GetZipFile()
-    for zip_info in zip_file.infolist():
-      path = getattr(zip_info, u'filename', None)
-      if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
-        try:
-          path = path.decode(self._file_system.encoding)
-        except UnicodeDecodeError:
-          path = None
-
-      if not path or not path.startswith(location[1:]):
-        continue
-
-      _, suffix = self._file_system.GetPathSegmentAndSuffix(location[1:], path)
-
-      # Ignore anything that is part of a sub directory or the directory itself.
-      if suffix or path == location[1:]:
-        continue
-
+    for path in self._file_system.GetDirectoryEntryPaths(location[1:]):
       path_spec_location = self._file_system.JoinPath([path])
 
       # Restore / at end path to indicate a directory.
@@ -231,6 +213,5 @@ class ZipFileEntry(file_entry.FileEntry):
       if len(location) == 1:
         return
 
-      zip_file = self._file_system.GetZipFile()
-      self._zip_info = zip_file.getinfo(location[1:])
+      self._zip_info = self._file_system.GetZipInfoByPath(location[1:])
     return self._zip_info
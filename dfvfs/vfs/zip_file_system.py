@@ -8,6 +8,7 @@ import dfvfs.vfs.zip_file_entry
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import py2to3
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
@@ -16,6 +17,8 @@ from dfvfs.vfs import file_system
 class ZipFileSystem(file_system.FileSystem):
   """Class that implements a file system object using zipfile.
 
+  The zip info objects are indexed when the file system is opened.
+
   Attributes:
     encoding: string containing the file entry name encoding.
   """
@@ -31,16 +34,57 @@ class ZipFileSystem(file_system.FileSystem):
       encoding: optional string containing file entry name encoding.
     """
     super(ZipFileSystem, self).__init__(resolver_context)
+    self._directory_entry_paths = {}
     self._file_object = None
     self._zip_file = None
+    self._zip_infos = {}
     self.encoding = encoding
 
+  def _BuildIndex(self, zip_file):
+    """Builds the index of the zip info objects.
+
+    The index maps the path of every zip info object to the zip info object
+    and the path of every directory to the paths of its directory entries.
+    Note that the paths do not have the leading path separator the locations
+    have, the paths of directories in the zip file have a trailing path
+    separator, but the paths used as directory index keys do not.
+
+    Args:
+      zip_file: the zip file object (instance of zipfile.ZipFile).
+    """
+    directory_entry_paths = {}
+    zip_infos = {}
+
+    for zip_info in zip_file.infolist():
+      path = getattr(zip_info, u'filename', None)
+      if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
+        try:
+          path = path.decode(self.encoding)
+        except UnicodeDecodeError:
+          path = None
+
+      if not path:
+        continue
+
+      if path not in zip_infos:
+        parent_path, _, _ = path.rstrip(self.PATH_SEPARATOR).rpartition(
+            self.PATH_SEPARATOR)
+        directory_entry_paths.setdefault(parent_path, []).append(path)
+
+      zip_infos[path] = zip_info
+
+    self._directory_entry_paths = directory_entry_paths
+    self._zip_infos = zip_infos
+
   def _Close(self):
     """Closes the file system object.
 
     Raises:
       IOError: if the close failed.
     """
+    self._directory_entry_paths = {}
+    self._zip_infos = {}
+
     self._zip_file.close()
     self._zip_file = None
 
@@ -69,6 +113,7 @@ class ZipFileSystem(file_system.FileSystem):
 
     try:
       zip_file = zipfile.ZipFile(file_object, 'r')
+      self._BuildIndex(zip_file)
     except:
       file_object.close()
       raise
@@ -85,7 +130,6 @@ class ZipFileSystem(file_system.FileSystem):
     Returns:
       Boolean indicating if the file entry exists.
     """
-    zip_info = None
     location = getattr(path_spec, u'location', None)
 
     if (location is None or
@@ -95,12 +139,7 @@ class ZipFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      zip_info = self._zip_file.getinfo(location[1:])
-    except KeyError:
-      pass
-
-    return zip_info is not None
+    return location[1:] in self._zip_infos
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -111,7 +150,6 @@ class ZipFileSystem(file_system.FileSystem):
     Returns:
       A file entry (instance of vfs.ZipFileEntry) or None.
     """
-    zip_info = None
     location = getattr(path_spec, u'location', None)
 
     if (location is None or
@@ -123,16 +161,27 @@ class ZipFileSystem(file_system.FileSystem):
           self._resolver_context, self, path_spec, is_root=True,
           is_virtual=True)
 
-    try:
-      zip_info = self._zip_file.getinfo(location[1:])
-    except KeyError:
-      pass
-
+    zip_info = self._zip_infos.get(location[1:], None)
     if zip_info is None:
       return
     return dfvfs.vfs.zip_file_entry.ZipFileEntry(
         self._resolver_context, self, path_spec, zip_info=zip_info)
 
+  def GetDirectoryEntryPaths(self, path):
+    """Retrieves the paths of the entries of a directory.
+
+    Args:
+      path: a string containing the path of the directory, without the
+            leading path separator.
+
+    Returns:
+      A list of strings containing the paths of the directory entries,
+      without the leading path separator, or an empty list if the path
+      has no directory entries.
+    """
+    path = path.rstrip(self.PATH_SEPARATOR)
+    return list(self._directory_entry_paths.get(path, []))
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -150,3 +199,15 @@ class ZipFileSystem(file_system.FileSystem):
       The zip file object (instance of zipfile.ZipFile).
     """
     return self._zip_file
+
+  def GetZipInfoByPath(self, path):
+    """Retrieves the zip info object of a path.
+
+    Args:
+      path: a string containing the path, without the leading path separator.
+
+    Returns:
+      The zip info object (instance of zipfile.ZipInfo) or None if
+      not available.
+    """
+    return self._zip_infos.get(path, None)
@@ -8,15 +8,14 @@
 from __future__ import print_function
 import argparse
 import getpass
-import hashlib
 import locale
 import logging
 import sys
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.helpers import file_hasher
 from dfvfs.helpers import volume_scanner
-from dfvfs.resolver import resolver
 
 
 class RecursiveHasherVolumeScannerMediator(
@@ -385,80 +384,24 @@ class RecursiveHasherVolumeScannerMediator(
 class RecursiveHasher(volume_scanner.VolumeScanner):
   """Class that recursively calculates message digest hashes of files."""
 
-  # Class constant that defines the default read buffer size.
-  _READ_BUFFER_SIZE = 32768
-
-  def _CalculateHashFileEntry(self, file_entry, data_stream_name):
-    """Calculates a message digest hash of the data of the file entry.
+  def __init__(self, hash_names=None, mediator=None, number_of_workers=None):
+    """Initializes the recursive hasher object.
 
     Args:
-      file_entry: the file entry (instance of dfvfs.FileEntry).
-      data_stream_name: the data stream name.
-
-    Returns:
-      A binary string containing the digest hash or None.
-    """
-    hash_context = hashlib.md5()
-
-    try:
-      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    except IOError as exception:
-      logging.warning((
-          u'Unable to open path specification:\n{0:s}'
-          u'with error: {1:s}').format(
-              file_entry.path_spec.comparable, exception))
-      return
-
-    if not file_object:
-      return
-
-    try:
-      data = file_object.read(self._READ_BUFFER_SIZE)
-      while data:
-        hash_context.update(data)
-        data = file_object.read(self._READ_BUFFER_SIZE)
-    except IOError as exception:
-      logging.warning((
-          u'Unable to read from path specification:\n{0:s}'
-          u'with error: {1:s}').format(
-              file_entry.path_spec.comparable, exception))
-      return
-
-    finally:
-      file_object.close()
-
-    return hash_context.hexdigest()
-
-  def _CalculateHashesFileEntry(
-      self, file_system, file_entry, parent_full_path, output_writer):
-    """Recursive calculates hashes starting with the file entry.
+      hash_names: optional list of names of the hashes to calculate, such as
+                  "md5". The default is md5, sha1 and sha256.
+      mediator: optional volume scanner mediator (instance of
+                VolumeScannerMediator).
+      number_of_workers: optional number of worker processes, where None
+                         represents the number of CPUs.
 
-    Args:
-      file_system: the file system (instance of dfvfs.FileSystem).
-      file_entry: the file entry (instance of dfvfs.FileEntry).
-      parent_full_path: the full path of the parent file entry.
-      output_writer: the output writer (instance of StdoutWriter).
+    Raises:
+      ValueError: if a hash name is not supported or the number of worker
+                  processes is invalid.
     """
-    # Since every file system implementation can have their own path
-    # segment separator we are using JoinPath to be platform and file system
-    # type independent.
-    full_path = file_system.JoinPath([parent_full_path, file_entry.name])
-    for data_stream in file_entry.data_streams:
-      hash_value = self._CalculateHashFileEntry(file_entry, data_stream.name)
-      if not hash_value:
-        hash_value = 'N/A'
-
-      # TODO: print volume.
-      if data_stream.name:
-        display_path = u'{0:s}:{1:s}'.format(full_path, data_stream.name)
-      else:
-        display_path = full_path
-
-      output_writer.WriteFileHash(display_path, hash_value)
-
-    for sub_file_entry in file_entry.sub_file_entries:
-      self._CalculateHashesFileEntry(
-          file_system, sub_file_entry, full_path, output_writer)
+    super(RecursiveHasher, self).__init__(mediator=mediator)
+    self._file_hasher = file_hasher.FileHasher(
+        hash_names=hash_names, number_of_workers=number_of_workers)
 
   def CalculateHashes(self, base_path_specs, output_writer):
     """Recursive calculates hashes starting with the base path specification.
@@ -468,17 +411,26 @@ class RecursiveHasher(volume_scanner.VolumeScanner):
                        of dfvfs.PathSpec).
       output_writer: the output writer (instance of StdoutWriter).
     """
-    for base_path_spec in base_path_specs:
-      file_system = resolver.Resolver.OpenFileSystem(base_path_spec)
-      file_entry = resolver.Resolver.OpenFileEntry(base_path_spec)
-      if file_entry is None:
-        logging.warning(
-            u'Unable to open base path specification:\n{0:s}'.format(
-                base_path_spec.comparable))
-        continue
+    hash_names = self._file_hasher.hash_names
+
+    for hash_result in self._file_hasher.HashFileSystems(base_path_specs):
+      if hash_result.error:
+        logging.warning((
+            u'Unable to read from path specification:\n{0:s}'
+            u'with error: {1:s}').format(
+                hash_result.path_spec.comparable, hash_result.error))
+
+      hash_values = [
+          hash_result.hashes.get(hash_name, u'N/A')
+          for hash_name in hash_names]
+
+      # TODO: print volume.
+      display_path = hash_result.path or hash_result.path_spec.comparable
+      if hash_result.data_stream_name:
+        display_path = u'{0:s}:{1:s}'.format(
+            display_path, hash_result.data_stream_name)
 
-      self._CalculateHashesFileEntry(
-          file_system, file_entry, u'', output_writer)
+      output_writer.WriteFileHash(display_path, u'\t'.join(hash_values))
 
 
 class StdoutWriter(object):
@@ -511,7 +463,8 @@ class StdoutWriter(object):
 
     Args:
       path: the path of the file.
-      hash_value: the message digest hash calculated over the file data.
+      hash_value: the message digest hash calculated over the file data,
+                  where multiple hashes are separated by a tab.
     """
     string = u'{0:s}\t{1:s}'.format(hash_value, path)
 
@@ -549,6 +502,18 @@ def Main():
           u'path of the directory or filename of a storage media image '
           u'containing the file.'))
 
+  argument_parser.add_argument(
+      u'--hashes', dest=u'hashes', action=u'store', type=str,
+      default=u'md5,sha1,sha256', help=(
+          u'comma separated list of the message digest hashes to calculate, '
+          u'the default is: md5,sha1,sha256.'))
+
+  argument_parser.add_argument(
+      u'--workers', dest=u'workers', action=u'store', type=int,
+      default=None, help=(
+          u'number of worker processes that calculate the hashes, the '
+          u'default is the number of CPUs.'))
+
   options = argument_parser.parse_args()
 
   if not options.source:
@@ -568,9 +533,21 @@ def Main():
     print(u'')
     return False
 
+  hash_names = [
+      hash_name.strip() for hash_name in options.hashes.split(u',')
+      if hash_name.strip()]
+
   return_value = True
-  mediator = volume_scanner.RecursiveHasherVolumeScannerMediator()
-  recursive_hasher = RecursiveHasher(mediator=mediator)
+  mediator = RecursiveHasherVolumeScannerMediator()
+
+  try:
+    recursive_hasher = RecursiveHasher(
+        hash_names=hash_names, mediator=mediator,
+        number_of_workers=options.workers)
+  except ValueError as exception:
+    print(u'{0!s}'.format(exception))
+    print(u'')
+    return False
 
   try:
     base_path_specs = recursive_hasher.GetBasePathSpecs(options.source)
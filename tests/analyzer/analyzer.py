@@ -6,11 +6,40 @@ import unittest
 import os
 
 from dfvfs.analyzer import analyzer
+from dfvfs.analyzer import analyzer_helper
+from dfvfs.analyzer import specification
+from dfvfs.file_io import fake_file_io
 from dfvfs.lib import definitions
+from dfvfs.path import fake_path_spec
 from dfvfs.path import gzip_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import vshadow_path_spec
+from dfvfs.resolver import context
+
+
+class TestAnalyzerHelper(analyzer_helper.AnalyzerHelper):
+  """Class that implements a test analyzer helper."""
+
+  FORMAT_CATEGORIES = frozenset([
+      definitions.FORMAT_CATEGORY_ENCODED_STREAM])
+
+  TYPE_INDICATOR = u'TEST'
+
+  def GetFormatSpecification(self):
+    """Retrieves the format specification.
+
+    Returns:
+      FormatSpecification: format specification.
+    """
+    format_specification = specification.FormatSpecification(
+        self.type_indicator)
+
+    # Signatures without an offset.
+    format_specification.AddNewSignature(b'a_directory/another_file')
+    format_specification.AddNewSignature(b'passwords.txt')
+
+    return format_specification
 
 
 class AnalyzerTest(unittest.TestCase):
@@ -116,6 +145,189 @@ class AnalyzerTest(unittest.TestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetTypeIndicators(self):
+    """Function to test the get type indicators function."""
+    format_categories = [
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM]
+
+    test_file = os.path.join(u'test_data', u'image.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+            definitions.TYPE_INDICATOR_QCOW],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: []}
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    test_file = os.path.join(u'test_data', u'vsstest.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [
+            definitions.PREFERRED_NTFS_BACK_END],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: [
+            definitions.TYPE_INDICATOR_VSHADOW]}
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    test_file = os.path.join(u'test_data', u'syslog.tgz')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [],
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: [
+            definitions.TYPE_INDICATOR_GZIP]}
+    type_indicators = analyzer.Analyzer.GetTypeIndicators(
+        path_spec, [
+            definitions.FORMAT_CATEGORY_ARCHIVE,
+            definitions.FORMAT_CATEGORY_COMPRESSED_STREAM])
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+  def testGetTypeIndicatorsBoundedScan(self):
+    """Function to test the get type indicators function with bounded scan."""
+    test_file = os.path.join(u'test_data', u'image.vhd')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    expected_type_indicators = [definitions.TYPE_INDICATOR_VHDI]
+    type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
+        path_spec, bounded_scan=True)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    test_file = os.path.join(u'test_data', u'tsk_volume_system.raw')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    expected_type_indicators = [definitions.TYPE_INDICATOR_TSK_PARTITION]
+    type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
+        path_spec, bounded_scan=True)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    # The signatures without an offset are stored at offsets 72232 and 72776
+    # which are outside the header and footer ranges of a bounded scan.
+    test_file = os.path.join(u'test_data', u'image.vmdk')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    format_categories = [definitions.FORMAT_CATEGORY_ENCODED_STREAM]
+
+    test_analyzer_helper = TestAnalyzerHelper()
+    analyzer.Analyzer.RegisterHelper(test_analyzer_helper)
+
+    try:
+      type_indicators = analyzer.Analyzer.GetTypeIndicators(
+          path_spec, format_categories)
+      self.assertEqual(type_indicators, {
+          definitions.FORMAT_CATEGORY_ENCODED_STREAM: [u'TEST']})
+
+      type_indicators = analyzer.Analyzer.GetTypeIndicators(
+          path_spec, format_categories, bounded_scan=True)
+      self.assertEqual(type_indicators, {
+          definitions.FORMAT_CATEGORY_ENCODED_STREAM: []})
+
+    finally:
+      analyzer.Analyzer.DeregisterHelper(test_analyzer_helper)
+
+  def testScanFileObjectBoundedScan(self):
+    """Function to test the scan file object function with bounded scan."""
+    specification_store = specification.FormatSpecificationStore()
+    specification_store.AddSpecification(
+        TestAnalyzerHelper().GetFormatSpecification())
+    signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+        specification_store)
+
+    resolver_context = context.Context()
+    path_spec = fake_path_spec.FakePathSpec(location=u'/test')
+
+    # A signature without an offset does not match where the header and
+    # footer ranges are joined.
+    file_object = fake_file_io.FakeFile(
+        resolver_context, b'xxxpassw' + (b'\x00' * 16) + b'ords.txt')
+    file_object.open(path_spec=path_spec)
+
+    try:
+      scan_data_file_object = analyzer._ScanDataFileObject(file_object, 8, 8)
+      self.assertEqual(len(scan_data_file_object.GetBufferedRanges()), 2)
+
+      type_indicators = analyzer.Analyzer._ScanFileObject(
+          signature_scanner, specification_store, [], scan_data_file_object,
+          bounded_scan=True)
+      self.assertEqual(type_indicators, [])
+
+      # Adjacent header and footer ranges are scanned as one range.
+      scan_data_file_object = analyzer._ScanDataFileObject(
+          file_object, 16, 16)
+      self.assertEqual(len(scan_data_file_object.GetBufferedRanges()), 1)
+
+    finally:
+      file_object.close()
+
+    file_object = fake_file_io.FakeFile(
+        resolver_context, (b'\x00' * 24) + b'passwords.txt')
+    file_object.open(path_spec=path_spec)
+
+    try:
+      scan_data_file_object = analyzer._ScanDataFileObject(file_object, 8, 16)
+      type_indicators = analyzer.Analyzer._ScanFileObject(
+          signature_scanner, specification_store, [], scan_data_file_object,
+          bounded_scan=True)
+      self.assertEqual(type_indicators, [u'TEST'])
+
+    finally:
+      file_object.close()
+
+  def testGetTypeIndicatorsOfPathSpecs(self):
+    """Function to test the get type indicators of path specs function."""
+    format_categories = [
+        definitions.FORMAT_CATEGORY_ARCHIVE,
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM]
+
+    path_specs = []
+    for filename in (u'syslog.tar', u'syslog.gz', u'syslog.gz', u'syslog.zip'):
+      test_file = os.path.join(u'test_data', filename)
+      path_specs.append(os_path_spec.OSPathSpec(location=test_file))
+
+    # A file that is not a QCOW image cannot be analyzed as one.
+    path_specs[2] = qcow_path_spec.QCOWPathSpec(parent=path_specs[2])
+
+    expected_results = [
+        (path_specs[0], {
+            definitions.FORMAT_CATEGORY_ARCHIVE: [
+                definitions.TYPE_INDICATOR_TAR],
+            definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: []}),
+        (path_specs[1], {
+            definitions.FORMAT_CATEGORY_ARCHIVE: [],
+            definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: [
+                definitions.TYPE_INDICATOR_GZIP]}),
+        (path_specs[2], None),
+        (path_specs[3], {
+            definitions.FORMAT_CATEGORY_ARCHIVE: [
+                definitions.TYPE_INDICATOR_ZIP],
+            definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: []})]
+
+    results = list(analyzer.Analyzer.GetTypeIndicatorsOfPathSpecs(
+        iter(path_specs), format_categories))
+    self.assertEqual(results, expected_results)
+
+    # The results of the workers are returned in the same order.
+    results = list(analyzer.Analyzer.GetTypeIndicatorsOfPathSpecs(
+        iter(path_specs), format_categories, number_of_workers=2,
+        use_threads=True))
+    self.assertEqual(results, expected_results)
+
+    results = list(analyzer.Analyzer.GetTypeIndicatorsOfPathSpecs(
+        iter(path_specs), format_categories, bounded_scan=True,
+        number_of_workers=2))
+    self.assertEqual(results, expected_results)
+
+    with self.assertRaises(ValueError):
+      analyzer.Analyzer.GetTypeIndicatorsOfPathSpecs(
+          path_specs, format_categories, number_of_workers=-1)
+
   def testGetVolumeSystemTypeIndicators(self):
     """Function to test the get volume system type indicators function."""
     test_file = os.path.join(u'test_data', u'tsk_volume_system.raw')
@@ -28,6 +28,27 @@ class ZlibDecompressorTestCase(test_lib.DecompressorTestCase):
     with self.assertRaises(errors.BackEndError):
       _, _ = decompressor.Decompress(b'This is a test.')
 
+  def testCopy(self):
+    """Tests the Copy method."""
+    decompressor = zlib_decompressor.ZlibDecompressor()
+
+    compressed_data = (
+        b'x\x9c\x0b\xc9\xc8,V\x00\xa2D\x85\x92\xd4\xe2\x12=\x00)\x97\x05$')
+
+    uncompressed_data, _ = decompressor.Decompress(compressed_data[:10])
+    decompressor_copy = decompressor.Copy()
+
+    uncompressed_data_copy, _ = decompressor_copy.Decompress(
+        compressed_data[10:])
+    expected_uncompressed_data = b'This is a test.'
+    self.assertEqual(
+        uncompressed_data + uncompressed_data_copy, expected_uncompressed_data)
+
+    # Decompressing with the copy should not affect the original.
+    uncompressed_data_original, _ = decompressor.Decompress(
+        compressed_data[10:])
+    self.assertEqual(uncompressed_data_original, uncompressed_data_copy)
+
 
 class DeflateDecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the zlib decompressor object."""
@@ -25,6 +25,12 @@ class Base64DecoderTestCase(test_lib.DecoderTestCase):
     with self.assertRaises(errors.BackEndError):
       _, _ = decoder.Decode(b'\x01\x02\x03\x04\x05\x06\x07\x08A')
 
+  def testSupportsRandomAccess(self):
+    """Tests the SupportsRandomAccess method."""
+    decoder = base64_decoder.Base64Decoder()
+
+    self.assertTrue(decoder.SupportsRandomAccess())
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -83,6 +83,51 @@ class AESDecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(expected_decrypted_data, decrypted_data)
     self.assertEqual(expected_encrypted_data, encrypted_data)
 
+  def testGetDecryptedDataSize(self):
+    """Tests the GetDecryptedDataSize method."""
+    decrypter = aes_decrypter.AESDecrypter(
+        key=b'This is a key123',
+        mode=definitions.ENCRYPTION_MODE_ECB)
+
+    self.assertEqual(decrypter.GetDecryptedDataSize(32), 32)
+    self.assertEqual(decrypter.GetDecryptedDataSize(23), 16)
+
+  def testSetPreviousEncryptedBlock(self):
+    """Tests the SetPreviousEncryptedBlock method."""
+    decrypter = aes_decrypter.AESDecrypter(
+        key=b'This is a key123',
+        mode=definitions.ENCRYPTION_MODE_CBC,
+        initialization_vector=b'This is an IV456')
+
+    self.assertTrue(decrypter.SupportsRandomAccess())
+
+    # Test decryption of the second block.
+    decrypter.SetPreviousEncryptedBlock(
+        b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce')
+    decrypted_data, _ = decrypter.Decrypt(
+        b'B\x01\xdb8E7\xfe\x92j\xf0\x1d(\xb9\x9f\xad\x13')
+    self.assertEqual(decrypted_data, b'ncrypted text!!!')
+
+    # Test decryption from the start.
+    decrypter.SetPreviousEncryptedBlock(None)
+    decrypted_data, _ = decrypter.Decrypt(
+        b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce')
+    self.assertEqual(decrypted_data, b'This is secret e')
+
+    with self.assertRaises(ValueError):
+      decrypter.SetPreviousEncryptedBlock(b'bogus')
+
+    decrypter = aes_decrypter.AESDecrypter(
+        key=b'This is a key123',
+        mode=definitions.ENCRYPTION_MODE_OFB,
+        initialization_vector=b'This is an IV456')
+
+    self.assertFalse(decrypter.SupportsRandomAccess())
+
+    with self.assertRaises(ValueError):
+      decrypter.SetPreviousEncryptedBlock(
+          b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the block cached file-like object."""
+
+import os
+import unittest
+
+from dfvfs.file_io import block_cache_io
+from dfvfs.file_io import os_file_io
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+
+class BlockCachedFileTest(unittest.TestCase):
+  """The unit test for the block cached file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'image.qcow2')
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    with open(test_file, 'rb') as file_object:
+      self._test_data = file_object.read()
+
+  def testOpenClose(self):
+    """Test the open and close functionality."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    file_object = block_cache_io.BlockCachedFile(
+        self._resolver_context, file_object=os_file_object,
+        identifier=self._os_path_spec.comparable)
+    file_object.open()
+
+    self.assertEqual(file_object.get_size(), len(self._test_data))
+
+    file_object.close()
+
+    # The block cached file-like object does not close the other file-like
+    # object.
+    self.assertEqual(os_file_object.get_size(), len(self._test_data))
+    os_file_object.close()
+
+    file_object = block_cache_io.BlockCachedFile(self._resolver_context)
+    with self.assertRaises(IOError):
+      file_object.open()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    file_object = block_cache_io.BlockCachedFile(
+        self._resolver_context, file_object=os_file_object,
+        identifier=self._os_path_spec.comparable)
+    file_object.open()
+
+    file_object.seek(100)
+    self.assertEqual(file_object.get_offset(), 100)
+
+    file_object.seek(-10, os.SEEK_END)
+    self.assertEqual(file_object.get_offset(), len(self._test_data) - 10)
+
+    file_object.seek(5, os.SEEK_CUR)
+    self.assertEqual(file_object.get_offset(), len(self._test_data) - 5)
+    self.assertEqual(file_object.read(10), self._test_data[-5:])
+
+    # Conforming to the POSIX seek the offset can exceed the file size
+    # but reading will result in no data being returned.
+    file_object.seek(len(self._test_data) + 100, os.SEEK_SET)
+    self.assertEqual(file_object.read(2), b'')
+
+    with self.assertRaises(IOError):
+      file_object.seek(-10, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      file_object.seek(10, 5)
+
+    file_object.close()
+    os_file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    file_object = block_cache_io.BlockCachedFile(
+        self._resolver_context, file_object=os_file_object,
+        identifier=self._os_path_spec.comparable)
+    file_object.open()
+
+    block_cache = self._resolver_context.GetBlockCache()
+    block_size = block_cache.block_size
+
+    # Reads within a block, spanning blocks and up to the end of the data.
+    for offset, size in [
+        (0, 512), (block_size - 100, 200), (block_size + 10, 3 * block_size),
+        (len(self._test_data) - 100, 512)]:
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(size), self._test_data[offset:offset + size])
+      self.assertEqual(
+          file_object.get_offset(),
+          min(offset + size, len(self._test_data)))
+
+    self.assertGreater(block_cache.size, 0)
+    self.assertIsNotNone(block_cache.GetBlock(self._os_path_spec.comparable, 0))
+
+    # Reads are served from the block cache and do not read from the other
+    # file-like object.
+    os_file_object.seek(0, os.SEEK_SET)
+    file_object.seek(block_size - 100, os.SEEK_SET)
+    self.assertEqual(
+        file_object.read(200),
+        self._test_data[block_size - 100:block_size + 100])
+    self.assertEqual(os_file_object.get_offset(), 0)
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), self._test_data)
+
+    file_object.close()
+    os_file_object.close()
+
+  def testReadWithoutBlockCache(self):
+    """Test the read functionality without a block cache."""
+    resolver_context = context.Context(maximum_block_cache_size=0)
+    self.assertIsNone(resolver_context.GetBlockCache())
+
+    os_file_object = os_file_io.OSFile(resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    file_object = block_cache_io.BlockCachedFile(
+        resolver_context, file_object=os_file_object,
+        identifier=self._os_path_spec.comparable)
+    file_object.open()
+
+    file_object.seek(100, os.SEEK_SET)
+    self.assertEqual(file_object.read(200), self._test_data[100:300])
+
+    file_object.close()
+    os_file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -8,6 +8,8 @@ except ImportError:
   lzma = None
 
 import os
+import shutil
+import tempfile
 import unittest
 
 from dfvfs.file_io import compressed_stream_io
@@ -245,6 +247,85 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  def testSeekWithCheckpoints(self):
+    """Test the seek functionality using checkpoints."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object._CHECKPOINT_INTERVAL = 128
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 64
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestGetSizeFileObject(file_object)
+    self.assertGreater(len(file_object._checkpoints), 1)
+
+    self._TestSeekFileObject(file_object)
+    self._TestReadFileObject(file_object)
+
+    file_object.seek(0, os.SEEK_SET)
+    read_buffer = file_object.read()
+    self.assertEqual(len(read_buffer), 1247)
+
+    file_object.close()
+
+  def testSeekWithCheckpointReads(self):
+    """Test the seek functionality using checkpoints of partial reads."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object._CHECKPOINT_INTERVAL = 128
+    file_object._CHECKPOINT_READ_SIZE = 16
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestGetSizeFileObject(file_object)
+    self.assertGreater(len(file_object._checkpoints), 1)
+
+    checkpoint_offsets = file_object._checkpoint_offsets
+    for index in range(1, len(checkpoint_offsets)):
+      self.assertLess(
+          checkpoint_offsets[index] - checkpoint_offsets[index - 1], 1024)
+
+    self._TestSeekFileObject(file_object)
+    self._TestReadFileObject(file_object)
+
+    file_object.close()
+
+  def testStreamIndexCache(self):
+    """Test the stream index cache functionality."""
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      resolver_context = context.Context(
+          stream_index_cache_path=temporary_directory)
+
+      file_object = compressed_stream_io.CompressedStream(resolver_context)
+      file_object.open(path_spec=self._compressed_stream_path_spec)
+      self._TestGetSizeFileObject(file_object)
+      file_object.close()
+
+      self.assertEqual(len(os.listdir(temporary_directory)), 1)
+
+      resolver_context = context.Context(
+          stream_index_cache_path=temporary_directory)
+
+      file_object = compressed_stream_io.CompressedStream(resolver_context)
+      file_object.open(path_spec=self._compressed_stream_path_spec)
+      self._TestGetSizeFileObject(file_object)
+
+      # The size is read from the stream index cache without decompressing.
+      self.assertIsNone(file_object._decompressor)
+
+      self._TestSeekFileObject(file_object)
+      self._TestReadFileObject(file_object)
+      file_object.close()
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
 
 if __name__ == '__main__':
   unittest.main()
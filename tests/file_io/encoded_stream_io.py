@@ -182,6 +182,37 @@ class Base64EncodedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  def testReadRandomAccess(self):
+    """Test the read functionality after seeking at random offsets."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self.assertEqual(file_object.get_size(), 1247)
+
+    # The base64 encoded data is wrapped in lines of 76 characters, which
+    # are read without decoding the preceding encoded data.
+    self.assertIsNotNone(file_object._encoded_data_layout)
+    self.assertEqual(file_object._encoded_data_layout.line_size, 76)
+
+    decoded_data = file_object.read()
+    self.assertEqual(len(decoded_data), 1247)
+
+    for offset, size in ((1000, 100), (17, 3), (56, 2), (0, 16), (1231, 100)):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(size), decoded_data[offset:offset + size])
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -143,6 +143,30 @@ class AESEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(self._resolver_context)
+    file_object.open(path_spec=self._encrypted_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
+  def testReadRandomAccess(self):
+    """Test the read functionality after seeking at random offsets."""
+    file_object = encrypted_stream_io.EncryptedStream(self._resolver_context)
+    file_object.open(path_spec=self._encrypted_stream_path_spec)
+
+    decrypted_data = file_object.read()
+    self.assertEqual(len(decrypted_data), 1247 + self.padding_size)
+
+    for offset, size in ((1000, 100), (17, 3), (0, 16), (1231, 100)):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(size), decrypted_data[offset:offset + size])
+
+    file_object.close()
+
 
 class BlowfishEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
   """The unit test for a Blowfish encrypted stream file-like object."""
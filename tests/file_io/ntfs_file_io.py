@@ -29,6 +29,44 @@ class NTFSFileTest(test_lib.ImageFileTestCase):
     self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(
         parent=self._os_path_spec)
 
+  def testGetAllocatedRanges(self):
+    """Test the get allocated ranges functionality."""
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=u'\\$UpCase', mft_entry=10, parent=self._qcow_path_spec)
+    file_object = ntfs_file_io.NTFSFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 131072)])
+
+    file_object.close()
+
+    # The data of the data stream is resident.
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        mft_attribute=1, mft_entry=self._MFT_ENTRY_PASSWORDS_TXT,
+        parent=self._qcow_path_spec)
+    file_object = ntfs_file_io.NTFSFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 116)])
+
+    file_object.close()
+
+    # The valid data size of the data stream is 0, hence the data is read
+    # as zero bytes.
+    test_location = (
+        u'\\System Volume Information\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=test_location, mft_entry=38, parent=self._qcow_path_spec)
+    file_object = ntfs_file_io.NTFSFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [])
+
+    file_object.close()
+
   def testOpenCloseMFTEntry(self):
     """Test the open and close functionality using a MFT entry."""
     path_spec = ntfs_path_spec.NTFSPathSpec(
@@ -53,6 +91,8 @@ class NTFSFileTest(test_lib.ImageFileTestCase):
     file_object.close()
 
     # Try open with a path specification that has no parent.
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=u'\\password.txt', parent=self._qcow_path_spec)
     path_spec.parent = None
 
     with self.assertRaises(errors.PathSpecError):
@@ -5,6 +5,7 @@
 import os
 import unittest
 
+from dfvfs.file_io import qcow_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
@@ -23,6 +24,37 @@ class QCOWFileTest(test_lib.ImageFileTestCase):
     self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(
         parent=self._os_path_spec)
 
+  def testGetAllocatedRanges(self):
+    """Test the get allocated ranges functionality."""
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 65536)])
+
+    file_object.close()
+
+    # Test a QCOW version 3 image.
+    test_file = os.path.join(u'test_data', u'lvmtest.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    expected_allocated_ranges = [
+        (0, 65536), (1048576, 65536), (1310720, 65536), (1572864, 65536),
+        (8388608, 65536), (9437184, 65536), (9568256, 65536)]
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, expected_allocated_ranges)
+
+    # The data of the unallocated clusters is read as zero bytes.
+    file_object.seek(65536, os.SEEK_SET)
+    self.assertEqual(file_object.read(65536), b'\x00' * 65536)
+
+    file_object.close()
+
   def testOpenCloseInode(self):
     """Test the open and close functionality using an inode."""
     self._TestOpenCloseInode(self._qcow_path_spec)
@@ -313,6 +313,41 @@ class SylogTestCase(unittest.TestCase):
 
     self.assertEqual(file_object.get_offset(), expected_offset)
 
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into tests on the file-like object.
+
+    Args:
+      file_object: the file-like object with the test data.
+      base_offset: optional base offset use in the tests, the default is 167.
+    """
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = bytearray(95)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 95)
+    self.assertEqual(bytes(read_buffer), expected_buffer)
+    self.assertEqual(file_object.get_offset(), base_offset + 95)
+
+    # Reading into a memoryview reads into the underlying buffer.
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    read_buffer = bytearray(100)
+    read_count = file_object.readinto(memoryview(read_buffer)[5:])
+
+    self.assertEqual(read_count, 95)
+    self.assertEqual(bytes(read_buffer[5:]), expected_buffer)
+
+    # Reading at the end of the data does not fill the buffer.
+    file_object.seek(0, os.SEEK_END)
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
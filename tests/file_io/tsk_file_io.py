@@ -21,6 +21,18 @@ class TSKFileTest(test_lib.ImageFileTestCase):
     test_file = os.path.join(u'test_data', u'ímynd.dd')
     self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
 
+  def testGetAllocatedRanges(self):
+    """Test the get allocated ranges functionality."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, parent=self._os_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 116)])
+
+    file_object.close()
+
   def testOpenCloseInode(self):
     """Test the open and close functionality using an inode."""
     self._TestOpenCloseInode(self._os_path_spec)
@@ -0,0 +1,160 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the TSK unallocated space file-like object."""
+
+import io
+import os
+import unittest
+
+from dfvfs.file_io import os_file_io
+from dfvfs.file_io import tsk_unallocated_file_io
+from dfvfs.lib import errors
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_unallocated_path_spec
+from dfvfs.resolver import context
+
+
+class TSKUnallocatedFileTest(unittest.TestCase):
+  """The unit test for the TSK unallocated space file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'ímynd.dd')
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tsk_unallocated_path_spec = (
+        tsk_unallocated_path_spec.TSKUnallocatedPathSpec(
+            parent=self._os_path_spec))
+
+  def testOpenClose(self):
+    """Test the open and close functionality."""
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+
+    file_object.open(path_spec=self._tsk_unallocated_path_spec)
+    self.assertEqual(file_object.get_size(), 75776)
+    file_object.close()
+
+    # Try open with a path specification that has no parent.
+    path_spec = tsk_unallocated_path_spec.TSKUnallocatedPathSpec(
+        parent=self._os_path_spec)
+    path_spec.parent = None
+
+    with self.assertRaises(errors.PathSpecError):
+      file_object.open(path_spec=path_spec)
+
+  def testOpenCloseNTFS(self):
+    """Test the open and close functionality on NTFS."""
+    test_file = os.path.join(u'test_data', u'vsstest.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+    path_spec = tsk_unallocated_path_spec.TSKUnallocatedPathSpec(
+        parent=path_spec)
+
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_size(), 700022784)
+
+    runs = file_object.GetRuns()
+    self.assertEqual(len(runs), 8)
+    self.assertEqual(runs[0], (0, 147456, 32768))
+
+    file_object.close()
+
+  def testGetExtBlockRangesMetaBlockGroups(self):
+    """Test the _GetExtBlockRanges function with meta block groups."""
+    superblock_data = bytearray(2048)
+    # The superblock signature and the meta_bg incompatible feature flag.
+    superblock_data[1080:1082] = b'\x53\xef'
+    superblock_data[1120:1124] = b'\x10\x00\x00\x00'
+
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+    with self.assertRaises(IOError):
+      file_object._GetExtBlockRanges(io.BytesIO(bytes(superblock_data)))
+
+  def testGetRuns(self):
+    """Test the get runs functionality."""
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+    file_object.open(path_spec=self._tsk_unallocated_path_spec)
+
+    expected_runs = [(0, 23552, 6144), (6144, 32768, 69632)]
+    self.assertEqual(file_object.GetRuns(), expected_runs)
+
+    file_object.close()
+
+  def testGetVolumeOffset(self):
+    """Test the get volume offset functionality."""
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+    file_object.open(path_spec=self._tsk_unallocated_path_spec)
+
+    self.assertEqual(file_object.GetVolumeOffset(0), 23552)
+    self.assertEqual(file_object.GetVolumeOffset(6143), 29695)
+    self.assertEqual(file_object.GetVolumeOffset(6144), 32768)
+
+    with self.assertRaises(ValueError):
+      file_object.GetVolumeOffset(-1)
+
+    with self.assertRaises(ValueError):
+      file_object.GetVolumeOffset(75776)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+
+    os_file_object.seek(29664, os.SEEK_SET)
+    expected_data = os_file_object.read(32)
+    os_file_object.seek(32768, os.SEEK_SET)
+    expected_data += os_file_object.read(32)
+
+    os_file_object.close()
+
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+    file_object.open(path_spec=self._tsk_unallocated_path_spec)
+
+    # Read data that spans the first and second run.
+    file_object.seek(6112, os.SEEK_SET)
+    self.assertEqual(file_object.read(64), expected_data)
+    self.assertEqual(file_object.get_offset(), 6176)
+
+    file_object.seek(-16, os.SEEK_END)
+    self.assertEqual(len(file_object.read()), 16)
+    self.assertEqual(file_object.read(), b'')
+
+    file_object.close()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = tsk_unallocated_file_io.TSKUnallocatedFile(
+        self._resolver_context)
+    file_object.open(path_spec=self._tsk_unallocated_path_spec)
+
+    file_object.seek(100, os.SEEK_SET)
+    self.assertEqual(file_object.get_offset(), 100)
+
+    file_object.seek(-10, os.SEEK_CUR)
+    self.assertEqual(file_object.get_offset(), 90)
+
+    file_object.seek(-10, os.SEEK_END)
+    self.assertEqual(file_object.get_offset(), 75766)
+
+    with self.assertRaises(IOError):
+      file_object.seek(-10, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      file_object.seek(10, 5)
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
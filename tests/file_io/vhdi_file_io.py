@@ -5,6 +5,7 @@
 import os
 import unittest
 
+from dfvfs.file_io import vhdi_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import vhdi_path_spec
@@ -22,6 +23,16 @@ class DynamicVHDIFileTest(test_lib.ImageFileTestCase):
     self._vhdi_path_spec = vhdi_path_spec.VHDIPathSpec(
         parent=self._os_path_spec)
 
+  def testGetAllocatedRanges(self):
+    """Test the get allocated ranges functionality."""
+    file_object = vhdi_file_io.VHDIFile(self._resolver_context)
+    file_object.open(path_spec=self._vhdi_path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 104448)])
+
+    file_object.close()
+
   def testOpenCloseInode(self):
     """Test the open and close functionality using an inode."""
     self._TestOpenCloseInode(self._vhdi_path_spec)
@@ -57,6 +68,16 @@ class DifferentialVHDIFileTest(test_lib.ImageFileTestCase):
     self._vhdi_path_spec = vhdi_path_spec.VHDIPathSpec(
         parent=self._os_path_spec)
 
+  def testGetAllocatedRanges(self):
+    """Test the get allocated ranges functionality."""
+    file_object = vhdi_file_io.VHDIFile(self._resolver_context)
+    file_object.open(path_spec=self._vhdi_path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 104448)])
+
+    file_object.close()
+
   def testOpenCloseInode(self):
     """Test the open and close functionality using an inode."""
     self._TestOpenCloseInode(self._vhdi_path_spec)
@@ -5,6 +5,7 @@
 import os
 import unittest
 
+from dfvfs.file_io import vmdk_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import vmdk_path_spec
@@ -22,6 +23,16 @@ class VMDKFileTest(test_lib.ImageFileTestCase):
     self._vmdk_path_spec = vmdk_path_spec.VMDKPathSpec(
         parent=self._os_path_spec)
 
+  def testGetAllocatedRanges(self):
+    """Test the get allocated ranges functionality."""
+    file_object = vmdk_file_io.VMDKFile(self._resolver_context)
+    file_object.open(path_spec=self._vmdk_path_spec)
+
+    allocated_ranges = file_object.GetAllocatedRanges()
+    self.assertEqual(allocated_ranges, [(0, 65536)])
+
+    file_object.close()
+
   def testOpenCloseInode(self):
     """Test the open and close functionality using an inode."""
     self._TestOpenCloseInode(self._vmdk_path_spec)
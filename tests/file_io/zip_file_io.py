@@ -53,6 +53,15 @@ class ZipFileTest(test_lib.SylogTestCase):
 
     # TODO: add tests for read > UNCOMPRESSED_DATA_BUFFER_SIZE
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = zip_file_io.ZipFile(self._resolver_context)
+    file_object.open(path_spec=self._zip_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
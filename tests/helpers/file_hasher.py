@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the file hasher object."""
+
+import hashlib
+import os
+import unittest
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.helpers import file_hasher
+from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+
+
+class TestCorruptedFile(fake_file_io.FakeFile):
+  """Class that implements a file-like object with corrupted tables."""
+
+  def GetAllocatedRanges(self):
+    """Retrieves the ranges of the data that is allocated.
+
+    Raises:
+      IOError: always.
+    """
+    raise IOError(u'Unable to read tables.')
+
+
+class FileHasherTest(unittest.TestCase):
+  """The unit test for the file hasher object."""
+
+  _PASSWORDS_TXT_DATA = (
+      b'place,user,password\n'
+      b'bank,joesmith,superrich\n'
+      b'alarm system,-,1234\n'
+      b'treasure chest,-,1111\n'
+      b'uber secret laire,admin,admin\n')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'image.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+    self._tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._qcow_path_spec)
+
+  def testInitialize(self):
+    """Test the initialize functionality."""
+    hasher = file_hasher.FileHasher(number_of_workers=0)
+    self.assertEqual(hasher.hash_names, [u'md5', u'sha1', u'sha256'])
+
+    with self.assertRaises(ValueError):
+      file_hasher.FileHasher(hash_names=[u'bogus'])
+
+    with self.assertRaises(ValueError):
+      file_hasher.FileHasher(number_of_workers=-1)
+
+  def testHashFileSystems(self):
+    """Test the hash file systems functionality."""
+    hasher = file_hasher.FileHasher(
+        number_of_workers=0, resolver_context=self._resolver_context)
+    hash_results = list(hasher.HashFileSystems([self._tsk_path_spec]))
+
+    hash_results_per_path = {
+        hash_result.path: hash_result for hash_result in hash_results}
+
+    hash_result = hash_results_per_path.get(u'/passwords.txt', None)
+    self.assertIsNotNone(hash_result)
+    self.assertIsNone(hash_result.error)
+    self.assertEqual(hash_result.hashes, {
+        u'md5': hashlib.md5(self._PASSWORDS_TXT_DATA).hexdigest(),
+        u'sha1': hashlib.sha1(self._PASSWORDS_TXT_DATA).hexdigest(),
+        u'sha256': hashlib.sha256(self._PASSWORDS_TXT_DATA).hexdigest()})
+
+    # The results of the worker processes are returned in the same order.
+    hasher = file_hasher.FileHasher(
+        number_of_workers=2, resolver_context=self._resolver_context)
+    worker_hash_results = list(hasher.HashFileSystems([self._tsk_path_spec]))
+
+    self.assertEqual(
+        [(hash_result.path, hash_result.hashes)
+         for hash_result in worker_hash_results],
+        [(hash_result.path, hash_result.hashes)
+         for hash_result in hash_results])
+
+  def testHashPathSpecs(self):
+    """Test the hash path specifications functionality."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/passwords.txt', parent=self._qcow_path_spec)
+    missing_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/bogus.txt', parent=self._qcow_path_spec)
+
+    hasher = file_hasher.FileHasher(
+        hash_names=[u'sha1'], number_of_workers=2,
+        resolver_context=self._resolver_context)
+    hash_results = list(hasher.HashPathSpecs([path_spec, missing_path_spec]))
+
+    self.assertEqual(len(hash_results), 2)
+    self.assertEqual(hash_results[0].path_spec, path_spec)
+    self.assertEqual(hash_results[0].hashes, {
+        u'sha1': hashlib.sha1(self._PASSWORDS_TXT_DATA).hexdigest()})
+
+    self.assertEqual(hash_results[1].path_spec, missing_path_spec)
+    self.assertIsNotNone(hash_results[1].error)
+    self.assertEqual(hash_results[1].hashes, {})
+
+  def testReadDataStream(self):
+    """Test the _ReadDataStream function."""
+    path_spec = fake_path_spec.FakePathSpec(location=u'/passwords.txt')
+    file_object = TestCorruptedFile(
+        self._resolver_context, self._PASSWORDS_TXT_DATA)
+    file_object.open(path_spec=path_spec)
+
+    # All the data is read if the allocated ranges cannot be determined.
+    data = b''.join(file_hasher._ReadDataStream(file_object, 16))
+    self.assertEqual(data, self._PASSWORDS_TXT_DATA)
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
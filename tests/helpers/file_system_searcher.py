@@ -334,6 +334,220 @@ class FileSystemSearcherTest(unittest.TestCase):
     test_relative_path = searcher.GetRelativePath(first_path_spec)
     self.assertEqual(test_relative_path, expected_relative_path)
 
+  def testFindEntries(self):
+    """Test the FindEntries() function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    find_spec1 = file_system_searcher.FindSpec(
+        location=u'/$Extend/$RmMetadata')
+    find_spec2 = file_system_searcher.FindSpec(
+        is_allocated=None, location=u'/password.txt')
+    file_entry_generator = searcher.FindEntries(
+        find_specs=[find_spec1, find_spec2])
+    self.assertIsNotNone(file_entry_generator)
+
+    expected_locations = [
+        u'/$Extend/$RmMetadata',
+        u'/password.txt']
+
+    locations = []
+    for file_entry in file_entry_generator:
+      self.assertIsNotNone(file_entry.GetStat())
+      locations.append(getattr(file_entry.path_spec, u'location', u''))
+
+    self.assertEqual(locations, expected_locations)
+
+    path_spec_generator = searcher.Find(find_specs=[find_spec1, find_spec2])
+    locations = [
+        getattr(path_spec, u'location', u'')
+        for path_spec in path_spec_generator]
+    self.assertEqual(locations, expected_locations)
+
+  def testFindWithMetadata(self):
+    """Test the Find() function with metadata find specifications."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    # Find all the file entries with a file name extension.
+    find_spec = file_system_searcher.FindSpec(
+        extensions=[u'BLF', u'txt'], case_sensitive=False)
+    locations = [
+        getattr(path_spec, u'location', u'')
+        for path_spec in searcher.Find(find_specs=[find_spec])]
+
+    expected_locations = [
+        u'/$Extend/$RmMetadata/$TxfLog/$TxfLog.blf',
+        u'/password.txt']
+
+    self.assertEqual(locations, expected_locations)
+
+    # Find all the files of a size range, modified in a time range.
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE],
+        modification_time_range=(1386052700, None),
+        size_range=(1024 * 1024, 10 * 1024 * 1024))
+    locations = [
+        getattr(path_spec, u'location', u'')
+        for path_spec in searcher.Find(find_specs=[find_spec])]
+
+    expected_locations = [
+        u'/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000001',
+        u'/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000002']
+
+    self.assertEqual(locations, expected_locations)
+
+    # Find all the file entries of an inode range, created in a time range.
+    find_spec = file_system_searcher.FindSpec(
+        creation_time_range=(None, 1386052600), inode_range=(34, 40))
+    locations = [
+        getattr(path_spec, u'location', u'')
+        for path_spec in searcher.Find(find_specs=[find_spec])]
+
+    expected_locations = [
+        u'/$Extend/$RmMetadata/$TxfLog/$TxfLogContainer00000000000000000002',
+        u'/another_file',
+        u'/syslog.gz',
+        u'/System Volume Information',
+        (u'/System Volume Information/'
+         u'{3808876b-c176-4e48-b7ae-04046e6cc752}'),
+        (u'/System Volume Information/{600f0b69-5bdf-11e3-9d6c-005056c00008}'
+         u'{3808876b-c176-4e48-b7ae-04046e6cc752}')]
+
+    self.assertEqual(locations, expected_locations)
+
+    with self.assertRaises(ValueError):
+      file_system_searcher.FindSpec(size_range=(10, 1))
+
+    with self.assertRaises(ValueError):
+      file_system_searcher.FindSpec(inode_range=1)
+
+  def testFindWithOverlappingFindSpecs(self):
+    """Test the Find() function with find specifications that overlap."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    # Find specifications that share location segments and match the same
+    # file entries, where a matching file entry is only returned once.
+    find_spec1 = file_system_searcher.FindSpec(
+        location=u'/$Extend/$RmMetadata/$TxfLog')
+    find_spec2 = file_system_searcher.FindSpec(
+        location=u'/$EXTEND/$RMMETADATA/$TXFLOG', case_sensitive=False)
+    find_spec3 = file_system_searcher.FindSpec(
+        location_regex=[r'\$Extend', r'\$RmMetadata', u'.*'])
+    find_spec4 = file_system_searcher.FindSpec(
+        location_regex=[r'\$Extend', r'\$RmMetadata', u'\$Txf'])
+    find_spec5 = file_system_searcher.FindSpec(
+        location_regex=u'/[')
+    path_spec_generator = searcher.Find(
+        find_specs=[find_spec1, find_spec2, find_spec3, find_spec4, find_spec5])
+    self.assertIsNotNone(path_spec_generator)
+
+    expected_locations = [
+        u'/$Extend/$RmMetadata/$Repair',
+        u'/$Extend/$RmMetadata/$Txf',
+        u'/$Extend/$RmMetadata/$TxfLog']
+
+    locations = []
+    for path_spec in path_spec_generator:
+      locations.append(getattr(path_spec, u'location', u''))
+
+    self.assertEqual(sorted(locations), expected_locations)
+
+    # Find all the allocated file entries.
+    path_spec_generator = searcher.Find()
+    self.assertIsNotNone(path_spec_generator)
+
+    locations = []
+    for path_spec in path_spec_generator:
+      locations.append(getattr(path_spec, u'location', u''))
+
+    self.assertIn(u'/', locations)
+    self.assertIn(u'/$Extend/$RmMetadata/$TxfLog/$TxfLog.blf', locations)
+    self.assertEqual(len(locations), len(set(locations)))
+
+  def testParallelFind(self):
+    """Test the ParallelFind() function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    find_spec1 = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    find_spec2 = file_system_searcher.FindSpec(
+        location=u'/$Extend/$RmMetadata')
+
+    expected_locations = [
+        getattr(path_spec, u'location', u'') for path_spec in searcher.Find(
+            find_specs=[find_spec1, find_spec2])]
+
+    for use_threads in (True, False):
+      for split_depth in (1, 2):
+        path_spec_generator = searcher.ParallelFind(
+            find_specs=[find_spec1, find_spec2], number_of_workers=2,
+            split_depth=split_depth, use_threads=use_threads)
+        self.assertIsNotNone(path_spec_generator)
+
+        locations = []
+        for path_spec in path_spec_generator:
+          locations.append(getattr(path_spec, u'location', u''))
+
+        self.assertEqual(locations, expected_locations)
+
+    path_spec_generator = searcher.ParallelFind(
+        find_specs=[find_spec1, find_spec2], number_of_workers=2,
+        ordered=False)
+
+    locations = []
+    for path_spec in path_spec_generator:
+      locations.append(getattr(path_spec, u'location', u''))
+
+    self.assertEqual(sorted(locations), sorted(expected_locations))
+
+    with self.assertRaises(ValueError):
+      searcher.ParallelFind(number_of_workers=-1)
+
+    with self.assertRaises(ValueError):
+      searcher.ParallelFind(number_of_workers=2, split_depth=0)
+
+
+class FindSpecsTrieNodeTest(unittest.TestCase):
+  """The unit test for the find specifications trie node object."""
+
+  def testAddChildNode(self):
+    """Test the AddChildNode() function."""
+    trie_node = file_system_searcher.FindSpecsTrieNode()
+    self.assertFalse(trie_node.HasChildNodes())
+
+    child_node1 = trie_node.AddChildNode((u'name', u'test'))
+    child_node2 = trie_node.AddChildNode((u'name', u'test'))
+    self.assertIs(child_node1, child_node2)
+    self.assertTrue(trie_node.HasChildNodes())
+
+    child_node2 = trie_node.AddChildNode((u'regex', (u'^test$', 0)))
+    self.assertIsNot(child_node1, child_node2)
+
+    with self.assertRaises(ValueError):
+      trie_node.AddChildNode((u'regex', (u'^[$', 0)))
+
+    with self.assertRaises(ValueError):
+      trie_node.AddChildNode((u'bogus', u'test'))
+
+  def testGetChildNodes(self):
+    """Test the GetChildNodes() function."""
+    trie_node = file_system_searcher.FindSpecsTrieNode()
+    child_node1 = trie_node.AddChildNode((u'name', u'Test'))
+    child_node2 = trie_node.AddChildNode((u'lower_case_name', u'test'))
+    child_node3 = trie_node.AddChildNode((u'regex', (u'^T.*$', 0)))
+
+    child_nodes = trie_node.GetChildNodes(u'Test')
+    self.assertEqual(child_nodes, [child_node1, child_node2, child_node3])
+
+    child_nodes = trie_node.GetChildNodes(u'TEST')
+    self.assertEqual(child_nodes, [child_node2, child_node3])
+
+    child_nodes = trie_node.GetChildNodes(u'bogus')
+    self.assertEqual(child_nodes, [])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,228 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the extent read scheduler object."""
+
+import hashlib
+import os
+import unittest
+
+from dfvfs.helpers import read_scheduler
+from dfvfs.path import ntfs_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+
+
+class DataStreamReadStateTest(unittest.TestCase):
+  """The unit test for the data stream read state object."""
+
+  def testFeed(self):
+    """Test the feed functionality."""
+    read_state = read_scheduler._DataStreamReadState(
+        None, 12, read_scheduler._DataConsumer())
+    read_state._MAXIMUM_PENDING_DATA_SIZE = 4
+
+    read_state.Feed(8, b'89ab')
+    read_state.Feed(4, 4)
+    self.assertFalse(read_state.read_sequentially)
+    self.assertEqual(read_state.data_offset, 0)
+
+    read_state.Feed(0, b'0123')
+    self.assertTrue(read_state.is_complete)
+    self.assertEqual(
+        read_state.consumer.GetData(), b'0123\x00\x00\x00\x0089ab')
+
+  def testFeedExceedingMaximumPendingDataSize(self):
+    """Test the feed functionality with too much data read out of order."""
+    read_state = read_scheduler._DataStreamReadState(
+        None, 12, read_scheduler._DataConsumer())
+    read_state._MAXIMUM_PENDING_DATA_SIZE = 4
+
+    read_state.Feed(4, b'4567')
+    read_state.Feed(8, b'89ab')
+    self.assertTrue(read_state.read_sequentially)
+    self.assertEqual(read_state._pending_data, {})
+
+    # Data read in order is still passed to the consumer.
+    read_state.Feed(0, b'0123')
+    self.assertEqual(read_state.data_offset, 4)
+    self.assertFalse(read_state.is_complete)
+
+
+class PendingDataTrackerTest(unittest.TestCase):
+  """The unit test for the pending data tracker object."""
+
+  def testUpdate(self):
+    """Test the update functionality with interleaved data streams."""
+    pending_data_tracker = read_scheduler._PendingDataTracker(10)
+    read_states = [
+        read_scheduler._DataStreamReadState(
+            None, 12, read_scheduler._DataConsumer(),
+            pending_data_tracker=pending_data_tracker)
+        for _ in range(3)]
+
+    read_states[0].Feed(8, b'89ab')
+    read_states[1].Feed(6, b'6789ab')
+    self.assertEqual(pending_data_tracker.size, 10)
+
+    # The data of the data stream that keeps the most data is discarded.
+    read_states[2].Feed(10, b'ab')
+    self.assertEqual(pending_data_tracker.size, 6)
+    self.assertFalse(read_states[0].read_sequentially)
+    self.assertTrue(read_states[1].read_sequentially)
+    self.assertFalse(read_states[2].read_sequentially)
+
+    # Data read out of order of a discarded data stream is no longer kept.
+    read_states[1].Feed(0, b'012345')
+    read_states[1].Feed(8, b'89ab')
+    self.assertEqual(read_states[1].pending_data_size, 0)
+    self.assertEqual(read_states[1].data_offset, 6)
+
+    read_states[2].Feed(0, b'0123456789')
+    self.assertTrue(read_states[2].is_complete)
+    self.assertEqual(pending_data_tracker.size, 4)
+
+    read_states[0].Feed(0, b'01234567')
+    self.assertTrue(read_states[0].is_complete)
+    self.assertEqual(read_states[0].consumer.GetData(), b'0123456789ab')
+    self.assertEqual(pending_data_tracker.size, 0)
+
+
+class ExtentReadSchedulerTest(unittest.TestCase):
+  """The unit test for the extent read scheduler object."""
+
+  _A_FILE_DATA = (
+      b'This is a text file.\n\nWe should be able to parse it.\n')
+
+  _ANOTHER_FILE_DATA = b'This is another file.\n'
+
+  _PASSWORDS_TXT_DATA = (
+      b'place,user,password\n'
+      b'bank,joesmith,superrich\n'
+      b'alarm system,-,1234\n'
+      b'treasure chest,-,1111\n'
+      b'uber secret laire,admin,admin\n')
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = os.path.join(u'test_data', u'image.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    self._path_specs = [
+        tsk_path_spec.TSKPathSpec(
+            location=location, parent=self._qcow_path_spec)
+        for location in (
+            u'/a_directory/another_file', u'/passwords.txt',
+            u'/a_directory/a_file')]
+
+  def testInitialize(self):
+    """Test the initialize functionality."""
+    read_scheduler.ExtentReadScheduler()
+
+    with self.assertRaises(ValueError):
+      read_scheduler.ExtentReadScheduler(maximum_gap_size=-1)
+
+    with self.assertRaises(ValueError):
+      read_scheduler.ExtentReadScheduler(maximum_pending_data_size=-1)
+
+    with self.assertRaises(ValueError):
+      read_scheduler.ExtentReadScheduler(maximum_read_size=0)
+
+  def testHashDataStreams(self):
+    """Test the hash data streams functionality."""
+    scheduler = read_scheduler.ExtentReadScheduler(
+        resolver_context=self._resolver_context)
+    hash_results = list(scheduler.HashDataStreams(
+        self._path_specs, hash_names=[u'md5', u'sha1']))
+
+    self.assertEqual(len(hash_results), 3)
+
+    hash_result = hash_results[0]
+    self.assertEqual(hash_result.path_spec, self._path_specs[1])
+    self.assertIsNone(hash_result.error)
+    self.assertEqual(hash_result.hashes, {
+        u'md5': hashlib.md5(self._PASSWORDS_TXT_DATA).hexdigest(),
+        u'sha1': hashlib.sha1(self._PASSWORDS_TXT_DATA).hexdigest()})
+
+    with self.assertRaises(ValueError):
+      list(scheduler.HashDataStreams(self._path_specs, hash_names=[u'bogus']))
+
+  def testReadDataStreams(self):
+    """Test the read data streams functionality."""
+    expected_results = [
+        (self._path_specs[1], self._PASSWORDS_TXT_DATA),
+        (self._path_specs[2], self._A_FILE_DATA),
+        (self._path_specs[0], self._ANOTHER_FILE_DATA)]
+
+    # The data streams are returned in the order of their extents.
+    scheduler = read_scheduler.ExtentReadScheduler(
+        resolver_context=self._resolver_context)
+    results = list(scheduler.ReadDataStreams(self._path_specs))
+    self.assertEqual(results, expected_results)
+
+    scheduler = read_scheduler.ExtentReadScheduler(
+        maximum_gap_size=0, maximum_read_size=16,
+        resolver_context=self._resolver_context)
+    results = list(scheduler.ReadDataStreams(self._path_specs))
+    self.assertEqual(results, expected_results)
+
+    # Data streams of which the data read out of order is discarded are
+    # read sequentially.
+    scheduler = read_scheduler.ExtentReadScheduler(
+        maximum_pending_data_size=0, resolver_context=self._resolver_context)
+    results = list(scheduler.ReadDataStreams(self._path_specs))
+    self.assertEqual(results, expected_results)
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/bogus', parent=self._qcow_path_spec)
+    results = list(scheduler.ReadDataStreams([path_spec]))
+    self.assertEqual(results, [(path_spec, None)])
+
+  def testReadRemainingDataStream(self):
+    """Test the read remaining data stream functionality."""
+    path_spec = self._path_specs[1]
+    read_state = read_scheduler._DataStreamReadState(
+        path_spec, len(self._PASSWORDS_TXT_DATA),
+        read_scheduler._DataConsumer())
+    read_state.Feed(0, self._PASSWORDS_TXT_DATA[:20])
+
+    scheduler = read_scheduler.ExtentReadScheduler(
+        resolver_context=self._resolver_context)
+    scheduler._ReadRemainingDataStream(read_state, u'')
+    self.assertIsNone(read_state.error)
+    self.assertTrue(read_state.is_complete)
+    self.assertEqual(read_state.consumer.GetData(), self._PASSWORDS_TXT_DATA)
+
+  def testReadDataStreamsNTFS(self):
+    """Test the read data streams functionality on NTFS."""
+    test_file = os.path.join(u'test_data', u'vsstest.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    qcow_path_spec_object = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    # The valid data size of the data stream is 0, hence the data is read
+    # as zero bytes.
+    test_location = (
+        u'\\System Volume Information\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_specs = [
+        ntfs_path_spec.NTFSPathSpec(
+            location=u'\\$UpCase', mft_entry=10,
+            parent=qcow_path_spec_object),
+        ntfs_path_spec.NTFSPathSpec(
+            location=test_location, mft_entry=38,
+            parent=qcow_path_spec_object)]
+
+    scheduler = read_scheduler.ExtentReadScheduler(
+        resolver_context=self._resolver_context)
+    results = list(scheduler.ReadDataStreams(path_specs))
+    self.assertEqual(len(results), 2)
+
+    results = dict(results)
+    self.assertEqual(len(results[path_specs[0]]), 131072)
+    self.assertEqual(results[path_specs[1]], b'\x00' * 65536)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the block cache."""
+
+import unittest
+
+from dfvfs.lib import block_cache
+
+
+class BlockCacheTest(unittest.TestCase):
+  """The unit test for the block cache."""
+
+  def testInitialize(self):
+    """Test the initialize functionality."""
+    test_cache = block_cache.BlockCache(64, block_size=16)
+    self.assertEqual(test_cache.block_size, 16)
+    self.assertEqual(test_cache.maximum_size, 64)
+    self.assertEqual(test_cache.size, 0)
+
+    with self.assertRaises(ValueError):
+      block_cache.BlockCache(0)
+
+    with self.assertRaises(ValueError):
+      block_cache.BlockCache(64, block_size=0)
+
+  def testCacheBlock(self):
+    """Test the cache block functionality."""
+    test_cache = block_cache.BlockCache(64, block_size=16)
+
+    test_cache.CacheBlock(u'test1', 0, b'A' * 16)
+    test_cache.CacheBlock(u'test2', 0, b'B' * 16)
+    self.assertEqual(test_cache.size, 32)
+
+    self.assertEqual(test_cache.GetBlock(u'test1', 0), b'A' * 16)
+    self.assertEqual(test_cache.GetBlock(u'test2', 0), b'B' * 16)
+    self.assertIsNone(test_cache.GetBlock(u'test1', 1))
+
+    # Replacing a cached block does not change the size of the cache.
+    test_cache.CacheBlock(u'test1', 0, b'C' * 16)
+    self.assertEqual(test_cache.size, 32)
+    self.assertEqual(test_cache.GetBlock(u'test1', 0), b'C' * 16)
+
+    # Blocks larger than the maximum size are not cached.
+    test_cache.CacheBlock(u'test1', 1, b'D' * 128)
+    self.assertIsNone(test_cache.GetBlock(u'test1', 1))
+    self.assertEqual(test_cache.size, 32)
+
+  def testEviction(self):
+    """Test the least recently used eviction functionality."""
+    test_cache = block_cache.BlockCache(48, block_size=16)
+
+    test_cache.CacheBlock(u'test', 0, b'A' * 16)
+    test_cache.CacheBlock(u'test', 1, b'B' * 16)
+    test_cache.CacheBlock(u'test', 2, b'C' * 16)
+
+    # Marks block 0 as the most recently used block.
+    test_cache.GetBlock(u'test', 0)
+
+    test_cache.CacheBlock(u'test', 3, b'D' * 16)
+    self.assertEqual(test_cache.size, 48)
+    self.assertIsNone(test_cache.GetBlock(u'test', 1))
+    self.assertIsNotNone(test_cache.GetBlock(u'test', 0))
+    self.assertIsNotNone(test_cache.GetBlock(u'test', 2))
+    self.assertIsNotNone(test_cache.GetBlock(u'test', 3))
+
+    test_cache.SetMaximumSize(16)
+    self.assertEqual(test_cache.size, 16)
+    self.assertIsNotNone(test_cache.GetBlock(u'test', 3))
+
+    test_cache.Empty()
+    self.assertEqual(test_cache.size, 0)
+    self.assertIsNone(test_cache.GetBlock(u'test', 3))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the Copy in and out (CPIO) archive file support."""
+
+import os
+import unittest
+
+from dfvfs.file_io import os_file_io
+from dfvfs.lib import cpio
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+
+class CPIOArchiveFileTest(unittest.TestCase):
+  """The unit test for the CPIO archive file object."""
+
+  _FILE_FORMATS = [u'bin', u'crc', u'newc', u'odc']
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def _OpenCPIOArchiveFile(self, file_format):
+    """Opens a CPIO archive file.
+
+    Args:
+      file_format: a string containing the file format of the test file.
+
+    Returns:
+      A tuple of the CPIO archive file and the file-like object.
+    """
+    test_file = os.path.join(
+        u'test_data', u'syslog.{0:s}.cpio'.format(file_format))
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    cpio_archive_file = cpio.CPIOArchiveFile()
+    cpio_archive_file.Open(file_object)
+
+    return cpio_archive_file, file_object
+
+  def testGetFileEntryByPath(self):
+    """Tests the GetFileEntryByPath function."""
+    for file_format in self._FILE_FORMATS:
+      cpio_archive_file, file_object = self._OpenCPIOArchiveFile(file_format)
+
+      file_entry = cpio_archive_file.GetFileEntryByPath(u'syslog')
+      self.assertIsNotNone(file_entry)
+      self.assertEqual(file_entry.data_size, 1247)
+      self.assertEqual(file_entry.group_identifier, 1000)
+      self.assertEqual(file_entry.mode, 0o100664)
+      self.assertEqual(file_entry.modification_time, 1432702913)
+      self.assertEqual(file_entry.user_identifier, 1000)
+
+      data = cpio_archive_file.ReadDataAtOffset(file_entry.data_offset, 5)
+      self.assertEqual(data, b'Jan 2')
+
+      self.assertIsNone(cpio_archive_file.GetFileEntryByPath(u'bogus'))
+
+      cpio_archive_file.Close()
+      file_object.close()
+
+  def testGetDirectoryFileEntries(self):
+    """Tests the GetDirectoryFileEntries function."""
+    for file_format in self._FILE_FORMATS:
+      cpio_archive_file, file_object = self._OpenCPIOArchiveFile(file_format)
+
+      paths = [
+          file_entry.path
+          for file_entry in cpio_archive_file.GetDirectoryFileEntries()
+          if file_entry.path]
+      self.assertEqual(paths, [u'syslog'])
+
+      file_entries = list(cpio_archive_file.GetDirectoryFileEntries(
+          path=u'syslog'))
+      self.assertEqual(file_entries, [])
+
+      cpio_archive_file.Close()
+      file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
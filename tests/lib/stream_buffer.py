@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the stream buffer."""
+
+import unittest
+
+from dfvfs.lib import stream_buffer
+
+
+class StreamBufferTest(unittest.TestCase):
+  """The unit test for the stream buffer."""
+
+  def testAppend(self):
+    """Test the append functionality."""
+    test_buffer = stream_buffer.StreamBuffer()
+    self.assertEqual(test_buffer.size, 0)
+
+    test_buffer.Append(b'0123')
+    test_buffer.Append(b'')
+    test_buffer.Append(b'4567')
+    self.assertEqual(test_buffer.size, 8)
+
+    test_buffer.Clear()
+    self.assertEqual(test_buffer.size, 0)
+    self.assertEqual(test_buffer.Read(), b'')
+
+  def testRead(self):
+    """Test the read functionality."""
+    test_buffer = stream_buffer.StreamBuffer()
+
+    test_data = b'0123'
+    test_buffer.Append(test_data)
+    test_buffer.Append(b'4567')
+    test_buffer.Append(b'89')
+
+    self.assertEqual(test_buffer.Read(1), b'0')
+    self.assertEqual(test_buffer.Read(2), b'12')
+    self.assertEqual(test_buffer.size, 7)
+
+    # Data that spans multiple appended data.
+    self.assertEqual(test_buffer.Read(6), b'345678')
+    self.assertEqual(test_buffer.size, 1)
+
+    self.assertEqual(test_buffer.Read(), b'9')
+    self.assertEqual(test_buffer.Read(1), b'')
+    self.assertEqual(test_buffer.size, 0)
+
+    # Data that is read entirely is not copied.
+    test_buffer.Append(test_data)
+    self.assertIs(test_buffer.Read(4), test_data)
+
+  def testReadInto(self):
+    """Test the read into functionality."""
+    test_buffer = stream_buffer.StreamBuffer()
+    test_buffer.Append(b'0123')
+    test_buffer.Append(b'4567')
+
+    read_buffer = bytearray(6)
+    self.assertEqual(test_buffer.ReadInto(read_buffer), 6)
+    self.assertEqual(read_buffer, b'012345')
+
+    read_buffer = bytearray(b'xxxx')
+    self.assertEqual(test_buffer.ReadInto(memoryview(read_buffer)[1:]), 2)
+    self.assertEqual(read_buffer, b'x67x')
+    self.assertEqual(test_buffer.size, 0)
+
+    self.assertEqual(test_buffer.ReadInto(read_buffer), 0)
+
+  def testRewind(self):
+    """Test the rewind functionality."""
+    test_buffer = stream_buffer.StreamBuffer()
+    test_buffer.Append(b'0123')
+    test_buffer.Append(b'4567')
+
+    self.assertEqual(test_buffer.Skip(5), 5)
+    self.assertTrue(test_buffer.Rewind(1))
+    self.assertEqual(test_buffer.Read(2), b'45')
+
+    # Only the data read of the first data is retained.
+    self.assertFalse(test_buffer.Rewind(3))
+    self.assertEqual(test_buffer.size, 2)
+
+    self.assertEqual(test_buffer.Read(), b'67')
+    self.assertTrue(test_buffer.Rewind(4))
+    self.assertEqual(test_buffer.Read(), b'4567')
+
+    # Appending data no longer retains the data that was read entirely.
+    test_buffer.Append(b'89')
+    self.assertFalse(test_buffer.Rewind(1))
+    self.assertEqual(test_buffer.Read(), b'89')
+
+  def testSkip(self):
+    """Test the skip functionality."""
+    test_buffer = stream_buffer.StreamBuffer()
+    test_buffer.Append(b'0123')
+    test_buffer.Append(b'4567')
+
+    self.assertEqual(test_buffer.Skip(0), 0)
+    self.assertEqual(test_buffer.Skip(4), 4)
+    self.assertEqual(test_buffer.Read(1), b'4')
+    self.assertEqual(test_buffer.Skip(8), 3)
+    self.assertEqual(test_buffer.size, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the stream index cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.lib import stream_index_cache
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+
+class StreamIndexCacheTest(unittest.TestCase):
+  """The unit test for the stream index cache."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testInitialize(self):
+    """Test the initialize functionality."""
+    test_cache = stream_index_cache.StreamIndexCache(self._temporary_directory)
+    self.assertIsNotNone(test_cache)
+
+    with self.assertRaises(ValueError):
+      bogus_path = os.path.join(self._temporary_directory, u'bogus')
+      stream_index_cache.StreamIndexCache(bogus_path)
+
+  def testGetFingerprint(self):
+    """Test the get fingerprint functionality."""
+    test_cache = stream_index_cache.StreamIndexCache(self._temporary_directory)
+    path_spec = fake_path_spec.FakePathSpec(location=u'/test')
+
+    file_object = fake_file_io.FakeFile(
+        self._resolver_context, b'A' * 200000)
+    file_object.open(path_spec=path_spec)
+    fingerprint1 = test_cache.GetFingerprint(file_object)
+    file_object.close()
+
+    file_object = fake_file_io.FakeFile(
+        self._resolver_context, b'A' * 199999 + b'B')
+    file_object.open(path_spec=path_spec)
+    fingerprint2 = test_cache.GetFingerprint(file_object)
+    file_object.close()
+
+    self.assertNotEqual(fingerprint1, fingerprint2)
+
+  def testGetAndStoreStreamIndex(self):
+    """Test the get and store stream index functionality."""
+    test_cache = stream_index_cache.StreamIndexCache(self._temporary_directory)
+
+    stream_index = test_cache.GetStreamIndex(u'identifier', u'fingerprint')
+    self.assertIsNone(stream_index)
+
+    test_cache.StoreStreamIndex(
+        u'identifier', u'fingerprint', {u'uncompressed_stream_size': 1247})
+
+    stream_index = test_cache.GetStreamIndex(u'identifier', u'fingerprint')
+    self.assertEqual(stream_index, {u'uncompressed_stream_size': 1247})
+
+    # A stale fingerprint should not return the stream index.
+    stream_index = test_cache.GetStreamIndex(u'identifier', u'bogus')
+    self.assertIsNone(stream_index)
+
+    test_cache.StoreStreamIndex(
+        u'identifier', u'fingerprint', {u'uncompressed_stream_size': 1248})
+
+    stream_index = test_cache.GetStreamIndex(u'identifier', u'fingerprint')
+    self.assertEqual(stream_index, {u'uncompressed_stream_size': 1248})
+
+
+if __name__ == '__main__':
+  unittest.main()
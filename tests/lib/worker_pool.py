@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the worker pool helper functions."""
+
+import unittest
+
+from dfvfs.lib import worker_pool
+
+
+def _GetWorkerResult(task):
+  """Retrieves the result of a test task.
+
+  Args:
+    task (int): test task.
+
+  Returns:
+    tuple[int, object, bool]: task, data and True if the worker has
+        a resolver context.
+  """
+  resolver_context = worker_pool.GetWorkerResolverContext()
+  return task, worker_pool.GetWorkerData(), resolver_context is not None
+
+
+def _InitializeWorkerData(value):
+  """Initializes the data of a test worker.
+
+  Args:
+    value (str): value.
+
+  Returns:
+    str: data of the worker.
+  """
+  return u'data: {0:s}'.format(value)
+
+
+class WorkerPoolTest(unittest.TestCase):
+  """The unit test for the worker pool helper functions."""
+
+  def testGetNumberOfWorkers(self):
+    """Test the GetNumberOfWorkers function."""
+    self.assertEqual(worker_pool.GetNumberOfWorkers(2), 2)
+    self.assertGreater(worker_pool.GetNumberOfWorkers(None), 0)
+
+    with self.assertRaises(ValueError):
+      worker_pool.GetNumberOfWorkers(-1)
+
+  def testMap(self):
+    """Test the Map function."""
+    expected_results = [
+        (task, u'data: test', True) for task in range(10)]
+
+    for use_threads in (False, True):
+      results = list(worker_pool.Map(
+          _GetWorkerResult, range(10), 2, chunk_size=3,
+          initializer=_InitializeWorkerData, initializer_arguments=(u'test',),
+          use_threads=use_threads))
+      self.assertEqual(results, expected_results)
+
+    results = list(worker_pool.Map(
+        _GetWorkerResult, range(10), 2, ordered=False, use_threads=True))
+    self.assertEqual(
+        sorted(results), [(task, None, True) for task in range(10)])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the VFS path specification object interface."""
+
+import copy
+import pickle
+import unittest
+
+from dfvfs.path import tsk_path_spec
+
+from tests.path import test_lib
+
+
+class PathSpecTest(test_lib.PathSpecTestCase):
+  """Tests for the VFS path specification object interface."""
+
+  def testComparableIsCached(self):
+    """Tests that the comparable representation is cached."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=self._path_spec)
+
+    comparable = path_spec.comparable
+    self.assertIs(path_spec.comparable, comparable)
+    self.assertEqual(hash(path_spec), hash(comparable))
+
+  def testImmutable(self):
+    """Tests that the path specification is immutable once compared."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=self._path_spec)
+
+    # The path specification can be changed until its comparable has been
+    # determined.
+    path_spec.location = u'/test2'
+
+    _ = hash(path_spec)
+
+    with self.assertRaises(AttributeError):
+      path_spec.location = u'/test3'
+
+    self.assertEqual(path_spec.location, u'/test2')
+
+  def testEquality(self):
+    """Tests the equality functionality."""
+    path_spec1 = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=self._path_spec)
+    path_spec2 = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=self._path_spec)
+    path_spec3 = tsk_path_spec.TSKPathSpec(
+        location=u'/test2', parent=self._path_spec)
+
+    self.assertEqual(path_spec1, path_spec1)
+    self.assertEqual(path_spec1, path_spec2)
+    self.assertNotEqual(path_spec1, path_spec3)
+    self.assertNotEqual(path_spec1, None)
+
+    # Equal path specifications with different parent objects.
+    path_spec4 = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=test_lib.TestPathSpec())
+    self.assertEqual(path_spec1, path_spec4)
+
+  def testCopy(self):
+    """Tests that copies of a path specification are mutable."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=self._path_spec)
+    _ = hash(path_spec)
+
+    path_spec_copy = copy.copy(path_spec)
+    self.assertIs(path_spec_copy.parent, path_spec.parent)
+
+    path_spec_copy.data_stream = u'test'
+    self.assertNotEqual(path_spec_copy, path_spec)
+
+    path_spec_copy = pickle.loads(pickle.dumps(path_spec))
+    self.assertEqual(path_spec_copy, path_spec)
+
+  def testCopyToDict(self):
+    """Tests the CopyToDict function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/test', parent=self._path_spec)
+    _ = hash(path_spec)
+
+    path_spec_dict = path_spec.CopyToDict()
+    self.assertEqual(path_spec_dict, {u'location': u'/test', u'parent': {}})
+
+
+if __name__ == '__main__':
+  unittest.main()
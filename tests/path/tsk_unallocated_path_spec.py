@@ -0,0 +1,45 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the TSK unallocated space path specification implementation."""
+
+import unittest
+
+from dfvfs.path import tsk_unallocated_path_spec
+
+from tests.path import test_lib
+
+
+class TSKUnallocatedPathSpecTest(test_lib.PathSpecTestCase):
+  """Tests for the TSK unallocated space path specification implementation."""
+
+  def testInitialize(self):
+    """Tests the path specification initialization."""
+    path_spec = tsk_unallocated_path_spec.TSKUnallocatedPathSpec(
+        parent=self._path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    with self.assertRaises(ValueError):
+      _ = tsk_unallocated_path_spec.TSKUnallocatedPathSpec(parent=None)
+
+    with self.assertRaises(ValueError):
+      _ = tsk_unallocated_path_spec.TSKUnallocatedPathSpec(
+          parent=self._path_spec, bogus=u'BOGUS')
+
+  def testComparable(self):
+    """Tests the path specification comparable property."""
+    path_spec = tsk_unallocated_path_spec.TSKUnallocatedPathSpec(
+        parent=self._path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    expected_comparable = u'\n'.join([
+        u'type: TEST',
+        u'type: TSK_UNALLOCATED',
+        u''])
+
+    self.assertEqual(path_spec.comparable, expected_comparable)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -80,6 +80,7 @@ class ObjectsCacheTest(unittest.TestCase):
     self.assertIsNotNone(cache_object)
 
     cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+    cache_object.GrabObject(self._path_spec.comparable)
 
     path_spec = fake_path_spec.FakePathSpec(location=u'2')
     vfs_object = TestVFSObject()
@@ -87,6 +88,49 @@ class ObjectsCacheTest(unittest.TestCase):
     with self.assertRaises(errors.CacheFullError):
       cache_object.CacheObject(path_spec.comparable, vfs_object)
 
+  def testCacheEviction(self):
+    """Tests the eviction of least recently used dereferenced objects."""
+    cache_object = cache.ObjectsCache(2)
+    self.assertIsNotNone(cache_object)
+
+    evicted_objects = cache_object.CacheObject(
+        self._path_spec.comparable, self._vfs_object)
+    self.assertEqual(evicted_objects, [])
+
+    path_spec2 = fake_path_spec.FakePathSpec(location=u'2')
+    vfs_object2 = TestVFSObject()
+    cache_object.CacheObject(path_spec2.comparable, vfs_object2)
+
+    # Grabbing marks the first object as most recently used.
+    cache_object.GrabObject(self._path_spec.comparable)
+    cache_object.ReleaseObject(self._path_spec.comparable)
+
+    path_spec3 = fake_path_spec.FakePathSpec(location=u'3')
+    vfs_object3 = TestVFSObject()
+    evicted_objects = cache_object.CacheObject(
+        path_spec3.comparable, vfs_object3)
+    self.assertEqual(evicted_objects, [vfs_object2])
+
+    self.assertIsNone(cache_object.GetObject(path_spec2.comparable))
+    identifier, cache_value = cache_object.GetCacheValueByObject(vfs_object2)
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
+    # Referenced objects are not evicted.
+    cache_object.GrabObject(path_spec3.comparable)
+
+    path_spec4 = fake_path_spec.FakePathSpec(location=u'4')
+    vfs_object4 = TestVFSObject()
+    evicted_objects = cache_object.CacheObject(
+        path_spec4.comparable, vfs_object4)
+    self.assertEqual(evicted_objects, [self._vfs_object])
+
+    cache_object.GrabObject(path_spec4.comparable)
+
+    path_spec5 = fake_path_spec.FakePathSpec(location=u'5')
+    with self.assertRaises(errors.CacheFullError):
+      cache_object.CacheObject(path_spec5.comparable, TestVFSObject())
+
   def testEmpty(self):
     """Tests the Empty method."""
     cache_object = cache.ObjectsCache(5)
@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 """Tests for the resolver context object."""
 
+import os
 import unittest
 
 from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import os_file_io
 from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import fake_file_system
 
@@ -38,9 +41,56 @@ class ContextTest(unittest.TestCase):
     resolver_context.ReleaseFileObject(file_object)
     self.assertEqual(len(resolver_context._file_object_cache._values), 1)
 
+    # The dereferenced file-like object remains cached.
     resolver_context.ReleaseFileObject(file_object)
+    self.assertEqual(len(resolver_context._file_object_cache._values), 1)
+    self.assertEqual(
+        resolver_context.GetFileObjectReferenceCount(path_spec), 0)
+
+    self.assertTrue(resolver_context.EvictFileObject(file_object))
     self.assertEqual(len(resolver_context._file_object_cache._values), 0)
 
+  def testCacheFileObjectEviction(self):
+    """Tests the eviction of dereferenced file-like objects."""
+    resolver_context = context.Context(maximum_number_of_file_objects=1)
+
+    test_file = os.path.join(u'test_data', u'password.txt')
+    path_spec1 = os_path_spec.OSPathSpec(location=test_file)
+    file_object1 = os_file_io.OSFile(resolver_context)
+    file_object1.open(path_spec=path_spec1)
+    file_object1.read(5)
+    file_object1.close()
+
+    # The dereferenced file-like object remains open internally, but can
+    # no longer be used.
+    self.assertIsNotNone(file_object1._file_object)
+    with self.assertRaises(IOError):
+      file_object1.read(5)
+    with self.assertRaises(IOError):
+      file_object1.close()
+
+    # The dereferenced file-like object is reused and reset to offset 0.
+    file_object1.open(path_spec=path_spec1)
+    self.assertEqual(file_object1.get_offset(), 0)
+    file_object1.close()
+
+    test_file = os.path.join(u'test_data', u'another_file')
+    path_spec2 = os_path_spec.OSPathSpec(location=test_file)
+    file_object2 = os_file_io.OSFile(resolver_context)
+    file_object2.open(path_spec=path_spec2)
+
+    # The first file-like object was evicted and closed.
+    self.assertIsNone(resolver_context.GetFileObject(path_spec1))
+    self.assertIsNone(file_object1._file_object)
+    with self.assertRaises(IOError):
+      file_object1.get_offset()
+
+    file_object2.close()
+
+    resolver_context.Empty()
+    with self.assertRaises(IOError):
+      file_object2.get_offset()
+
   def testCacheFileSystem(self):
     """Tests the cache file system object functionality."""
     resolver_context = context.Context()
@@ -66,9 +116,35 @@ class ContextTest(unittest.TestCase):
     resolver_context.ReleaseFileSystem(file_system)
     self.assertEqual(len(resolver_context._file_system_cache._values), 1)
 
+    # The dereferenced file system object remains cached.
     resolver_context.ReleaseFileSystem(file_system)
+    self.assertEqual(len(resolver_context._file_system_cache._values), 1)
+    self.assertEqual(
+        resolver_context.GetFileSystemReferenceCount(path_spec), 0)
+
+    self.assertTrue(resolver_context.EvictFileSystem(file_system))
     self.assertEqual(len(resolver_context._file_system_cache._values), 0)
 
+  def testSetMaximumBlockCacheSize(self):
+    """Tests the set maximum block cache size functionality."""
+    resolver_context = context.Context(maximum_block_cache_size=0)
+    self.assertIsNone(resolver_context.GetBlockCache())
+
+    resolver_context.SetMaximumBlockCacheSize(1024 * 1024)
+    block_cache = resolver_context.GetBlockCache()
+    self.assertIsNotNone(block_cache)
+    self.assertEqual(block_cache.maximum_size, 1024 * 1024)
+
+    block_cache.CacheBlock(u'test', 0, b'A' * block_cache.block_size)
+    resolver_context.Empty()
+    self.assertEqual(block_cache.size, 0)
+
+    resolver_context.SetMaximumBlockCacheSize(0)
+    self.assertIsNone(resolver_context.GetBlockCache())
+
+    with self.assertRaises(ValueError):
+      resolver_context.SetMaximumBlockCacheSize(-1)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,28 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the TSK unallocated space resolver helper implementation."""
+
+import unittest
+
+from dfvfs.resolver import tsk_unallocated_resolver_helper
+from tests.resolver import test_lib
+
+
+class TSKUnallocatedResolverHelperTest(test_lib.ResolverHelperTestCase):
+  """Tests for the TSK unallocated space resolver helper implementation."""
+
+  def testNewFileObject(self):
+    """Tests the NewFileObject function."""
+    resolver_helper_object = (
+        tsk_unallocated_resolver_helper.TSKUnallocatedResolverHelper())
+    self._TestNewFileObject(resolver_helper_object)
+
+  def testNewFileSystem(self):
+    """Tests the NewFileSystem function."""
+    resolver_helper_object = (
+        tsk_unallocated_resolver_helper.TSKUnallocatedResolverHelper())
+    self._TestNewFileSystemRaisesRuntimeError(resolver_helper_object)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -348,6 +348,50 @@ class NTFSFileEntryTest(unittest.TestCase):
     self.assertIsNotNone(data_stream)
     self.assertEqual(data_stream.name, data_stream_name)
 
+  def testGetExtents(self):
+    """Tests the GetExtents function."""
+    test_location = u'\\$UpCase'
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=test_location, mft_entry=10, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_DATA)
+    self.assertEqual(extents[0].offset, 12288)
+    self.assertEqual(extents[0].size, 131072)
+
+    # The valid data size of the data stream is 0, hence the data is read
+    # as zero bytes.
+    test_location = (
+        u'\\System Volume Information\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=test_location, mft_entry=38, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_SPARSE)
+    self.assertEqual(extents[0].offset, 0)
+    self.assertEqual(extents[0].size, 65536)
+
+    extents = file_entry.GetExtents(data_stream_name=u'bogus')
+    self.assertEqual(extents, [])
+
+    # The data of the alternate data stream is resident.
+    test_location = u'\\$Extend\\$RmMetadata\\$Repair'
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=test_location, mft_entry=28, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents(data_stream_name=u'$Config')
+    self.assertEqual(extents, [])
+
   def testGetSecurityDescriptor(self):
     """Tests the GetSecurityDescriptor function."""
     test_location = (
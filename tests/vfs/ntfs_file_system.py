@@ -82,6 +82,39 @@ class NTFSFileSystemTest(unittest.TestCase):
 
     file_system.Close()
 
+  def testGetFileEntriesSequentially(self):
+    """Test the GetFileEntriesSequentially function."""
+    file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._ntfs_path_spec)
+
+    file_entries = list(file_system.GetFileEntriesSequentially())
+    self.assertEqual(len(file_entries), 30)
+
+    file_entry = file_entries[0]
+    self.assertEqual(file_entry.path_spec.location, u'\\')
+    self.assertEqual(file_entry.name, u'')
+
+    mft_entries = [
+        file_entry.path_spec.mft_entry for file_entry in file_entries[1:]]
+    self.assertEqual(mft_entries, sorted(mft_entries))
+
+    file_entry = file_entries[-1]
+    self.assertEqual(file_entry.path_spec.location, u'\\password.txt')
+    self.assertEqual(file_entry.path_spec.mft_attribute, 1)
+    self.assertEqual(file_entry.path_spec.mft_entry, 41)
+    self.assertEqual(file_entry.name, u'password.txt')
+
+    # The short (DOS) name is ignored in favor of the long name.
+    locations = [file_entry.path_spec.location for file_entry in file_entries]
+    self.assertIn(
+        u'\\$Extend\\$RmMetadata\\$TxfLog\\'
+        u'$TxfLogContainer00000000000000000001', locations)
+    self.assertNotIn(u'\\$Extend\\$RmMetadata\\$TxfLog\\$TXFLO~1', locations)
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
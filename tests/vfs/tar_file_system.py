@@ -66,6 +66,43 @@ class TARFileSystemTest(unittest.TestCase):
         location=u'/File System/Recordings', parent=test_file_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A partial path segment is not an implied directory.
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/File Sys', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_system.Close()
+
+  def testGetDirectoryEntryPaths(self):
+    """Tests the GetDirectoryEntryPaths function."""
+    test_file = os.path.join(u'test_data', u'missing_directory_entries.tar')
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/', parent=test_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    self.assertEqual(
+        file_system.GetDirectoryEntryPaths(u''),
+        [u'File System', u'Non Missing Directory Entry'])
+    self.assertEqual(
+        file_system.GetDirectoryEntryPaths(u'File System'),
+        [u'File System/Recordings'])
+    self.assertEqual(
+        file_system.GetDirectoryEntryPaths(u'Non Missing Directory Entry'),
+        [u'Non Missing Directory Entry/test_file.txt'])
+    self.assertEqual(file_system.GetDirectoryEntryPaths(u'bogus'), [])
+
+    tar_info = file_system.GetTARInfoByPath(
+        u'Non Missing Directory Entry/test_file.txt')
+    self.assertIsNotNone(tar_info)
+
+    # Implied directories have no TAR info.
+    tar_info = file_system.GetTARInfoByPath(u'File System')
+    self.assertIsNone(tar_info)
+
     file_system.Close()
 
   def testGetFileEntryByPathSpec(self):
@@ -5,6 +5,7 @@
 import os
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
@@ -177,6 +178,19 @@ class TSKFileEntryTestExt2(unittest.TestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
+    # The sub file entries reuse the TSK files that were opened when
+    # the directory was read.
+    root_inode = self._file_system.GetRootInode()
+    for sub_file_entry in file_entry.sub_file_entries:
+      self.assertIsNotNone(sub_file_entry._tsk_file)
+      self.assertEqual(sub_file_entry._parent_inode, root_inode)
+
+      if sub_file_entry.name == u'passwords.txt':
+        stat_object = sub_file_entry.GetStat()
+        self.assertEqual(stat_object.size, 116)
+        self.assertEqual(
+            stat_object.ino, getattr(sub_file_entry.path_spec, u'inode', None))
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     test_location = u'/a_directory/another_file'
@@ -219,6 +233,33 @@ class TSKFileEntryTestExt2(unittest.TestCase):
     data_stream = file_entry.GetDataStream(data_stream_name)
     self.assertIsNotNone(data_stream)
 
+  def testGetExtents(self):
+    """Tests the GetExtents function."""
+    test_location = u'/passwords.txt'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=15, location=test_location, parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_DATA)
+    self.assertEqual(extents[0].offset, 22528)
+    self.assertEqual(extents[0].size, 116)
+
+    extents = file_entry.GetExtents(data_stream_name=u'bogus')
+    self.assertEqual(extents, [])
+
+    test_location = u'/a_directory'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=12, location=test_location, parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(extents, [])
+
 
 class TSKFileEntryTestHFS(unittest.TestCase):
   """The unit test for the SleuthKit (TSK) file entry object on HFS."""
@@ -358,6 +399,32 @@ class TSKFileEntryTestNTFS(unittest.TestCase):
     self.assertIsNotNone(data_stream)
     self.assertEqual(data_stream.name, data_stream_name)
 
+  def testGetExtents(self):
+    """Tests the GetExtents function."""
+    test_location = (
+        u'/System Volume Information/{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=38, location=test_location, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_DATA)
+    self.assertEqual(extents[0].offset, 115539968)
+    self.assertEqual(extents[0].size, 65536)
+
+    # The data of the file is resident.
+    test_location = u'/password.txt'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=41, location=test_location, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(extents, [])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -6,11 +6,35 @@ import os
 import unittest
 
 from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import tsk_file_system
 
 
+class RecordingTSKFileSystemInfo(object):
+  """Class that records the inodes opened by a SleuthKit file system info."""
+
+  def __init__(self, tsk_file_system):
+    """Initializes the file system info.
+
+    Args:
+      tsk_file_system (pytsk3.FS_Info): SleuthKit file system info.
+    """
+    super(RecordingTSKFileSystemInfo, self).__init__()
+    self._tsk_file_system = tsk_file_system
+    self.opened_inodes = []
+
+  def __getattr__(self, name):
+    """Retrieves an attribute of the SleuthKit file system info."""
+    return getattr(self._tsk_file_system, name)
+
+  def open_meta(self, inode=None):
+    """Opens a SleuthKit file by inode."""
+    self.opened_inodes.append(inode)
+    return self._tsk_file_system.open_meta(inode=inode)
+
+
 class TSKFileSystemTest(unittest.TestCase):
   """The unit test for the SleuthKit (TSK) file system object."""
 
@@ -78,6 +102,65 @@ class TSKFileSystemTest(unittest.TestCase):
 
     file_system.Close()
 
+  def testGetFileEntriesSequentially(self):
+    """Test the GetFileEntriesSequentially function."""
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_path_spec)
+
+    expected_file_entries = [
+        (2, u'/'),
+        (11, u'/lost+found'),
+        (12, u'/a_directory'),
+        (13, u'/a_link'),
+        (14, u'/a_directory/a_file'),
+        (15, u'/passwords.txt'),
+        (16, u'/a_directory/another_file'),
+        (17, u'/$OrphanFiles')]
+
+    # pylint: disable=protected-access
+    test_tsk_file_system = RecordingTSKFileSystemInfo(file_system._tsk_file_system)
+    file_system._tsk_file_system = test_tsk_file_system
+
+    file_entries = [
+        (file_entry.path_spec.inode, file_entry.path_spec.location)
+        for file_entry in file_system.GetFileEntriesSequentially()]
+    self.assertEqual(file_entries, expected_file_entries)
+
+    # Every inode is read only once.
+    self.assertEqual(test_tsk_file_system.opened_inodes, [
+        1, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17])
+
+    file_system._tsk_file_system = test_tsk_file_system._tsk_file_system
+    file_system.Close()
+
+    # The unallocated inode of a deleted symbolic link is an orphan file.
+    test_file = os.path.join(u'test_data', u'image.qcow2')
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+    path_spec = tsk_path_spec.TSKPathSpec(location=u'/', parent=path_spec)
+
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    file_system.Open(path_spec)
+
+    expected_file_entries = [
+        (2, u'/'),
+        (11, u'/lost+found'),
+        (12, u'/a_directory'),
+        (13, u'/$OrphanFiles/OrphanFile-13'),
+        (14, u'/a_directory/a_file'),
+        (15, u'/passwords.txt'),
+        (16, u'/a_directory/another_file'),
+        (17, u'/$OrphanFiles')]
+
+    file_entries = [
+        (file_entry.path_spec.inode, file_entry.path_spec.location)
+        for file_entry in file_system.GetFileEntriesSequentially()]
+    self.assertEqual(file_entries, expected_file_entries)
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
@@ -3,7 +3,10 @@
 """Tests for the file system implementation using the zipfile."""
 
 import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from dfvfs.path import os_path_spec
 from dfvfs.path import zip_path_spec
@@ -70,6 +73,47 @@ class ZipFileSystemTest(unittest.TestCase):
 
     file_system.Close()
 
+  def testGetDirectoryEntryPaths(self):
+    """Tests the GetDirectoryEntryPaths function."""
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      test_file = os.path.join(temporary_directory, u'test.zip')
+      with zipfile.ZipFile(test_file, 'w') as zip_file:
+        zip_file.writestr(u'a_directory/', b'')
+        zip_file.writestr(u'a_directory/a_file', b'test')
+        zip_file.writestr(u'a_directory/sub_directory/', b'')
+        zip_file.writestr(u'a_directory/sub_directory/another_file', b'test')
+        zip_file.writestr(u'passwords.txt', b'test')
+
+      test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=u'/', parent=test_file_path_spec)
+
+      file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+      file_system.Open(path_spec)
+
+      self.assertEqual(
+          file_system.GetDirectoryEntryPaths(u''),
+          [u'a_directory/', u'passwords.txt'])
+      self.assertEqual(
+          file_system.GetDirectoryEntryPaths(u'a_directory/'),
+          [u'a_directory/a_file', u'a_directory/sub_directory/'])
+      self.assertEqual(
+          file_system.GetDirectoryEntryPaths(u'a_directory'),
+          [u'a_directory/a_file', u'a_directory/sub_directory/'])
+      self.assertEqual(file_system.GetDirectoryEntryPaths(u'bogus'), [])
+
+      zip_info = file_system.GetZipInfoByPath(u'a_directory/a_file')
+      self.assertIsNotNone(zip_info)
+      self.assertEqual(zip_info.file_size, 4)
+
+      self.assertIsNone(file_system.GetZipInfoByPath(u'bogus'))
+
+      file_system.Close()
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = zip_file_system.ZipFileSystem(self._resolver_context)